@@ -12,6 +12,7 @@
 # -----------------------------------------------------------------------------
 
 from datetime import datetime  # Used to get the current system time
+import time                    # perf_counter() for per-path latency
 
 # 🧠 Gemini-based AI agent provided by Google's ADK
 from google.adk.agents.llm_agent import LlmAgent
@@ -27,6 +28,9 @@ from google.adk.runners import Runner
 # 🧾 Gemini-compatible types for formatting input/output messages
 from google.genai import types
 
+# ⚡ Local (no-LLM) answers for simple time/date/time-zone questions
+from agents.tell_time_agent.time_intent import answer_locally
+
 # 🔐 Load environment variables (like API keys) from a `.env` file
 from dotenv import load_dotenv
 load_dotenv()  # Load variables like GOOGLE_API_KEY into the system
@@ -59,6 +63,9 @@ class TellTimeAgent:
             memory_service=InMemoryMemoryService(),      # Optional: remembers past messages
         )
 
+        # ⏱️ How queries were answered ("local" fast path or "llm"): count and total seconds
+        self.path_stats = {path: {"count": 0, "seconds": 0.0} for path in ("local", "llm")}
+
     def _build_agent(self) -> LlmAgent:
         """
         ⚙️ Creates and returns a Gemini agent with basic settings.
@@ -76,6 +83,33 @@ class TellTimeAgent:
     async def invoke(self, query: str, session_id: str) -> str:
         """
         📥 Handle a user query and return a response string.
+        Simple time/date/time-zone questions are answered locally;
+        everything else goes to Gemini.
+
+        Args:
+            query (str): What the user said (e.g., "what time is it?")
+            session_id (str): Helps group messages into a session
+
+        Returns:
+            str: Agent's reply (usually the current time)
+        """
+        started = time.perf_counter()
+
+        # ⚡ "What time is it in Tokyo?" needs a clock, not a model
+        reply = answer_locally(query)
+        path = "local"
+        if reply is None:
+            reply = await self._invoke_llm(query, session_id)
+            path = "llm"
+
+        stats = self.path_stats[path]
+        stats["count"] += 1
+        stats["seconds"] += time.perf_counter() - started
+        return reply
+
+    async def _invoke_llm(self, query: str, session_id: str) -> str:
+        """
+        🧠 Free-form queries: run the Gemini agent through the ADK Runner.
         Note - function updated 28 May 2025
         Summary of changes:
         1. Agent's invoke method is made async
@@ -145,5 +179,6 @@ class TellTimeAgent:
         """
         yield {
             "is_task_complete": True,
-            "content": f"The current time is: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+            "content": answer_locally(query)
+                       or f"The current time is: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
         }
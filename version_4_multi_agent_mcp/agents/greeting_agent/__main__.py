@@ -12,6 +12,7 @@ import logging                        # Standard Python module for logging
 import click                          # Library for building command-line interfaces
 
 from server.server import A2AServer    # Our generic A2A server implementation
+from server.push_notifications import PushNotificationSender  # Delivers webhook updates
 from models.agent import (
     AgentCard,                        # Pydantic model for describing an agent
     AgentCapabilities,                # Describes streaming & other features
@@ -60,8 +61,9 @@ def main(host: str, port: int):
     # 1) Define the agent’s capabilities
     # -------------------------------------------------------------------------
     # Here we specify that this agent does NOT support streaming responses.
-    # It will always send a single, complete reply.
-    capabilities = AgentCapabilities(streaming=False)
+    # It will always send a single, complete reply, optionally also POSTed
+    # to a client's webhook (push notifications).
+    capabilities = AgentCapabilities(streaming=False, pushNotifications=True)
 
     # -------------------------------------------------------------------------
     # 2) Define the agent’s skill metadata
@@ -105,7 +107,7 @@ def main(host: str, port: int):
     # GreetingAgent contains the orchestration logic (LLM + tools).
     greeting_agent = GreetingAgent()
     # GreetingTaskManager adapts that logic to the A2A JSON-RPC protocol.
-    task_manager = GreetingTaskManager(agent=greeting_agent)
+    task_manager = GreetingTaskManager(agent=greeting_agent, push_sender=PushNotificationSender())
 
     # -------------------------------------------------------------------------
     # 5) Create and start the A2A server
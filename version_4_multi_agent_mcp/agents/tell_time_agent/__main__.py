@@ -18,6 +18,7 @@
 
 # Your custom A2A server class
 from server.server import A2AServer
+from server.push_notifications import PushNotificationSender  # Delivers webhook updates
 
 # Models for describing agent capabilities and metadata
 from models.agent import AgentCard, AgentCapabilities, AgentSkill
@@ -52,8 +53,9 @@ def main(host, port):
     You can run it via: `python -m agents.google_adk --host 0.0.0.0 --port 12345`
     """
 
-    # Define what this agent can do – in this case, it does NOT support streaming
-    capabilities = AgentCapabilities(streaming=False)
+    # Define what this agent can do – it streams replies via tasks/sendSubscribe
+    # and can POST task updates to a client's webhook (push notifications)
+    capabilities = AgentCapabilities(streaming=True, pushNotifications=True)
 
     # Define the skill this agent offers (used in directories and UIs)
     skill = AgentSkill(
@@ -84,7 +86,7 @@ def main(host, port):
         host=host,
         port=port,
         agent_card=agent_card,
-        task_manager=AgentTaskManager(agent=TellTimeAgent())
+        task_manager=AgentTaskManager(agent=TellTimeAgent(), push_sender=PushNotificationSender())
     )
 
     # Start listening for tasks
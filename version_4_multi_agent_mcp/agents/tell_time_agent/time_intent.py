@@ -0,0 +1,124 @@
+# =============================================================================
+# agents/tell_time_agent/time_intent.py
+# =============================================================================
+# 🎯 Purpose:
+# Answers simple time / date / day / time-zone questions locally from the
+# system clock and the IANA time-zone database (zoneinfo), in microseconds,
+# instead of a Gemini round-trip (which has no clock and can be wrong).
+#
+# Only short, unambiguous questions are matched (see answer_locally()), e.g.:
+#   "what time is it?"            "time in Tokyo"
+#   "whats the time"              "what day is it in New York?"
+#   "what's the date today"       "current time in Etc/GMT+5"
+#   "do you know what time it is" "what is the timezone in Paris"
+# Anything else (or a place we can't resolve) returns None, and the agent
+# falls back to the LLM.
+# =============================================================================
+
+import re                                       # Intent patterns
+from datetime import datetime, tzinfo           # Current time, in a given zone
+from functools import lru_cache                 # Build the city index once
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError, available_timezones
+
+# Whole-query pattern: optional politeness, the thing asked for, an optional
+# place ("in Tokyo") and optional fillers ("now", "today"). A place may be
+# any IANA zone name ("Etc/GMT+5", "America/Port-au-Prince"), a city or an
+# abbreviation.
+_QUERY = re.compile(
+    r"(?:(?:hey|hi|hello|please|so),? )*"
+    r"(?:(?:can|could|would) you (?:please )?)?(?:(?:tell|give|show) me |do you know )?"
+    r"(?:(?:what|which)(?:'s| is|s)? )?(?:the )?"
+    r"(?:today'?s |current |local |exact )?"
+    r"(?P<kind>time ?zone|time|date|day)"
+    r"(?: (?:is it|it is|now|right now|today|is today|of the week))*"
+    r"(?: (?:in|at|for) (?P<place>[a-z][a-z0-9 .'/_+-]*?))?"
+    r"(?: (?:right )?now| today| please)*"
+)
+
+# Common abbreviations and names that aren't IANA zone names themselves
+_ALIASES = {
+    "utc": "UTC", "gmt": "Etc/GMT", "z": "UTC",
+    "pst": "America/Los_Angeles", "pdt": "America/Los_Angeles", "pacific": "America/Los_Angeles",
+    "mst": "America/Denver", "mdt": "America/Denver", "mountain": "America/Denver",
+    "cst": "America/Chicago", "cdt": "America/Chicago", "central": "America/Chicago",
+    "est": "America/New_York", "edt": "America/New_York", "eastern": "America/New_York",
+    "bst": "Europe/London", "cet": "Europe/Paris", "cest": "Europe/Paris",
+    "ist": "Asia/Kolkata", "india": "Asia/Kolkata", "jst": "Asia/Tokyo", "aest": "Australia/Sydney",
+    "new york city": "America/New_York", "nyc": "America/New_York", "la": "America/Los_Angeles",
+    "san francisco": "America/Los_Angeles", "beijing": "Asia/Shanghai", "delhi": "Asia/Kolkata",
+    "new delhi": "Asia/Kolkata", "mumbai": "Asia/Kolkata", "bangalore": "Asia/Kolkata",
+}
+
+
+@lru_cache(maxsize=1)
+def _zone_index() -> dict[str, str]:
+    """Lower-case zone names and city parts ("new york") → IANA zone name."""
+    index = {}
+    for name in available_timezones():
+        index[name.lower()] = name
+        city = name.rsplit("/", 1)[-1].replace("_", " ").lower()
+        index.setdefault(city, name)
+    return index
+
+
+def resolve_zone(place: str) -> tzinfo | None:
+    """Time zone for a place / zone name / abbreviation, or None if unknown."""
+    place = place.strip(" .").lower()
+    if place.startswith("the "):
+        place = place[4:]
+    name = _ALIASES.get(place) or _zone_index().get(place) or _zone_index().get(place.replace(" ", "_"))
+    if name is None:
+        return None
+    try:
+        return ZoneInfo(name)
+    except ZoneInfoNotFoundError:
+        return None
+
+
+def answer_locally(query: str, now: datetime | None = None) -> str | None:
+    """
+    Answer a simple time/date/day/time-zone question, or return None if
+    the query isn't one (the caller then asks the LLM).
+
+    Covered phrasings (case, "?"/"!" and extra spaces don't matter):
+    - what / what's / whats / what is / which + [the] [current | local |
+      exact | today's] time / date / day / time zone, e.g. "whats the time",
+      "what's today's date", "which day is it"
+    - the same after "can/could/would you [please]", "tell/give/show me",
+      "do you know" or a greeting ("hi", "please", ...): "tell me the time",
+      "do you know what time it is"
+    - followed by "is it" / "it is" / "now" / "right now" / "today" /
+      "of the week" and an optional "in/at/for <place>", where the place is
+      an IANA zone name ("Etc/GMT+5", "Europe/Paris"), a city from the zone
+      database ("Tokyo", "New York") or a common abbreviation ("PST", "UTC")
+
+    Args:
+        query (str): The user's message.
+        now (datetime | None): Aware "current" time, for tests. Default: the clock.
+    """
+    text = query.lower().replace("\u2019", "'").replace("?", " ").replace("!", " ")
+    text = " ".join(text.split()).strip(" .")
+    match = _QUERY.fullmatch(text)
+    if match is None:
+        return None
+
+    place = match.group("place")
+    if place:
+        zone = resolve_zone(place)
+        if zone is None:
+            return None                         # Unknown place: let the LLM deal with it
+        now = (now or datetime.now(zone)).astimezone(zone)
+        where = f" in {getattr(zone, 'key', place)}"
+    else:
+        now = (now or datetime.now()).astimezone()   # Server's local time, like stream()
+        where = ""
+
+    kind = match.group("kind").replace(" ", "")
+    if kind == "time":
+        return f"The current time{where} is {now:%Y-%m-%d %H:%M:%S} ({now:%Z})."
+    if kind == "date":
+        return f"Today's date{where} is {now:%Y-%m-%d} ({now:%A})."
+    if kind == "day":
+        return f"Today{where} is {now:%A}, {now:%Y-%m-%d}."
+    name = getattr(now.tzinfo, "key", None) or now.strftime("%Z")
+    return f"The time zone {f'for {place.title()}' if place else 'here'} is {name} (UTC{now:%z})."
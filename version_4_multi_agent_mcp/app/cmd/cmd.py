@@ -10,6 +10,7 @@
 #
 # This version supports:
 # - basic task sending via A2AClient
+# - optional streaming of replies (tasks/sendSubscribe)
 # - session reuse
 # - optional task history printing
 # =============================================================================
@@ -22,7 +23,7 @@ from uuid import uuid4            # Used to generate unique task and session IDs
 from client.client import A2AClient
 
 # Import the Task model so we can handle and parse responses from the agent
-from models.task import Task
+from models.task import Task, TaskArtifactUpdateEvent
 
 
 # -----------------------------------------------------------------------------
@@ -40,7 +41,10 @@ from models.task import Task
 @click.option("--history", is_flag=True, help="Print full task history after receiving a response")
 # ^ This defines a --history flag (boolean). If passed, full conversation history is shown.
 
-async def cli(agent: str, session: str, history: bool):
+@click.option("--stream", is_flag=True, help="Stream the reply via tasks/sendSubscribe")
+# ^ This defines a --stream flag (boolean). If passed, updates are printed as they arrive.
+
+async def cli(agent: str, session: str, history: bool, stream: bool):
     """
     CLI to send user messages to an A2A agent and display the response.
 
@@ -48,6 +52,7 @@ async def cli(agent: str, session: str, history: bool):
         agent (str): The base URL of the A2A agent server (e.g., http://localhost:10002)
         session (str): Either a string session ID or 0 to generate one
         history (bool): If true, prints the full task history
+        stream (bool): If true, prints streamed updates as they arrive
     """
 
     # Initialize the client by providing the full POST endpoint for sending tasks
@@ -69,6 +74,7 @@ async def cli(agent: str, session: str, history: bool):
         payload = {
             "id": uuid4().hex,  # Generate a new unique task ID for this message
             "sessionId": session_id,  # Reuse or create session ID
+            "historyLength": None if history else 1,  # Just the reply unless --history
             "message": {
                 "role": "user",  # The message is from the user
                 "parts": [{"type": "text", "text": prompt}]  # Wrap user input in a text part
@@ -76,11 +82,24 @@ async def cli(agent: str, session: str, history: bool):
         }
 
         try:
+            if stream:
+                # Print each streamed event (progress, reply chunks, final state)
+                async for event in client.send_task_streaming(payload):
+                    if event.error:
+                        print(f"\n❌ Agent error: {event.error.message}")
+                    elif isinstance(event.result, TaskArtifactUpdateEvent):
+                        print("\nAgent says:", "".join(p.text for p in event.result.artifact.parts))
+                    elif event.result.status.message:
+                        print(f"\n[{event.result.status.state}]", event.result.status.message.parts[0].text)
+                    else:
+                        print(f"\n[{event.result.status.state}]")
+                continue
+
             # Send the task to the agent and get a structured Task response
             task: Task = await client.send_task(payload)
 
-            # Check if the agent responded (expecting at least 2 messages: user + agent)
-            if task.history and len(task.history) > 1:
+            # Check if the agent responded (the last message should be the agent's)
+            if task.history and task.history[-1].role == "agent":
                 reply = task.history[-1]  # Last message is usually from the agent
                 print("\nAgent says:", reply.parts[0].text)  # Print agent's text reply
             else:
@@ -98,6 +117,9 @@ async def cli(agent: str, session: str, history: bool):
             # Catch and print any errors (e.g., server not running, invalid response)
             print(f"\n❌ Error while sending task: {e}")
 
+    # Close the client's pooled HTTP connections before exiting
+    await client.aclose()
+
 
 # -----------------------------------------------------------------------------
 # Entrypoint: This ensures the CLI only runs when executing `python cmd.py`
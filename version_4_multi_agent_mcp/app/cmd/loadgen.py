@@ -0,0 +1,119 @@
+# =============================================================================
+# loadgen.py
+# =============================================================================
+# Purpose:
+# Load generator for a running agent graph. It drives N concurrent
+# sessions, each sending tasks one after another (like a user waiting for
+# each reply), and reports throughput and p50/p95/p99 latency.
+#
+# Start the agents with the offline fake model so no network or API quota
+# is needed (see utilities/llm/fake_llm.py), e.g.:
+#
+#   A2A_LLM_BACKEND=fake uv run python3 -m agents.tell_time_agent
+#   uv run python3 -m app.cmd.loadgen --agent http://localhost:10000 --sessions 50 --requests 20
+#
+# With --stream, tasks go through tasks/sendSubscribe and the time to the
+# first event is reported as well.
+#
+# The default message is one TellTimeAgent's local fast path (time_intent.py)
+# doesn't answer, so every task goes through the model. Pass e.g.
+# --message "What time is it?" to measure the no-LLM path instead.
+# =============================================================================
+
+import asyncclick as click        # Same CLI library as cmd.py
+import asyncio                    # Runs the concurrent sessions
+import time                       # perf_counter for latencies and throughput
+from collections import Counter   # Error counts by type
+from uuid import uuid4            # Unique task and session IDs
+
+# Import the A2AClient from your client module (it handles request/response logic)
+from client.client import A2AClient, A2AClientRPCError
+
+# Percentile summary shared with the benchmark scripts
+from benchmarks.stats import summarize
+
+# Not matched by TellTimeAgent's local time answers, so it exercises the LLM (or the fake)
+DEFAULT_MESSAGE = "Tell me the current time as a short sentence"
+
+
+@click.command()
+@click.option("--agent", default="http://localhost:10000", help="Base URL of the A2A agent server")
+@click.option("--sessions", default=10, help="Concurrent sessions (simulated users)")
+@click.option("--requests", "requests_per_session", default=10, help="Tasks sent by each session, one at a time")
+@click.option(
+    "--message", default=DEFAULT_MESSAGE,
+    help="Text sent in every task (the default needs the LLM; \"What time is it?\" is answered locally)",
+)
+@click.option("--stream", is_flag=True, help="Use tasks/sendSubscribe and also report time to first event")
+@click.option("--warmup", default=1, help="Untimed tasks per session before measuring")
+async def cli(agent: str, sessions: int, requests_per_session: int, message: str, stream: bool, warmup: int):
+    """
+    Send `--requests` tasks from each of `--sessions` concurrent sessions
+    and print latency percentiles and throughput.
+    """
+    client = A2AClient(url=agent, timeout=300, max_connections=sessions, max_keepalive_connections=sessions)
+    latencies: list[float] = []
+    first_events: list[float] = []
+    errors: Counter = Counter()
+
+    async def send_one(session_id: str) -> float:
+        """Send one task; return the time to the first event (streaming) or reply."""
+        payload = {
+            "id": uuid4().hex,
+            "sessionId": session_id,
+            "historyLength": 1,                    # Only the reply, as a real client would ask
+            "message": {"role": "user", "parts": [{"type": "text", "text": message}]},
+        }
+        started = time.perf_counter()
+        if not stream:
+            await client.send_task(payload)
+            return time.perf_counter() - started
+
+        first = None
+        async for event in client.send_task_streaming(payload):
+            if first is None:
+                first = time.perf_counter() - started
+            if event.error:
+                raise A2AClientRPCError(event.error.model_dump())
+        return first if first is not None else time.perf_counter() - started
+
+    async def session() -> None:
+        session_id = uuid4().hex
+        for i in range(warmup + requests_per_session):
+            started = time.perf_counter()
+            try:
+                first = await send_one(session_id)
+            except Exception as e:
+                if i >= warmup:
+                    errors[type(e).__name__] += 1
+                continue
+            if i >= warmup:
+                latencies.append(time.perf_counter() - started)
+                first_events.append(first)
+
+    print(f"Running {sessions} sessions x {requests_per_session} tasks against {agent}"
+          f"{' (streaming)' if stream else ''} ...")
+    started = time.perf_counter()
+    await asyncio.gather(*(session() for _ in range(sessions)))
+    elapsed = time.perf_counter() - started
+    await client.aclose()
+
+    done = len(latencies)
+    print(summarize("task latency", latencies))
+    if stream:
+        print(summarize("time to first event", first_events))
+    # Warmup tasks are part of the wall time, so count them in throughput too
+    total = done + sum(errors.values()) + sessions * warmup
+    print(f"{'throughput':<24} {total / elapsed:.1f} tasks/s over {elapsed:.2f}s "
+          f"({done} ok, {sum(errors.values())} failed)")
+    for name, count in errors.most_common():
+        print(f"{'  error':<24} {name}: {count}")
+
+
+# -----------------------------------------------------------------------------
+# Entrypoint: This ensures the CLI only runs when executing `python loadgen.py`
+# -----------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    # Run the async `cli()` function inside the event loop
+    asyncio.run(cli())
@@ -0,0 +1,104 @@
+# =============================================================================
+# benchmarks/serialization.py
+# =============================================================================
+# 🎯 Purpose:
+# Measures the CPU time A2AServer spends turning a request body into a model
+# and a response model into bytes, old path vs. the current one:
+#
+#   parse   old: json.loads → print(json.dumps(indent=2)) → validate_python
+#           new: A2ARequest.validate_json(raw bytes)
+#   respond old: model_dump → jsonable_encoder → json.dumps (JSONResponse)
+#           new: model_dump_json (one pass, bytes)
+#
+# The payload is a tasks/send round trip whose task carries `--history`
+# messages, like a long conversation.
+#
+# Usage:
+#   uv run python3 -m benchmarks.serialization --history 50 --iterations 2000
+# =============================================================================
+
+import asyncio                    # Runs the async click command
+import contextlib                 # redirect_stdout swallows the old debug print
+import io                         # Sink for that print
+import json                       # Old path: stdlib JSON
+import time                       # process_time measures CPU, not wall clock
+from uuid import uuid4
+
+import asyncclick as click        # Same CLI library as app/cmd/cmd.py
+
+from models.request import A2ARequest, SendTaskRequest, SendTaskResponse
+from models.task import Task, TaskStatus, TaskState, Message, TextPart
+from server.server import json_response
+
+
+def _build(history: int) -> tuple[bytes, SendTaskResponse]:
+    """A tasks/send request body and a response whose task has `history` messages."""
+    request = SendTaskRequest(params={
+        "id": uuid4().hex,
+        "sessionId": uuid4().hex,
+        "message": {"role": "user", "parts": [{"type": "text", "text": "What time is it?"}]},
+    })
+    messages = [
+        Message(role="user" if i % 2 == 0 else "agent",
+                parts=[TextPart(text=f"message {i} " + "lorem ipsum " * 20)])
+        for i in range(history)
+    ]
+    task = Task(id=request.params.id, status=TaskStatus(state=TaskState.COMPLETED), history=messages)
+    return request.model_dump_json().encode(), SendTaskResponse(id=request.id, result=task)
+
+
+def _cpu_per_call(fn, iterations: int) -> float:
+    """Average CPU seconds per call of fn()."""
+    start = time.process_time()
+    for _ in range(iterations):
+        fn()
+    return (time.process_time() - start) / iterations
+
+
+@click.command()
+@click.option("--history", default=50, help="Messages in the task history")
+@click.option("--iterations", default=2000, help="Calls per measurement")
+async def cli(history: int, iterations: int):
+    """Print per-request CPU for old vs. new parse and response paths."""
+    body, response = _build(history)
+
+    def old_parse():
+        data = json.loads(body)
+        print("\n🔍 Incoming JSON:", json.dumps(data, indent=2))
+        return A2ARequest.validate_python(data)
+
+    def new_parse():
+        return A2ARequest.validate_json(body)
+
+    try:
+        from fastapi.encoders import jsonable_encoder
+        from starlette.responses import JSONResponse
+
+        def old_respond():
+            return JSONResponse(content=jsonable_encoder(response.model_dump(exclude_none=True))).body
+    except ImportError:                       # fastapi is no longer needed by the server
+        old_respond = None
+
+    def new_respond():
+        return json_response(response).body
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        results = {
+            "parse (old)": _cpu_per_call(old_parse, iterations),
+            "parse (new)": _cpu_per_call(new_parse, iterations),
+            "respond (new)": _cpu_per_call(new_respond, iterations),
+        }
+        if old_respond is not None:
+            results["respond (old)"] = _cpu_per_call(old_respond, iterations)
+
+    print(f"history={history} messages, response={len(new_respond())} bytes, {iterations} iterations")
+    for name in ("parse (old)", "parse (new)", "respond (old)", "respond (new)"):
+        if name in results:
+            print(f"{name:<16} {results[name] * 1e6:10.1f} µs CPU/request")
+    if "respond (old)" in results:
+        saved = results["parse (old)"] + results["respond (old)"] - results["parse (new)"] - results["respond (new)"]
+        print(f"{'saved':<16} {saved * 1e6:10.1f} µs CPU/request")
+
+
+if __name__ == "__main__":
+    asyncio.run(cli())
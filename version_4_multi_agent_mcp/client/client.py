@@ -7,30 +7,50 @@
 #
 # It supports:
 # - Sending tasks and receiving responses
-# - Getting task status or history
-# - (Streaming and canceling are not supported in this simplified version)
+# - Getting task status or history, and polling a task until it finishes
+# - Reusing one pooled HTTP connection set (keep-alive) across calls
+# - Streaming task updates over SSE (tasks/sendSubscribe)
+# - Sending/getting many tasks in one HTTP request (JSON-RPC batches)
+# - Reporting load shedding (HTTP 429/503) as A2AClientBusyError + Retry-After
+# - Canceling a running task (tasks/cancel)
+# - Registering/reading a task's push-notification webhook
+# - Passing the current trace on (W3C traceparent header) to the agent
 # =============================================================================
 
 # -----------------------------------------------------------------------------
 # Imports
 # -----------------------------------------------------------------------------
 
-import json
-from uuid import uuid4                                 # Used to encode/decode JSON data
+import json                                 # Used to encode/decode JSON data
+import logging                              # Optional debug logging of outgoing requests
+import time                                 # Deadline tracking while polling
+import asyncio                              # asyncio.sleep between polls
+from uuid import uuid4                      # Unique JSON-RPC request IDs
 import httpx                                # Async HTTP client for making web requests
-from httpx_sse import connect_sse           # SSE client extension for httpx (not used currently)
-from typing import Any                      # Type hints for flexible input/output
+from httpx_sse import aconnect_sse          # SSE client extension for httpx (used for streaming)
+from typing import Any, AsyncIterable       # Type hints for flexible input/output
+from pydantic import ValidationError        # Raised when a streamed event can't be parsed
 
 # Import supported request types
-from models.request import SendTaskRequest, GetTaskRequest  # Removed CancelTaskRequest
+from models.request import SendTaskRequest, GetTaskRequest, CancelTaskRequest
+from models.request import SetTaskPushNotificationRequest, GetTaskPushNotificationRequest
+from models.request import SendTaskStreamingRequest, SendTaskStreamingResponse
 
 # Base request format for JSON-RPC 2.0
 from models.json_rpc import JSONRPCRequest
 
 # Models for task results and agent identity
-from models.task import Task, TaskSendParams
+from models.task import Task, TaskSendParams, TaskState, TaskPushNotificationConfig
 from models.agent import AgentCard
 
+# Adds the current trace's `traceparent` header to outgoing requests
+from server.tracing import inject_headers
+
+logger = logging.getLogger(__name__)
+
+# Requests are serialized once, straight to JSON bytes
+JSON_HEADERS = {"Content-Type": "application/json"}
+
 
 # -----------------------------------------------------------------------------
 # Custom Error Classes
@@ -44,16 +64,83 @@ class A2AClientJSONError(Exception):
     """Raised when the response is not valid JSON"""
     pass
 
+class A2AClientRPCError(Exception):
+    """Raised when the server answers with a JSON-RPC error object"""
+    pass
+
+class A2AClientBusyError(A2AClientHTTPError):
+    """Raised when the agent sheds the request (HTTP 429/503); see `retry_after`"""
+    def __init__(self, status_code: int, message: str, retry_after: float = 1.0):
+        super().__init__(status_code, message)
+        self.status_code = status_code
+        self.retry_after = retry_after
+
+
+# HTTP statuses an overloaded agent answers with (plus a Retry-After header)
+BUSY_STATUS_CODES = {429, 503}
+
+
+def _http_error(e: httpx.HTTPStatusError) -> A2AClientHTTPError:
+    """Map an HTTP error to A2AClientBusyError (load shed) or A2AClientHTTPError."""
+    status = e.response.status_code
+    if status in BUSY_STATUS_CODES:
+        try:
+            retry_after = float(e.response.headers.get("retry-after", 1))
+        except ValueError:
+            retry_after = 1.0                   # HTTP-date form: just wait a second
+        return A2AClientBusyError(status, str(e), retry_after)
+    return A2AClientHTTPError(status, str(e))
+
+
+def _rpc_error_body(response: httpx.Response) -> dict[str, Any] | None:
+    """The JSON-RPC error object sent with an HTTP error status, if there is one."""
+    try:
+        body = response.json()
+    except json.JSONDecodeError:
+        return None
+    if isinstance(body, dict) and isinstance(body.get("error"), dict):
+        return body
+    return None
+
+
+# States after which a task will not change any more (stop polling)
+FINAL_STATES = {
+    TaskState.COMPLETED,
+    TaskState.CANCELED,
+    TaskState.FAILED,
+    TaskState.INPUT_REQUIRED,
+}
+
 
 # -----------------------------------------------------------------------------
 # A2AClient: Main interface for talking to an A2A agent
 # -----------------------------------------------------------------------------
 
 class A2AClient:
-    def __init__(self, agent_card: AgentCard = None, url: str = None):
+    def __init__(
+        self,
+        agent_card: AgentCard = None,
+        url: str = None,
+        timeout: float = 60,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 30.0,
+        http2: bool = False
+    ):
         """
         Initializes the client using either an agent card or a direct URL.
         One of the two must be provided.
+
+        The client keeps a single pooled httpx.AsyncClient so repeated calls
+        reuse warm (keep-alive) connections instead of reconnecting each time.
+        Close it with `await client.aclose()` or use `async with A2AClient(...)`.
+
+        Args:
+            timeout: Seconds to wait for a JSON-RPC response
+            max_connections: Upper bound on open connections to the agent
+            max_keepalive_connections: Idle connections kept around for reuse
+            keepalive_expiry: Seconds an idle connection stays in the pool
+            http2: Opt in to HTTP/2 (requires the `h2` package)
         """
         if agent_card:
             self.url = agent_card.url
@@ -62,6 +149,43 @@ class A2AClient:
         else:
             raise ValueError("Must provide either agent_card or url")
 
+        self.timeout = timeout
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry
+        )
+        self.http2 = http2
+
+        # Created lazily on first use so it binds to the running event loop
+        self._client: httpx.AsyncClient | None = None
+
+
+    # -------------------------------------------------------------------------
+    # Lifecycle: shared connection pool
+    # -------------------------------------------------------------------------
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the pooled httpx client, creating it on first use."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                limits=self.limits,
+                http2=self.http2,
+                timeout=self.timeout
+            )
+        return self._client
+
+    async def aclose(self):
+        """Close the pooled connections. Safe to call more than once."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def __aenter__(self) -> "A2AClient":
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
 
     # -------------------------------------------------------------------------
     # send_task: Send a new task to the agent
@@ -73,11 +197,45 @@ class A2AClient:
             params=TaskSendParams(**payload)  # ✅ Proper model wrapping
         )
 
-        print("\n📤 Sending JSON-RPC request:")
-        print(json.dumps(request.model_dump(), indent=2))
-
         response = await self._send_request(request)
-        return Task(**response["result"])  # ✅ Extract just the 'result' field
+        return Task(**self._result(response))  # ✅ Extract just the 'result' field
+
+
+
+    # -------------------------------------------------------------------------
+    # send_task_streaming: Send a task and receive its updates as they happen
+    # -------------------------------------------------------------------------
+    async def send_task_streaming(
+        self, payload: dict[str, Any]
+    ) -> AsyncIterable[SendTaskStreamingResponse]:
+        """
+        Sends a "tasks/sendSubscribe" request and yields each Server-Sent
+        Event as a SendTaskStreamingResponse (status or artifact update).
+        """
+        request = SendTaskStreamingRequest(
+            id=uuid4().hex,
+            params=TaskSendParams(**payload)
+        )
+        client = self._get_client()
+        try:
+            async with aconnect_sse(
+                client, "POST", self.url,
+                content=request.model_dump_json(exclude_none=True), headers=inject_headers(JSON_HEADERS)
+            ) as event_source:
+                event_source.response.raise_for_status()
+                # A rejected request comes back as one plain JSON-RPC response
+                if "text/event-stream" not in event_source.response.headers.get("content-type", ""):
+                    await event_source.response.aread()
+                    yield SendTaskStreamingResponse.model_validate_json(event_source.response.content)
+                    return
+                async for sse in event_source.aiter_sse():
+                    yield SendTaskStreamingResponse.model_validate_json(sse.data)
+
+        except httpx.HTTPStatusError as e:
+            raise _http_error(e) from e
+
+        except ValidationError as e:
+            raise A2AClientJSONError(str(e)) from e
 
 
 
@@ -85,9 +243,136 @@ class A2AClient:
     # get_task: Retrieve the status or history of a previously sent task
     # -------------------------------------------------------------------------
     async def get_task(self, payload: dict[str, Any]) -> Task:
-        request = GetTaskRequest(params=payload)
+        request = GetTaskRequest(id=uuid4().hex, params=payload)
+        response = await self._send_request(request)
+        return Task(**self._result(response))
+
+
+
+    # -------------------------------------------------------------------------
+    # cancel_task: Stop a task the agent is still working on
+    # -------------------------------------------------------------------------
+    async def cancel_task(self, payload: dict[str, Any]) -> Task:
+        """
+        Sends "tasks/cancel" (payload like {"id": task_id}) and returns the
+        task in its "canceled" state. Raises A2AClientRPCError if the task
+        is unknown or already finished.
+        """
+        request = CancelTaskRequest(id=uuid4().hex, params=payload)
         response = await self._send_request(request)
-        return Task(**response["result"])
+        return Task(**self._result(response))
+
+    # -------------------------------------------------------------------------
+    # Push notifications: register / read a task's webhook
+    # -------------------------------------------------------------------------
+    async def set_task_push_notification(self, payload: dict[str, Any]) -> TaskPushNotificationConfig:
+        """
+        Sends "tasks/pushNotification/set", payload like
+        {"id": task_id, "pushNotificationConfig": {"url": ..., "token": ...}}.
+        The server POSTs the task to that URL whenever it changes.
+        """
+        request = SetTaskPushNotificationRequest(id=uuid4().hex, params=payload)
+        response = await self._send_request(request)
+        return TaskPushNotificationConfig(**self._result(response))
+
+    async def get_task_push_notification(self, payload: dict[str, Any]) -> TaskPushNotificationConfig | None:
+        """Sends "tasks/pushNotification/get" (payload like {"id": task_id})."""
+        request = GetTaskPushNotificationRequest(id=uuid4().hex, params=payload)
+        response = await self._send_request(request)
+        if response.get("error"):
+            raise A2AClientRPCError(response["error"])
+        result = response.get("result")     # Omitted (null) when no webhook is set
+        return None if result is None else TaskPushNotificationConfig(**result)
+
+
+    # -------------------------------------------------------------------------
+    # wait_for_task: Poll tasks/get until the task reaches a final state
+    # -------------------------------------------------------------------------
+    async def wait_for_task(
+        self,
+        task_id: str,
+        timeout: float | None = None,
+        history_length: int | None = None,
+        min_interval: float = 0.05,
+        max_interval: float = 1.0,
+    ) -> Task:
+        """
+        Polls "tasks/get" for a task started in background mode.
+
+        The interval starts at `min_interval` and doubles up to `max_interval`,
+        so short tasks return quickly and long ones don't flood the server.
+
+        Raises:
+            TimeoutError: if `timeout` seconds pass before the task finishes.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        interval = min_interval
+        payload = {"id": task_id, "historyLength": history_length}
+
+        while True:
+            task = await self.get_task(payload)
+            if task.status.state in FINAL_STATES:
+                return task
+
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError(f"Task {task_id} still {task.status.state} after {timeout}s")
+                interval = min(interval, remaining)
+
+            await asyncio.sleep(interval)
+            interval = min(interval * 2, max_interval)
+
+
+
+    # -------------------------------------------------------------------------
+    # send_tasks_batch / get_tasks_batch: many tasks per HTTP round-trip
+    # -------------------------------------------------------------------------
+    async def send_tasks_batch(
+        self, payloads: list[dict[str, Any]], batch_size: int = 100
+    ) -> list[Task | A2AClientRPCError]:
+        """
+        Sends several tasks as JSON-RPC batches of up to `batch_size` each
+        (the server's default limit is 100).
+
+        Returns one entry per payload, in order: the Task, or an
+        A2AClientRPCError for items the server rejected (the other items
+        still succeed).
+        """
+        requests = [SendTaskRequest(id=uuid4().hex, params=TaskSendParams(**p)) for p in payloads]
+        return await self._send_batch(requests, batch_size)
+
+    async def get_tasks_batch(
+        self, payloads: list[dict[str, Any]], batch_size: int = 100
+    ) -> list[Task | A2AClientRPCError]:
+        """
+        Gets several tasks (each payload like get_task's) in JSON-RPC batches.
+        Unknown task IDs come back as A2AClientRPCError entries.
+        """
+        requests = [GetTaskRequest(id=uuid4().hex, params=p) for p in payloads]
+        return await self._send_batch(requests, batch_size)
+
+    async def _send_batch(
+        self, requests: list[JSONRPCRequest], batch_size: int
+    ) -> list[Task | A2AClientRPCError]:
+        results: list[Task | A2AClientRPCError] = []
+        for start in range(0, len(requests), batch_size):
+            chunk = requests[start:start + batch_size]
+            body = "[" + ",".join(r.model_dump_json(exclude_none=True) for r in chunk) + "]"
+            responses = await self._post(body)
+            if not isinstance(responses, list):          # Whole batch rejected
+                raise A2AClientRPCError(responses.get("error"))
+
+            by_id = {response.get("id"): response for response in responses}
+            for request in chunk:
+                response = by_id.get(request.id)
+                if response is None:
+                    results.append(A2AClientRPCError({"message": "No response for request", "id": request.id}))
+                elif response.get("error"):
+                    results.append(A2AClientRPCError(response["error"]))
+                else:
+                    results.append(Task(**response["result"]))
+        return results
 
 
 
@@ -95,18 +380,33 @@ class A2AClient:
     # _send_request: Internal helper to send a JSON-RPC request
     # -------------------------------------------------------------------------
     async def _send_request(self, request: JSONRPCRequest) -> dict[str, Any]:
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.post(
-                    self.url,
-                    json=request.model_dump(),  # Convert Pydantic model to JSON
-                    timeout=60
-                )
-                response.raise_for_status()     # Raise error if status code is 4xx/5xx
-                return response.json()          # Return parsed response as a dict
-
-            except httpx.HTTPStatusError as e:
-                raise A2AClientHTTPError(e.response.status_code, str(e)) from e
-
-            except json.JSONDecodeError as e:
-                raise A2AClientJSONError(str(e)) from e
+        body = request.model_dump_json(exclude_none=True)   # Model → JSON in one pass
+        return await self._post(body)
+
+    async def _post(self, body: str) -> Any:
+        client = self._get_client()             # Reuse the pooled connections
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Sending JSON-RPC request: {body}")
+        try:
+            response = await client.post(self.url, content=body, headers=inject_headers(JSON_HEADERS))
+            if response.status_code == 400:
+                # A malformed request or rejected batch: the body is a JSON-RPC
+                # error, which callers turn into A2AClientRPCError
+                rpc_error = _rpc_error_body(response)
+                if rpc_error is not None:
+                    return rpc_error
+            response.raise_for_status()         # Raise error if status code is 4xx/5xx
+            return response.json()              # Parsed response (a list for a batch)
+
+        except httpx.HTTPStatusError as e:
+            raise _http_error(e) from e
+
+        except json.JSONDecodeError as e:
+            raise A2AClientJSONError(str(e)) from e
+
+    @staticmethod
+    def _result(response: dict[str, Any]) -> dict[str, Any]:
+        """Return the JSON-RPC `result`, or raise if the server sent an error."""
+        if response.get("error"):
+            raise A2AClientRPCError(response["error"])
+        return response["result"]
@@ -14,11 +14,15 @@
 # Included Models:
 # - SendTaskRequest
 # - GetTaskRequest
+# - SendTaskStreamingRequest
+# - CancelTaskRequest
+# - SetTaskPushNotificationRequest / GetTaskPushNotificationRequest
 # - A2ARequest (discriminated union)
 # - SendTaskResponse
 # - GetTaskResponse
-#
-# Note: CancelTaskRequest will be added in a future version if cancellation support is implemented.
+# - SendTaskStreamingResponse
+# - CancelTaskResponse
+# - SetTaskPushNotificationResponse / GetTaskPushNotificationResponse
 # =============================================================================
 
 # -----------------------------------------------------------------------------
@@ -34,7 +38,9 @@ from models.json_rpc import JSONRPCRequest, JSONRPCResponse
 
 # Task-related parameter and return models
 from models.task import Task, TaskSendParams
-from models.task import TaskQueryParams
+from models.task import TaskQueryParams, TaskIdParams
+from models.task import TaskPushNotificationConfig
+from models.task import TaskStatusUpdateEvent, TaskArtifactUpdateEvent
 
 
 # -----------------------------------------------------------------------------
@@ -55,6 +61,38 @@ class GetTaskRequest(JSONRPCRequest):
     params: TaskQueryParams                         # Task ID and optional history limit
 
 
+# -----------------------------------------------------------------------------
+# SendTaskStreamingRequest: Send a task and subscribe to its updates (SSE)
+# -----------------------------------------------------------------------------
+
+class SendTaskStreamingRequest(JSONRPCRequest):
+    method: Literal["tasks/sendSubscribe"] = "tasks/sendSubscribe"  # Exact method string required
+    params: TaskSendParams                                          # Task creation parameters
+
+
+# -----------------------------------------------------------------------------
+# CancelTaskRequest: Stop a task the agent is still working on
+# -----------------------------------------------------------------------------
+
+class CancelTaskRequest(JSONRPCRequest):
+    method: Literal["tasks/cancel"] = "tasks/cancel"  # Exact method string required
+    params: TaskIdParams                              # ID of the task to cancel
+
+
+# -----------------------------------------------------------------------------
+# Set/GetTaskPushNotificationRequest: Register or read a task's webhook
+# -----------------------------------------------------------------------------
+
+class SetTaskPushNotificationRequest(JSONRPCRequest):
+    method: Literal["tasks/pushNotification/set"] = "tasks/pushNotification/set"
+    params: TaskPushNotificationConfig              # Task ID and webhook settings
+
+
+class GetTaskPushNotificationRequest(JSONRPCRequest):
+    method: Literal["tasks/pushNotification/get"] = "tasks/pushNotification/get"
+    params: TaskIdParams                            # ID of the task
+
+
 # -----------------------------------------------------------------------------
 # A2ARequest: Discriminated union of supported request types
 # -----------------------------------------------------------------------------
@@ -65,7 +103,10 @@ A2ARequest = TypeAdapter(
         Union[
             SendTaskRequest,
             GetTaskRequest,
-            # CancelTaskRequest can be added here in future if implemented
+            SendTaskStreamingRequest,
+            CancelTaskRequest,
+            SetTaskPushNotificationRequest,
+            GetTaskPushNotificationRequest,
         ],
         Field(discriminator="method")
     ]
@@ -86,3 +127,31 @@ class SendTaskResponse(JSONRPCResponse):
 
 class GetTaskResponse(JSONRPCResponse):
     result: Task | None = None                      # The requested task, or None if not found
+
+
+# -----------------------------------------------------------------------------
+# SendTaskStreamingResponse: One SSE event of a "tasks/sendSubscribe" stream
+# -----------------------------------------------------------------------------
+
+class SendTaskStreamingResponse(JSONRPCResponse):
+    result: TaskStatusUpdateEvent | TaskArtifactUpdateEvent | None = None  # The streamed event
+
+
+# -----------------------------------------------------------------------------
+# CancelTaskResponse: Response model for a "tasks/cancel" request
+# -----------------------------------------------------------------------------
+
+class CancelTaskResponse(JSONRPCResponse):
+    result: Task | None = None                      # The task, now in the "canceled" state
+
+
+# -----------------------------------------------------------------------------
+# Set/GetTaskPushNotificationResponse: The task's webhook settings
+# -----------------------------------------------------------------------------
+
+class SetTaskPushNotificationResponse(JSONRPCResponse):
+    result: TaskPushNotificationConfig | None = None  # The settings now in effect
+
+
+class GetTaskPushNotificationResponse(JSONRPCResponse):
+    result: TaskPushNotificationConfig | None = None  # The task's webhook settings
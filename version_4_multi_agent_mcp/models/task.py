@@ -8,7 +8,10 @@
 # - What a task looks like (`Task`)
 # - The state of the task (`TaskStatus`, `TaskState`)
 # - The messages exchanged during a task (`Message`, `TextPart`)
+# - Outputs produced by a task (`Artifact`)
+# - Streaming events sent while a task runs (`TaskStatusUpdateEvent`, `TaskArtifactUpdateEvent`)
 # - Parameters used when sending, querying, or canceling tasks
+# - Webhook settings for push notifications (`PushNotificationConfig`)
 # =============================================================================
 
 # -----------------------------------------------------------------------------
@@ -51,21 +54,79 @@ class Message(BaseModel):
 
 class TaskStatus(BaseModel):
     state: str  # A string like "submitted", "working", etc. (defined more precisely in TaskState)
-    
+
+    # Optional message describing this status (e.g., a progress update while "working")
+    message: Message | None = None
+
     # Automatically captures the time when the status is recorded
     timestamp: datetime = Field(default_factory=datetime.now)
 
 
+# -----------------------------------------------------------------------------
+# Artifact: An output produced by the agent (may be streamed in chunks)
+# -----------------------------------------------------------------------------
+
+class Artifact(BaseModel):
+    name: str | None = None                # Optional name for the output (e.g., "answer")
+    description: str | None = None         # Optional human-readable description
+    parts: List[Part]                      # The content of the artifact
+    metadata: dict[str, Any] | None = None # Optional extra info
+    index: int = 0                         # Which artifact this chunk belongs to
+    append: bool | None = None             # True if this chunk extends a previous one
+    lastChunk: bool | None = None          # True on the final chunk of this artifact
+
+
 # -----------------------------------------------------------------------------
 # Task: The core unit of work in the Agent2Agent protocol
 # -----------------------------------------------------------------------------
 
 class Task(BaseModel):
     id: str                    # A unique identifier for this task (can be generated by client or agent)
+    sessionId: str | None = None  # The session this task belongs to
     status: TaskStatus         # The current state of the task
     history: List[Message]     # Conversation history for the task (what the user said, how the agent replied)
 
 
+# -----------------------------------------------------------------------------
+# Streaming Events: sent over SSE while a task is running (tasks/sendSubscribe)
+# -----------------------------------------------------------------------------
+
+# The task moved to a new state (e.g., "working" → "completed")
+class TaskStatusUpdateEvent(BaseModel):
+    id: str                                # The task ID
+    status: TaskStatus                     # The new status
+    final: bool = False                    # True on the last event of the stream
+    metadata: dict[str, Any] | None = None # Optional extra info
+
+
+# The agent produced (part of) an artifact
+class TaskArtifactUpdateEvent(BaseModel):
+    id: str                                # The task ID
+    artifact: Artifact                     # The artifact (or chunk) produced
+    metadata: dict[str, Any] | None = None # Optional extra info
+
+
+# -----------------------------------------------------------------------------
+# Push Notifications: where to POST task updates (instead of polling tasks/get)
+# -----------------------------------------------------------------------------
+
+# How the agent authenticates to the webhook
+class AuthenticationInfo(BaseModel):
+    schemes: List[str]                     # e.g. ["Bearer"]
+    credentials: str | None = None         # e.g. the bearer token
+
+# A webhook that receives the task (as JSON) every time it changes
+class PushNotificationConfig(BaseModel):
+    url: str                               # Webhook URL
+    token: str | None = None               # Echoed in X-A2A-Notification-Token so the receiver can verify it
+    authentication: AuthenticationInfo | None = None
+
+# Push settings for one task (params/result of tasks/pushNotification/set|get)
+class TaskPushNotificationConfig(BaseModel):
+    id: str                                # The task ID
+    pushNotificationConfig: PushNotificationConfig
+
+
 # -----------------------------------------------------------------------------
 # Parameter Models for API Requests
 # -----------------------------------------------------------------------------
@@ -80,6 +141,10 @@ class TaskIdParams(BaseModel):
 # Useful when querying a task and controlling how much of the past you want back
 class TaskQueryParams(TaskIdParams):
     historyLength: int | None = None       # Limit the number of messages returned in the task's history
+    # Cursor: only return history[historySince:]. The next cursor is historySince + len(history),
+    # except when historyLength cut the reply short (len(history) == historyLength): then
+    # some of the new messages were skipped; ask again without historyLength to get them all
+    historySince: int | None = None
 
 
 # Parameters required to send a new task to an agent
@@ -90,7 +155,8 @@ class TaskSendParams(BaseModel):
     sessionId: str = Field(default_factory=lambda: uuid4().hex)
 
     message: Message                       # The message that initiates the task
-    historyLength: int | None = None       # Optional history length to return
+    historyLength: int | None = None       # Only return the last N history messages in the response
+    pushNotification: PushNotificationConfig | None = None  # Optional webhook for this task's updates
     metadata: dict[str, Any] | None = None # Optional extra info (e.g., user role, priority)
 
 
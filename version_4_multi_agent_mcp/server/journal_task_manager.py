@@ -0,0 +1,278 @@
+# =============================================================================
+# server/journal_task_manager.py
+# =============================================================================
+# 🎯 Purpose:
+# A lightweight durable InMemoryTaskManager without a database: every change
+# is appended to a journal file, and the store is periodically compacted
+# into a snapshot. On startup: load the snapshot, replay the journal tail.
+#
+# ✅ Design:
+# - Hot path: one buffered, sequential write per event (no fsync, no
+#   syscalls for most events). A background flusher pushes the buffer to
+#   the OS every `flush_interval` seconds (and fsyncs if `fsync=True`).
+# - Events are JSON lines: "status" (create/status change) and "append"
+#   (history message at position `seq`). Replaying an event twice is
+#   harmless, so a crash between snapshot and journal cleanup is safe.
+# - Snapshots: after `snapshot_every` events a new journal generation is
+#   started and the current in-memory snapshots (already immutable) are
+#   written to snapshot-<gen>.jsonl by a worker thread, then older files
+#   are deleted. Recovery therefore reads one snapshot plus at most
+#   ~`snapshot_every` journal events, whatever the total history size.
+# - Replay reads the files through mmap, line by line.
+# - Only what is in memory is snapshotted: tasks evicted by the bounded
+#   store (max_tasks / TTLs) are dropped from disk at the next snapshot.
+# =============================================================================
+
+import asyncio                    # Flusher and snapshot tasks
+import json                       # Encodes event envelopes / decodes on replay
+import logging                    # Logs recovery and snapshot results
+import mmap                       # Memory-maps files for replay
+import os                         # fsync, atomic rename, cleanup
+import re                         # Parses generation numbers out of file names
+from typing import Dict, List
+
+from server.task_manager import InMemoryTaskManager, ACTIVE_STATES, interrupted_status
+from models.task import Task, TaskStatus, Message
+
+logger = logging.getLogger(__name__)
+
+# journal-<gen>.log / snapshot-<gen>.jsonl, gen is a zero-padded counter
+FILE_PATTERN = re.compile(r"^(journal|snapshot)-(\d+)\.(log|jsonl)$")
+
+
+class JournalTaskManager(InMemoryTaskManager):
+    """
+    📓 InMemoryTaskManager with an append-only journal and compacted snapshots.
+
+    Use it like InMemoryTaskManager (subclasses implement invoke_agent());
+    pass `journal_dir` to choose where the files live. As with
+    SqliteTaskManager, tasks found still submitted/working at startup are
+    marked "failed".
+
+    Attributes:
+        journal_dir (str): Directory holding journal and snapshot files.
+        snapshot_every (int): Journal events between two snapshots.
+        flush_interval (float): Seconds between buffer flushes.
+        fsync (bool): Also fsync on every flush (survives power loss).
+    """
+
+    def __init__(
+        self,
+        journal_dir: str = "task_journal",
+        snapshot_every: int = 10_000,
+        flush_interval: float = 0.05,
+        fsync: bool = False,
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        self.journal_dir = journal_dir
+        self.snapshot_every = snapshot_every
+        self.flush_interval = flush_interval
+        self.fsync = fsync
+        os.makedirs(journal_dir, exist_ok=True)
+
+        self.events_since_snapshot = 0
+        self.snapshots_written = 0
+        self._flusher: asyncio.Task | None = None
+        self._snapshotter: asyncio.Task | None = None
+        # A journal file is only closed once no fsync on it is running
+        self._fsync_lock = asyncio.Lock()
+
+        self.generation = self._recover()
+        self._journal = open(self._path("journal", self.generation), "a", encoding="utf-8")
+
+    # -------------------------------------------------------------------------
+    # 📂 Files
+    # -------------------------------------------------------------------------
+    def _path(self, kind: str, generation: int) -> str:
+        ext = "log" if kind == "journal" else "jsonl"
+        return os.path.join(self.journal_dir, f"{kind}-{generation:08d}.{ext}")
+
+    def _generations(self) -> Dict[str, List[int]]:
+        found: Dict[str, List[int]] = {"journal": [], "snapshot": []}
+        for name in os.listdir(self.journal_dir):
+            match = FILE_PATTERN.match(name)
+            if match:
+                found[match.group(1)].append(int(match.group(2)))
+        return {kind: sorted(gens) for kind, gens in found.items()}
+
+    @staticmethod
+    def _mapped_lines(path: str):
+        """Yield the lines of a file via mmap (nothing for an empty file)."""
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                yield from iter(mapped.readline, b"")
+
+    # -------------------------------------------------------------------------
+    # ♻️ Recovery: newest snapshot + journal generations from there on
+    # -------------------------------------------------------------------------
+    def _recover(self) -> int:
+        gens = self._generations()
+        base = gens["snapshot"][-1] if gens["snapshot"] else 0
+        tasks: Dict[str, Task] = {}
+
+        if gens["snapshot"]:
+            for line in self._mapped_lines(self._path("snapshot", base)):
+                task = Task.model_validate_json(line)
+                tasks[task.id] = task
+
+        replayed = 0
+        for gen in (g for g in gens["journal"] if g >= base):
+            for line in self._mapped_lines(self._path("journal", gen)):
+                try:
+                    self._apply(tasks, json.loads(line))
+                    replayed += 1
+                except ValueError:
+                    # A torn last line from a crash mid-write: skip it
+                    logger.warning(f"JournalTaskManager: skipped unreadable event in journal {gen}")
+
+        # Dicts keep insertion order, which is roughly least recently used first
+        interrupted: List[Task] = []
+        for task in tasks.values():
+            if task.status.state in ACTIVE_STATES:
+                task.status = interrupted_status()
+                interrupted.append(task)
+            self._restore_task(task)
+        if self._over_limits():
+            self._enforce_limits()
+
+        logger.info(
+            f"JournalTaskManager: recovered {len(tasks)} tasks "
+            f"(snapshot {base}, {replayed} journal events, {len(interrupted)} marked failed)"
+        )
+
+        # Continue in a fresh generation, starting with the "failed" markers
+        generation = max(gens["journal"] + gens["snapshot"] + [0]) + 1
+        with open(self._path("journal", generation), "a", encoding="utf-8") as journal:
+            for task in interrupted:
+                journal.write(self._status_event(task))
+        self.events_since_snapshot = replayed + len(interrupted)
+        return generation
+
+    @staticmethod
+    def _apply(tasks: Dict[str, Task], event: dict) -> None:
+        task = tasks.get(event["id"])
+        if event["op"] == "status":
+            status = TaskStatus.model_validate(event["status"])
+            if task is None:
+                tasks[event["id"]] = Task(id=event["id"], sessionId=event.get("sessionId"), status=status, history=[])
+            else:
+                task.status = status
+        elif event["op"] == "append" and task is not None:
+            # Skip messages already in the snapshot (idempotent replay)
+            if event["seq"] == len(task.history):
+                task.history.append(Message.model_validate(event["message"]))
+
+    # -------------------------------------------------------------------------
+    # ✍️ Hot path: one buffered write per event
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def _status_event(task: Task) -> str:
+        return (
+            f'{{"op":"status","id":{json.dumps(task.id)},"sessionId":{json.dumps(task.sessionId)},'
+            f'"status":{task.status.model_dump_json()}}}\n'
+        )
+
+    def _record_change(self, task: Task, appended: Message | None) -> None:
+        self._journal.write(self._status_event(task))
+        if appended is not None:
+            self._journal.write(
+                f'{{"op":"append","id":{json.dumps(task.id)},"seq":{len(task.history) - 1},'
+                f'"message":{appended.model_dump_json()}}}\n'
+            )
+            self.events_since_snapshot += 1
+        self.events_since_snapshot += 1
+
+        self._ensure_background()
+        if self.events_since_snapshot >= self.snapshot_every and (
+            self._snapshotter is None or self._snapshotter.done()
+        ):
+            self._snapshotter = asyncio.create_task(self.snapshot())
+
+    def _ensure_background(self) -> None:
+        if self._flusher is None or self._flusher.done():
+            self._flusher = asyncio.create_task(self._flush_forever())
+
+    async def _flush_forever(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await self.flush()
+
+    async def flush(self) -> None:
+        """Push buffered events to the OS (and to disk if fsync=True)."""
+        self._journal.flush()
+        if self.fsync:
+            async with self._fsync_lock:
+                await asyncio.to_thread(os.fsync, self._journal.fileno())
+
+    # -------------------------------------------------------------------------
+    # 📸 Snapshots: rotate the journal, write the store, drop old files
+    # -------------------------------------------------------------------------
+    async def snapshot(self) -> None:
+        """
+        Compact the store into snapshot-<gen>.jsonl and delete older files.
+
+        Rotation and capture happen without awaiting, so no event can fall
+        between the snapshot and the new journal generation.
+        """
+        old_journal = self._journal
+        old_journal.flush()
+        self.generation += 1
+        generation = self.generation
+        self._journal = open(self._path("journal", generation), "a", encoding="utf-8")
+        self.events_since_snapshot = 0
+        tasks = list(self.snapshots.values())     # Immutable copies: safe to write from a thread
+
+        # The disk work runs off the event loop
+        async with self._fsync_lock:
+            await asyncio.to_thread(self._close_journal, old_journal)
+        await asyncio.to_thread(self._write_snapshot, generation, tasks)
+        self.snapshots_written += 1
+        logger.info(f"JournalTaskManager: snapshot {generation} written ({len(tasks)} tasks)")
+
+    @staticmethod
+    def _close_journal(journal) -> None:
+        os.fsync(journal.fileno())
+        journal.close()
+
+    def _write_snapshot(self, generation: int, tasks: List[Task]) -> None:
+        path = self._path("snapshot", generation)
+        tmp = path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            for task in tasks:
+                f.write(task.model_dump_json())
+                f.write("\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)                      # Atomic: a snapshot is complete or absent
+
+        # Everything older than this snapshot is now redundant
+        for kind, gens in self._generations().items():
+            for gen in gens:
+                if gen < generation:
+                    os.remove(self._path(kind, gen))
+
+    # -------------------------------------------------------------------------
+    # 🧹 Stats and shutdown
+    # -------------------------------------------------------------------------
+    def store_stats(self) -> Dict[str, int]:
+        stats = super().store_stats()
+        stats.update(
+            journal_events_since_snapshot=self.events_since_snapshot,
+            journal_generation=self.generation,
+            journal_snapshots=self.snapshots_written,
+        )
+        return stats
+
+    async def aclose(self) -> None:
+        """Stop running tasks, then leave a fresh snapshot for a fast restart."""
+        await super().aclose()
+        if self._flusher is not None:
+            async with self._fsync_lock:           # Not while it is fsyncing in a thread
+                self._flusher.cancel()
+        if self._snapshotter is not None:
+            await self._snapshotter                # Never write two snapshots at once
+        await self.snapshot()
+        self._journal.close()
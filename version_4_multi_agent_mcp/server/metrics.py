@@ -0,0 +1,193 @@
+# =============================================================================
+# server/metrics.py
+# =============================================================================
+# 🎯 Purpose:
+# Minimal Prometheus-style metrics (counters, gauges, histograms) and the
+# text exposition format served by A2AServer at GET /metrics.
+#
+# ✅ Design:
+# - No extra dependency: metrics are plain dicts keyed by label values.
+# - One process-wide REGISTRY; modules declare their metrics at import time
+#   (server.py: requests, agent_connect.py: delegations, mcp_connect.py:
+#   tool calls), so every hop in a multi-agent chain reports the same way.
+# - Values that already live elsewhere (task store size, admission queue,
+#   push delivery) are not copied: they are read at scrape time via
+#   `render_stats()`.
+# =============================================================================
+
+import math                       # +Inf bucket
+import time                       # perf_counter() for timers
+from contextlib import contextmanager
+from typing import Dict, Iterable, List, Tuple
+
+# Seconds; agent runs and LLM calls are slow, so the buckets go up to minutes
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names: Iterable[str], values: Iterable[str], extra: str = "") -> str:
+    parts = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _number(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class _Metric:
+    """Common parts: name, help text, label names, samples per label values."""
+    kind = "untyped"
+
+    def __init__(self, name: str, help: str, labels: Tuple[str, ...] = (), registry: "Registry | None" = None):
+        self.name = name
+        self.help = help
+        self.label_names = tuple(labels)
+        self._values: Dict[Tuple[str, ...], object] = {}
+        (registry if registry is not None else REGISTRY).register(self)
+
+    def _key(self, labels: Dict[str, str]) -> Tuple[str, ...]:
+        return tuple(str(labels.get(name, "")) for name in self.label_names)
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+        for key, value in self._values.items():
+            lines.extend(self._samples(key, value))
+        return lines
+
+    def _samples(self, key, value) -> List[str]:
+        return [f"{self.name}{_labels(self.label_names, key)} {_number(value)}"]
+
+
+class Counter(_Metric):
+    """📈 A value that only goes up (requests, errors, ...)."""
+    kind = "counter"
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        key = self._key(labels)
+        self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels: str) -> float:
+        return self._values.get(self._key(labels), 0)
+
+
+class Gauge(_Metric):
+    """🌡️ A value that goes up and down (requests in flight, ...)."""
+    kind = "gauge"
+
+    def set(self, value: float, **labels: str) -> None:
+        self._values[self._key(labels)] = value
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        key = self._key(labels)
+        self._values[key] = self._values.get(key, 0) + amount
+
+    def dec(self, amount: float = 1, **labels: str) -> None:
+        self.inc(-amount, **labels)
+
+    def value(self, **labels: str) -> float:
+        return self._values.get(self._key(labels), 0)
+
+
+class Histogram(_Metric):
+    """
+    ⏱️ Distribution of observed values (latencies) in cumulative buckets.
+
+    Usage:
+        LATENCY = Histogram("x_seconds", "X latency", ("method",))
+        with LATENCY.time(method="tasks/send"):
+            ...
+    """
+    kind = "histogram"
+
+    def __init__(self, name: str, help: str, labels: Tuple[str, ...] = (),
+                 buckets: Tuple[float, ...] = DEFAULT_BUCKETS, registry: "Registry | None" = None):
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+        super().__init__(name, help, labels, registry)
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        state = self._values.get(key)
+        if state is None:
+            # [per-bucket counts..., sum, count]
+            state = self._values[key] = [0] * len(self.buckets) + [0.0, 0]
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                state[i] += 1
+                break
+        state[-2] += value
+        state[-1] += 1
+
+    @contextmanager
+    def time(self, **labels: str):
+        """Observe the duration of the `with` block (also when it raises)."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+
+    def count(self, **labels: str) -> int:
+        state = self._values.get(self._key(labels))
+        return state[-1] if state else 0
+
+    def _samples(self, key, state) -> List[str]:
+        lines, cumulative = [], 0
+        for bound, hits in zip(self.buckets, state):
+            cumulative += hits
+            le = f'le="{_number(bound)}"'
+            lines.append(f"{self.name}_bucket{_labels(self.label_names, key, le)} {cumulative}")
+        labels = _labels(self.label_names, key)
+        lines.append(f"{self.name}_sum{labels} {_number(state[-2])}")
+        lines.append(f"{self.name}_count{labels} {state[-1]}")
+        return lines
+
+
+class Registry:
+    """Holds metrics and renders them in the Prometheus text format."""
+
+    def __init__(self):
+        self.metrics: Dict[str, _Metric] = {}
+
+    def register(self, metric: _Metric) -> None:
+        if metric.name in self.metrics:
+            raise ValueError(f"Metric {metric.name} is already registered")
+        self.metrics[metric.name] = metric
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for metric in self.metrics.values():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+# The process-wide registry used by default
+REGISTRY = Registry()
+
+# Content type of the Prometheus text format
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def render_stats(prefix: str, stats: Dict[str, float], help: str) -> str:
+    """
+    Render a stats() dict (e.g. AdmissionController.stats()) as gauges named
+    `<prefix>_<key>`, read fresh on every scrape.
+    """
+    lines: List[str] = []
+    for key, value in stats.items():
+        name = f"{prefix}_{key}"
+        lines += [f"# HELP {name} {help} ({key})", f"# TYPE {name} gauge", f"{name} {_number(value)}"]
+    return "\n".join(lines) + "\n" if lines else ""
+
+
+def render_labeled(name: str, label: str, values: Dict[str, float], help: str) -> str:
+    """Render a {label value → number} dict as one gauge with a label."""
+    lines = [f"# HELP {name} {help}", f"# TYPE {name} gauge"]
+    lines += [f"{name}{_labels((label,), (key,))} {_number(value)}" for key, value in values.items()]
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,246 @@
+# =============================================================================
+# server/push_notifications.py
+# =============================================================================
+# 🎯 Purpose:
+# Delivers push notifications: every time a task changes, the task (as JSON)
+# is POSTed to the webhook the client registered with
+# tasks/pushNotification/set, so the client doesn't have to poll tasks/get.
+#
+# ✅ Design:
+# - One pooled httpx.AsyncClient (keep-alive) for all webhooks.
+# - Per-endpoint coalescing: each webhook URL has a queue holding only the
+#   LATEST version of each task. A burst of status updates
+#   (submitted → working → completed) within `coalesce_window` seconds
+#   turns into one POST carrying the newest state.
+# - Each endpoint has one worker that sends its pending notifications
+#   (up to `max_concurrency` at once) then picks up what arrived meanwhile,
+#   so a slow or broken webhook never delays other webhooks. A worker
+#   with nothing to send for `idle_timeout` seconds exits and forgets its
+#   endpoint, so one-off webhook URLs don't pile up.
+# - Failed deliveries (network errors, 429, 5xx) are retried with
+#   exponential backoff + jitter (honoring Retry-After). A retry is dropped
+#   if a newer version of the task is already waiting. After
+#   `max_attempts`, or on another 4xx, the notification goes to a bounded
+#   dead-letter queue (`dead_letters`) for inspection.
+# =============================================================================
+
+import asyncio                    # Worker tasks, backoff sleeps, concurrency limit
+import logging                    # Logs dead letters
+import random                     # Jitter for retry delays
+import time                       # Timestamps on dead letters
+from collections import deque     # Bounded dead-letter queue
+from dataclasses import dataclass, field
+from typing import Dict, List
+
+import httpx                      # Pooled async HTTP client
+
+from models.task import Task, PushNotificationConfig
+
+logger = logging.getLogger(__name__)
+
+# Statuses worth retrying (the receiver may recover); other 4xx won't
+RETRYABLE_STATUS_CODES = {408, 425, 429, 500, 502, 503, 504}
+
+
+@dataclass
+class DeadLetter:
+    """A notification that could not be delivered."""
+    url: str
+    task: Task
+    attempts: int
+    error: str
+    failed_at: float = field(default_factory=time.time)
+
+
+@dataclass
+class _Endpoint:
+    """Pending notifications and the worker for one webhook URL."""
+    pending: Dict[str, tuple] = field(default_factory=dict)   # Task ID → (config, task), newest only
+    wakeup: asyncio.Event = field(default_factory=asyncio.Event)
+    worker: asyncio.Task | None = None
+
+
+class PushNotificationSender:
+    """
+    📬 Sends task updates to webhooks with coalescing, retries and a DLQ.
+
+    Usage (InMemoryTaskManager does this for you when given a sender):
+        sender = PushNotificationSender()
+        sender.notify(config, task)     # Never blocks; delivery happens in the background
+        ...
+        await sender.aclose()
+
+    Attributes:
+        coalesce_window (float): Seconds to wait for more updates before sending.
+        max_attempts (int): Delivery attempts before a notification is dead-lettered.
+        base_delay / max_delay (float): Exponential backoff bounds in seconds.
+        max_concurrency (int): Concurrent POSTs per endpoint.
+        idle_timeout (float): Seconds an endpoint's worker waits for new work before exiting.
+        dead_letters (deque[DeadLetter]): Most recent undeliverable notifications.
+    """
+
+    def __init__(
+        self,
+        coalesce_window: float = 0.05,
+        max_attempts: int = 5,
+        base_delay: float = 0.5,
+        max_delay: float = 30.0,
+        timeout: float = 10.0,
+        max_connections: int = 100,
+        max_concurrency: int = 8,
+        dead_letter_size: int = 1000,
+        idle_timeout: float = 60.0,
+    ):
+        self.coalesce_window = coalesce_window
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.timeout = timeout
+        self.limits = httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections)
+        self.max_concurrency = max_concurrency
+        self.idle_timeout = idle_timeout
+
+        self._client: httpx.AsyncClient | None = None
+        self._endpoints: Dict[str, _Endpoint] = {}
+        self.dead_letters: deque[DeadLetter] = deque(maxlen=dead_letter_size)
+
+        # Counters for logs / metrics
+        self.queued = 0
+        self.coalesced = 0
+        self.delivered = 0
+        self.retries = 0
+        self.superseded = 0
+        self.dead_lettered = 0
+
+    # -------------------------------------------------------------------------
+    # 📥 Enqueue (called on every task change; must stay cheap)
+    # -------------------------------------------------------------------------
+    def notify(self, config: PushNotificationConfig, task: Task) -> None:
+        """Queue `task` for delivery to `config.url`, replacing any older pending version."""
+        endpoint = self._endpoints.get(config.url)
+        if endpoint is None:
+            endpoint = self._endpoints[config.url] = _Endpoint()
+
+        if task.id in endpoint.pending:
+            self.coalesced += 1
+        endpoint.pending[task.id] = (config, task)
+        self.queued += 1
+        endpoint.wakeup.set()
+
+        if endpoint.worker is None or endpoint.worker.done():
+            endpoint.worker = asyncio.create_task(self._run_endpoint(config.url, endpoint))
+
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(limits=self.limits, timeout=self.timeout)
+        return self._client
+
+    # -------------------------------------------------------------------------
+    # 🚚 Per-endpoint worker
+    # -------------------------------------------------------------------------
+    async def _run_endpoint(self, url: str, endpoint: _Endpoint) -> None:
+        limit = asyncio.Semaphore(self.max_concurrency)
+
+        async def deliver(config: PushNotificationConfig, task: Task):
+            async with limit:
+                await self._deliver(url, endpoint, config, task)
+
+        while True:
+            try:
+                await asyncio.wait_for(endpoint.wakeup.wait(), self.idle_timeout)
+            except asyncio.TimeoutError:
+                if endpoint.wakeup.is_set() or endpoint.pending:
+                    continue
+                break
+            # Let a burst of updates collapse into the newest version per task
+            await asyncio.sleep(self.coalesce_window)
+            endpoint.wakeup.clear()
+            batch, endpoint.pending = endpoint.pending, {}
+            await asyncio.gather(*(deliver(config, task) for config, task in batch.values()))
+
+        # Idle: forget the endpoint; notify() sets up a new one when needed
+        if self._endpoints.get(url) is endpoint:
+            del self._endpoints[url]
+
+    async def _deliver(self, url: str, endpoint: _Endpoint, config: PushNotificationConfig, task: Task) -> None:
+        body = task.model_dump_json(exclude_none=True)
+        headers = self._headers(config)
+        error = ""
+
+        for attempt in range(1, self.max_attempts + 1):
+            retry_after = None
+            try:
+                response = await self._get_client().post(url, content=body, headers=headers)
+                if response.status_code < 300:
+                    self.delivered += 1
+                    return
+                error = f"HTTP {response.status_code}"
+                if response.status_code not in RETRYABLE_STATUS_CODES:
+                    break                               # The receiver rejected it; retrying won't help
+                retry_after = _retry_after(response)
+            except httpx.HTTPError as e:
+                error = f"{type(e).__name__}: {e}"
+
+            if attempt == self.max_attempts:
+                break
+            delay = min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+            delay = min(retry_after, self.max_delay) if retry_after is not None else random.uniform(delay / 2, delay)
+            await asyncio.sleep(delay)
+            if task.id in endpoint.pending:
+                self.superseded += 1                    # A newer version will be sent instead
+                return
+            self.retries += 1
+
+        self.dead_lettered += 1
+        self.dead_letters.append(DeadLetter(url=url, task=task, attempts=attempt, error=error))
+        logger.warning(f"Push notification for task {task.id} to {url} dead-lettered after {attempt} attempts: {error}")
+
+    @staticmethod
+    def _headers(config: PushNotificationConfig) -> Dict[str, str]:
+        headers = {"Content-Type": "application/json"}
+        if config.token:
+            headers["X-A2A-Notification-Token"] = config.token
+        auth = config.authentication
+        if auth and auth.credentials and "bearer" in (s.lower() for s in auth.schemes):
+            headers["Authorization"] = f"Bearer {auth.credentials}"
+        return headers
+
+    # -------------------------------------------------------------------------
+    # 📊 Stats and shutdown
+    # -------------------------------------------------------------------------
+    def stats(self) -> Dict[str, int]:
+        """Delivery counters and queue depth, e.g. for logs or metrics."""
+        return {
+            "endpoints": len(self._endpoints),
+            "pending": sum(len(e.pending) for e in self._endpoints.values()),
+            "queued": self.queued,
+            "coalesced": self.coalesced,
+            "delivered": self.delivered,
+            "retries": self.retries,
+            "superseded": self.superseded,
+            "dead_lettered": self.dead_lettered,
+        }
+
+    def drain_dead_letters(self) -> List[DeadLetter]:
+        """Remove and return the dead letters (e.g. to replay or report them)."""
+        letters = list(self.dead_letters)
+        self.dead_letters.clear()
+        return letters
+
+    async def aclose(self) -> None:
+        """Stop the workers and close the pooled connections."""
+        workers = [e.worker for e in self._endpoints.values() if e.worker is not None]
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+
+def _retry_after(response: httpx.Response) -> float | None:
+    """Seconds from a Retry-After header (HTTP-date form ignored)."""
+    try:
+        return float(response.headers["retry-after"])
+    except (KeyError, ValueError):
+        return None
@@ -0,0 +1,299 @@
+# =============================================================================
+# server/sqlite_task_manager.py
+# =============================================================================
+# 🎯 Purpose:
+# A durable version of InMemoryTaskManager: every task, status change and
+# history message is also written to a SQLite database, so an agent can be
+# restarted without losing its tasks.
+#
+# ✅ Design:
+# - Memory stays the fast path: reads are served from the in-memory
+#   snapshots; the database is only read at startup and on cache misses
+#   (tasks evicted from memory by the bounded store).
+# - Writes never block a request: changes go on an asyncio queue and a
+#   single writer drains it, committing everything queued so far in ONE
+#   transaction (group commit). Repeated status updates of the same task
+#   inside a batch collapse into one row write.
+# - WAL journal mode + synchronous=NORMAL: readers don't block the writer
+#   and each commit is a sequential append to the WAL file.
+# - Lookups are indexed by task id (primary key) and by sessionId.
+# =============================================================================
+
+import asyncio                                     # Write queue and writer task
+import logging                                     # Logs writer failures
+import sqlite3                                     # Built-in SQLite driver
+import time                                        # Row timestamps
+from concurrent.futures import ThreadPoolExecutor  # One thread owns the connection
+from typing import Callable, Dict, List, Tuple
+
+from server.task_manager import InMemoryTaskManager, ACTIVE_STATES, interrupted_status
+from models.request import GetTaskRequest, GetTaskResponse
+from models.task import Task, TaskSendParams, TaskStatus, Message
+
+logger = logging.getLogger(__name__)
+
+
+# -----------------------------------------------------------------------------
+# 🗄️ Schema
+# -----------------------------------------------------------------------------
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    id          TEXT PRIMARY KEY,
+    session_id  TEXT,
+    state       TEXT NOT NULL,
+    status      TEXT NOT NULL,
+    updated_at  REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_tasks_session_id ON tasks(session_id);
+
+CREATE TABLE IF NOT EXISTS history (
+    task_id  TEXT NOT NULL,
+    seq      INTEGER NOT NULL,
+    message  TEXT NOT NULL,
+    PRIMARY KEY (task_id, seq)
+) WITHOUT ROWID;
+"""
+
+UPSERT_TASK = """
+INSERT INTO tasks (id, session_id, state, status, updated_at)
+VALUES (?, ?, ?, ?, ?)
+ON CONFLICT(id) DO UPDATE SET
+    session_id = COALESCE(excluded.session_id, tasks.session_id),
+    state      = excluded.state,
+    status     = excluded.status,
+    updated_at = excluded.updated_at
+"""
+
+INSERT_HISTORY = "INSERT OR REPLACE INTO history (task_id, seq, message) VALUES (?, ?, ?)"
+
+
+class SqliteTaskManager(InMemoryTaskManager):
+    """
+    💾 InMemoryTaskManager that persists tasks to SQLite.
+
+    Use it exactly like InMemoryTaskManager (subclasses implement
+    invoke_agent()); pass `db_path` to choose the database file.
+
+    On startup the most recently updated tasks (up to `max_tasks`) are loaded
+    back into memory. Tasks that were still submitted/working when the
+    process stopped can't be resumed, so they are marked "failed" with a note.
+
+    Attributes:
+        db_path (str): SQLite database file.
+        batch_size (int): Max queued changes committed in one transaction.
+    """
+
+    def __init__(self, db_path: str = "tasks.db", batch_size: int = 512, **kwargs):
+        super().__init__(**kwargs)
+        self.db_path = db_path
+        self.batch_size = batch_size
+
+        # 🧵 sqlite3 connections belong to one thread: all DB work runs here
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sqlite-tasks")
+        self._conn = self._executor.submit(self._open).result()
+
+        # 📨 Pending writes (and reads that must see them), drained by one writer
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._writer: asyncio.Task | None = None
+        self.batches_written = 0
+        self.rows_written = 0
+
+        self._executor.submit(self._recover).result()
+
+    # -------------------------------------------------------------------------
+    # 🔌 Connection setup and startup recovery (run on the DB thread)
+    # -------------------------------------------------------------------------
+    def _open(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA busy_timeout=5000")
+        conn.executescript(SCHEMA)
+        return conn
+
+    def _recover(self) -> None:
+        """Load recent tasks into memory; fail the ones that were interrupted."""
+        limit = self.max_tasks if self.max_tasks is not None else -1
+        rows = self._conn.execute(
+            "SELECT id FROM tasks ORDER BY updated_at DESC LIMIT ?", (limit,)
+        ).fetchall()
+
+        interrupted: List[Task] = []
+        # Oldest first, so the in-memory LRU order matches the database
+        for (task_id,) in reversed(rows):
+            task = self._read_task(task_id)
+            if task.status.state in ACTIVE_STATES:
+                task.status = interrupted_status()
+                interrupted.append(task)
+            self._restore_task(task)
+
+        if interrupted:
+            self._write_batch([("task", self._task_row(task)) for task in interrupted])
+        logger.info(
+            f"SqliteTaskManager: loaded {len(rows)} tasks from {self.db_path} "
+            f"({len(interrupted)} marked failed after restart)"
+        )
+
+    def _read_task(self, task_id: str) -> Task | None:
+        row = self._conn.execute(
+            "SELECT session_id, status FROM tasks WHERE id = ?", (task_id,)
+        ).fetchone()
+        if row is None:
+            return None
+        messages = self._conn.execute(
+            "SELECT message FROM history WHERE task_id = ? ORDER BY seq", (task_id,)
+        ).fetchall()
+        return Task(
+            id=task_id,
+            sessionId=row[0],
+            status=TaskStatus.model_validate_json(row[1]),
+            history=[Message.model_validate_json(m) for (m,) in messages],
+        )
+
+    def _read_session(self, session_id: str) -> List[Task]:
+        ids = self._conn.execute(
+            "SELECT id FROM tasks WHERE session_id = ? ORDER BY updated_at", (session_id,)
+        ).fetchall()
+        return [self._read_task(task_id) for (task_id,) in ids]
+
+    # -------------------------------------------------------------------------
+    # ✍️ Write path: queue on the request path, group-commit in the writer
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def _task_row(task: Task) -> tuple:
+        return (task.id, task.sessionId, task.status.state, task.status.model_dump_json(), time.time())
+
+    def _record_change(self, task: Task, appended: Message | None) -> None:
+        """Queue the change; the writer commits it with everything else pending."""
+        self._ensure_writer()
+        self._queue.put_nowait(("task", self._task_row(task)))
+        if appended is not None:
+            seq = len(task.history) - 1
+            self._queue.put_nowait(("history", (task.id, seq, appended.model_dump_json())))
+
+    def _ensure_writer(self) -> None:
+        if self._writer is None or self._writer.done():
+            self._writer = asyncio.create_task(self._write_loop())
+
+    async def _write_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            # Wait for one change, then take everything else already queued
+            batch = [await self._queue.get()]
+            while len(batch) < self.batch_size and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+
+            write_error, reads = await loop.run_in_executor(self._executor, self._run_batch, batch)
+            if write_error is not None:
+                logger.error(f"SqliteTaskManager: write of {len(batch) - len(reads)} changes failed: {write_error}")
+
+            # Hand read results (or a read's own error) back to the coroutines waiting for them
+            for future, (value, error) in reads.items():
+                if future.done():
+                    continue
+                if error is not None:
+                    future.set_exception(error)
+                else:
+                    future.set_result(value)
+            for _ in batch:
+                self._queue.task_done()
+
+    def _run_batch(self, batch: List[tuple]) -> Tuple[Exception | None, Dict[asyncio.Future, tuple]]:
+        """
+        Commit the batch's writes in one transaction, then run the reads
+        queued behind them (so they see every earlier write). Runs on the
+        DB thread. A failed commit is returned for logging; each read gets
+        its own (value, error), so one bad read only fails its own caller.
+        """
+        writes = [item for item in batch if item[0] != "read"]
+        write_error = None
+        if writes:
+            try:
+                self._write_batch(writes)
+            except Exception as e:
+                write_error = e
+
+        reads: Dict[asyncio.Future, tuple] = {}
+        for kind, (fn, arg, future) in (item for item in batch if item[0] == "read"):
+            try:
+                reads[future] = (fn(arg), None)
+            except Exception as e:
+                reads[future] = (None, e)
+        return write_error, reads
+
+    def _write_batch(self, batch: List[tuple]) -> None:
+        """Commit queued task / history rows in one transaction (DB thread)."""
+        task_rows: Dict[str, tuple] = {}        # Last status per task wins
+        history_rows: List[tuple] = []
+        for kind, payload in batch:
+            if kind == "task":
+                task_rows[payload[0]] = payload
+            else:
+                history_rows.append(payload)
+
+        with self._conn:                        # One transaction for the whole batch
+            self._conn.executemany(UPSERT_TASK, list(task_rows.values()))
+            self._conn.executemany(INSERT_HISTORY, history_rows)
+        self.batches_written += 1
+        self.rows_written += len(task_rows) + len(history_rows)
+
+    async def _read(self, fn: Callable, arg):
+        """Run a DB read on the writer's queue, after all pending writes."""
+        self._ensure_writer()
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait(("read", (fn, arg, future)))
+        return await future
+
+    async def flush(self) -> None:
+        """Wait until every queued change is committed."""
+        if self._writer is not None:
+            await self._queue.join()
+
+    # -------------------------------------------------------------------------
+    # 📥 Read-through for tasks evicted from memory
+    # -------------------------------------------------------------------------
+    async def _ensure_loaded(self, task_id: str) -> None:
+        if task_id in self.tasks:
+            return
+        task = await self._read(self._read_task, task_id)
+        if task is None:
+            return
+        async with self.lock_for(task_id):
+            if task_id not in self.tasks:
+                self._restore_task(task)
+        if self._over_limits():
+            self._enforce_limits()
+
+    async def upsert_task(self, params: TaskSendParams) -> Task:
+        await self._ensure_loaded(params.id)
+        return await super().upsert_task(params)
+
+    async def on_get_task(self, request: GetTaskRequest) -> GetTaskResponse:
+        if self.get_snapshot(request.params.id) is None:
+            await self._ensure_loaded(request.params.id)
+        return await super().on_get_task(request)
+
+    async def list_session_tasks(self, session_id: str) -> List[Task]:
+        """All stored tasks of a session, oldest first (uses the sessionId index)."""
+        return await self._read(self._read_session, session_id)
+
+    # -------------------------------------------------------------------------
+    # 🧹 Shutdown
+    # -------------------------------------------------------------------------
+    def store_stats(self) -> Dict[str, int]:
+        stats = super().store_stats()
+        stats.update(
+            db_pending=self._queue.qsize(),
+            db_batches=self.batches_written,
+            db_rows=self.rows_written,
+        )
+        return stats
+
+    async def aclose(self) -> None:
+        """Stop running tasks, commit what's queued, then close the database."""
+        await super().aclose()
+        await self.flush()
+        if self._writer is not None:
+            self._writer.cancel()
+        await asyncio.get_running_loop().run_in_executor(self._executor, self._conn.close)
+        self._executor.shutdown(wait=False)
@@ -7,11 +7,17 @@
 # ✅ Includes:
 # - A base abstract class `TaskManager` that outlines required methods
 # - A simple `InMemoryTaskManager` that keeps tasks temporarily in memory
+# - Streaming task updates (tasks/sendSubscribe) as an async generator
+# - Optional background execution: tasks/send returns at once, tasks/get polls
+# - Per-task (striped) locks for writers and lock-free snapshot reads
+# - A bounded store: max tasks / history bytes, per-state TTLs, LRU eviction
+# - Cancelling a running task (tasks/cancel): every agent run is a tracked
+#   asyncio task, so cancel stops the LLM call / child-agent call in flight
+# - Push notifications (tasks/pushNotification/set|get), delivered by a
+#   PushNotificationSender (see server/push_notifications.py)
 #
 # ❌ Does not include:
-# - Cancel task functionality
-# - Push notifications or real-time updates
-# - Persistent storage (like a database)
+# - Persistent storage (see server/sqlite_task_manager.py for a durable version)
 # =============================================================================
 
 
@@ -20,8 +26,11 @@
 # -----------------------------------------------------------------------------
 
 from abc import ABC, abstractmethod        # Lets us define abstract base classes (like an interface)
-from typing import Dict                    # Dict is a dictionary type for storing key-value pairs
+from typing import Dict, AsyncIterable     # Dict for key-value stores, AsyncIterable for streamed events
+from collections import OrderedDict        # Keeps tasks in least-recently-used order
 import asyncio                             # Used here for locks to safely handle concurrency (async operations)
+import logging                             # Used to log background task failures
+import time                                # time.monotonic stamps state changes for TTLs
 
 
 # -----------------------------------------------------------------------------
@@ -30,13 +39,70 @@ import asyncio                             # Used here for locks to safely handl
 
 from models.request import (
     SendTaskRequest, SendTaskResponse,    # For sending tasks to the agent
-    GetTaskRequest, GetTaskResponse       # For querying task info from the agent
+    GetTaskRequest, GetTaskResponse,      # For querying task info from the agent
+    SendTaskStreamingRequest,             # For sending a task and streaming its updates
+    SendTaskStreamingResponse,
+    CancelTaskRequest, CancelTaskResponse, # For stopping a running task
+    SetTaskPushNotificationRequest, SetTaskPushNotificationResponse,  # Webhook settings
+    GetTaskPushNotificationRequest, GetTaskPushNotificationResponse
 )
+from models.json_rpc import JSONRPCResponse, TaskNotFoundError, TaskNotCancelableError, InvalidRequestError
+from models.json_rpc import PushNotificationNotSupportedError
 
 from models.task import (
     Task, TaskSendParams, TaskQueryParams,  # Task and input models
-    TaskStatus, TaskState, Message          # Task metadata and history objects
+    TaskStatus, TaskState, Message,         # Task metadata and history objects
+    TextPart,                               # Text content of a message
+    Artifact, TaskStatusUpdateEvent,        # Streaming events and their payloads
+    TaskArtifactUpdateEvent,
+    PushNotificationConfig, TaskPushNotificationConfig  # Webhook settings
 )
+from server.push_notifications import PushNotificationSender
+from server.tracing import tracer          # OpenTelemetry spans (no-op unless tracing is set up)
+
+
+logger = logging.getLogger(__name__)       # Logger for this module
+
+
+# ⏳ Default time-to-live (seconds) per task state; states not listed never expire
+DEFAULT_STATE_TTLS: Dict[str, float] = {
+    TaskState.COMPLETED: 60 * 60,
+    TaskState.CANCELED: 60 * 60,
+    TaskState.FAILED: 60 * 60,
+    TaskState.INPUT_REQUIRED: 24 * 60 * 60,
+}
+
+# 🛡️ Tasks in these states are still being worked on and are never evicted
+ACTIVE_STATES = {TaskState.SUBMITTED, TaskState.WORKING}
+
+# 🛑 Tasks in these states can still be canceled (input-required waits on the user)
+CANCELABLE_STATES = ACTIVE_STATES | {TaskState.INPUT_REQUIRED}
+
+
+def interrupted_status() -> TaskStatus:
+    """
+    Status for a task found still submitted/working when a durable task
+    manager starts up: its agent run died with the old process.
+    """
+    return TaskStatus(
+        state=TaskState.FAILED,
+        message=Message(role="agent", parts=[TextPart(text="Interrupted by a server restart")])
+    )
+
+
+def task_running_error(task_id: str) -> InvalidRequestError:
+    """Error for a send to a task whose agent run hasn't finished yet."""
+    return InvalidRequestError(
+        message=f"Task {task_id} is still running; wait for it or cancel it first"
+    )
+
+
+def canceled_status() -> TaskStatus:
+    """Status for a task stopped by tasks/cancel (or by server shutdown)."""
+    return TaskStatus(
+        state=TaskState.CANCELED,
+        message=Message(role="agent", parts=[TextPart(text="Task canceled")])
+    )
 
 
 # -----------------------------------------------------------------------------
@@ -47,9 +113,14 @@ class TaskManager(ABC):
     """
     🔧 This is a base interface class.
 
-    All Task Managers must implement these two async methods:
+    All Task Managers must implement these async methods:
     - on_send_task(): to receive and process new tasks
     - on_get_task(): to fetch the current status or conversation history of a task
+    - on_send_task_subscribe(): to process a task and stream its updates
+    - on_cancel_task(): to stop a task that is still running
+
+    Push notifications are optional: by default the two
+    tasks/pushNotification methods answer "not supported".
 
     This makes sure all implementations follow a consistent structure.
     """
@@ -64,6 +135,40 @@ class TaskManager(ABC):
         """📤 This method will return task details by task ID."""
         pass
 
+    @abstractmethod
+    async def on_send_task_subscribe(
+        self, request: SendTaskStreamingRequest
+    ) -> AsyncIterable[SendTaskStreamingResponse] | JSONRPCResponse:
+        """
+        📡 Start a task and return an async iterator of streamed events
+        (or a JSONRPCResponse with an error if the request is rejected).
+        """
+        pass
+
+    @abstractmethod
+    async def on_cancel_task(self, request: CancelTaskRequest) -> CancelTaskResponse:
+        """🛑 This method will stop a running task and mark it canceled."""
+        pass
+
+    async def on_set_task_push_notification(
+        self, request: SetTaskPushNotificationRequest
+    ) -> SetTaskPushNotificationResponse:
+        """📬 Register a webhook for a task's updates (optional feature)."""
+        return SetTaskPushNotificationResponse(id=request.id, error=PushNotificationNotSupportedError())
+
+    async def on_get_task_push_notification(
+        self, request: GetTaskPushNotificationRequest
+    ) -> GetTaskPushNotificationResponse:
+        """📬 Return a task's webhook settings (optional feature)."""
+        return GetTaskPushNotificationResponse(id=request.id, error=PushNotificationNotSupportedError())
+
+    async def aclose(self) -> None:
+        """
+        🧹 Release long-lived resources (connections, subprocesses, ...).
+        Called by A2AServer when the app shuts down. Default: nothing to do.
+        """
+        pass
+
 
 # -----------------------------------------------------------------------------
 # 🧠 InMemoryTaskManager
@@ -78,12 +183,268 @@ class InMemoryTaskManager(TaskManager):
     - Local development
     - Single-session interactions
 
+    Subclasses implement invoke_agent() (turn a request into reply text);
+    this class takes care of storing the task, recording the reply, and
+    running the work either inline or in the background.
+
+    ⏱️ Background mode: if `background=True` (or a request sets
+    `metadata={"background": true}`), tasks/send returns the task in the
+    "working" state immediately and the agent runs in a tracked asyncio task.
+    Clients then poll tasks/get until the task reaches a final state.
+
+    🛑 Cancellation: every agent run (blocking, background or streamed) runs
+    in an asyncio task tracked in `running`. tasks/cancel cancels it, which
+    raises CancelledError wherever invoke_agent() is waiting, and marks the
+    task "canceled". A task runs at most once at a time: a send for a task
+    whose run is still in flight gets an InvalidRequestError.
+
+    📬 Push notifications: with a `push_sender`, clients register a webhook
+    per task (tasks/pushNotification/set, or `pushNotification` in
+    tasks/send) and every published change of that task is sent to it.
+
+    🔐 Concurrency: writers take the lock of their task's stripe
+    (`lock_for(task_id)`), so unrelated tasks never wait on each other.
+    After every change an immutable snapshot of the task is published;
+    tasks/get just reads the latest snapshot and takes no lock at all.
+
+    🧹 Bounded memory: the store keeps at most `max_tasks` tasks and about
+    `max_history_bytes` of message history. Past either limit the least
+    recently used finished tasks are evicted. `state_ttls` expires tasks
+    that have sat in a state (e.g. "completed") for too long. A background
+    sweeper applies both every `sweep_interval` seconds; see store_stats().
+    Tasks that are still submitted/working are never evicted.
+
     ❗ Not for production: Data is lost when the app stops or restarts.
     """
 
-    def __init__(self):
-        self.tasks: Dict[str, Task] = {}   # 🗃️ Dictionary where key = task ID, value = Task object
-        self.lock = asyncio.Lock()         # 🔐 Async lock to ensure two requests don't modify data at the same time
+    def __init__(
+        self,
+        background: bool = False,
+        lock_stripes: int = 64,
+        max_tasks: int | None = 10_000,
+        max_history_bytes: int | None = 256 * 1024 * 1024,
+        state_ttls: Dict[str, float] | None = None,
+        sweep_interval: float | None = 30.0,
+        cancel_timeout: float = 5.0,
+        push_sender: PushNotificationSender | None = None,
+    ):
+        # 🗃️ Task ID → Task object (writers only), oldest-used first
+        self.tasks: "OrderedDict[str, Task]" = OrderedDict()
+        self.snapshots: Dict[str, Task] = {}  # 📸 Task ID → latest read-only copy (what readers see)
+        # 🔐 Striped async locks: tasks hashing to the same stripe share a lock
+        self.locks = [asyncio.Lock() for _ in range(lock_stripes)]
+        self.background = background       # ⏱️ Default execution mode for tasks/send
+        self.running: Dict[str, asyncio.Task] = {}  # 🏃 Task ID → asyncio task running the agent
+        self._claimed: set[str] = set()    # 🚦 Task IDs whose send is setting up a run (not yet in `running`)
+        self.cancel_timeout = cancel_timeout  # 🛑 Max seconds tasks/cancel waits for a run to stop
+        self.push_sender = push_sender        # 📬 Delivers webhooks (None = push not supported)
+        self.push_configs: Dict[str, PushNotificationConfig] = {}  # Task ID → its webhook
+
+        # 🧹 Store limits and bookkeeping for eviction
+        self.max_tasks = max_tasks
+        self.max_history_bytes = max_history_bytes
+        self.state_ttls = DEFAULT_STATE_TTLS if state_ttls is None else state_ttls
+        self.sweep_interval = sweep_interval
+        self.history_bytes = 0                      # Approximate size of all stored history
+        self._history_sizes: Dict[str, int] = {}    # Task ID → its history size in bytes
+        self._state_since: Dict[str, float] = {}    # Task ID → when it entered its current state
+        self._sweeper: asyncio.Task | None = None
+        self.evictions = {"lru": 0, "ttl": 0}       # Evicted task counts by reason
+        self.sweeps = 0
+
+    # -------------------------------------------------------------------------
+    # 🔐 Locks and snapshots
+    # -------------------------------------------------------------------------
+    def lock_for(self, task_id: str) -> asyncio.Lock:
+        """Return the lock guarding writes to `task_id`."""
+        return self.locks[hash(task_id) % len(self.locks)]
+
+    def _publish(self, task: Task) -> Task:
+        """
+        Store a copy of `task` for readers. Call while holding the task's lock.
+
+        The copy gets its own history list; statuses and messages are always
+        replaced, never edited in place, so they can be shared safely.
+        """
+        snapshot = task.model_copy(update={"history": list(task.history)})
+        self.snapshots[task.id] = snapshot
+        config = self.push_configs.get(task.id)
+        if config is not None and self.push_sender is not None:
+            self.push_sender.notify(config, snapshot)   # Queued; delivered in the background
+        return snapshot
+
+    @staticmethod
+    def trim_history(
+        task: Task, history_length: int | None = None, since: int | None = None
+    ) -> Task:
+        """
+        Return `task` with only part of its history (a copy; `task` is untouched):
+        - since: drop the first `since` messages (a cursor from an earlier call)
+        - history_length: then keep only the last N messages; a value of at
+          least the remaining length keeps them all, 0 keeps none
+        """
+        if history_length is None and not since:
+            return task
+        history = task.history[since:] if since else task.history
+        if history_length is not None:
+            history = history[-history_length:] if history_length > 0 else []
+        return task.model_copy(update={"history": history})
+
+    def get_snapshot(self, task_id: str) -> Task | None:
+        """Latest published copy of a task (no lock needed), or None."""
+        snapshot = self.snapshots.get(task_id)
+        if snapshot is not None:
+            self.tasks.move_to_end(task_id)     # Reading counts as use for LRU
+        return snapshot
+
+    async def update_task(
+        self, task_id: str, status: TaskStatus, message: Message | None = None
+    ) -> Task:
+        """
+        Set a task's status (and optionally append a message to its history)
+        under the task's lock, then publish a new snapshot.
+
+        Returns:
+            Task – the new snapshot
+        """
+        async with self.lock_for(task_id):
+            task = self.tasks[task_id]
+            if task.status.state != status.state:
+                self._state_since[task_id] = time.monotonic()
+            task.status = status
+            if message is not None:
+                task.history.append(message)
+                self._add_history_bytes(task_id, message)
+            self.tasks.move_to_end(task_id)
+            self._record_change(task, message)
+            return self._publish(task)
+
+    def _record_change(self, task: Task, appended: Message | None) -> None:
+        """
+        💾 Persistence hook, called under the task's lock after every change:
+        the task's status may have changed and `appended` (if any) was just
+        added to the end of its history. The in-memory store does nothing;
+        durable subclasses write the change out.
+        """
+        pass
+
+    def _restore_task(self, task: Task) -> None:
+        """
+        Put a task loaded from durable storage back into memory, with the
+        same bookkeeping as if it had been created here.
+        """
+        self.tasks[task.id] = task
+        self._state_since[task.id] = time.monotonic()
+        self.history_bytes -= self._history_sizes.pop(task.id, 0)
+        for message in task.history:
+            self._add_history_bytes(task.id, message)
+        self._publish(task)
+
+    # -------------------------------------------------------------------------
+    # 🧹 Bounded store: sizes, eviction, background sweeper
+    # -------------------------------------------------------------------------
+    def _add_history_bytes(self, task_id: str, message: Message) -> None:
+        """Account for a message added to a task's history."""
+        size = len(message.model_dump_json())
+        self._history_sizes[task_id] = self._history_sizes.get(task_id, 0) + size
+        self.history_bytes += size
+
+    def _evict(self, task_id: str, reason: str) -> None:
+        """Drop a task and everything we track about it."""
+        self.tasks.pop(task_id, None)
+        self.snapshots.pop(task_id, None)
+        self._state_since.pop(task_id, None)
+        self.push_configs.pop(task_id, None)
+        self.history_bytes -= self._history_sizes.pop(task_id, 0)
+        self.evictions[reason] += 1
+
+    def _is_evictable(self, task: Task) -> bool:
+        return task.status.state not in ACTIVE_STATES and task.id not in self.running
+
+    def _over_limits(self, tasks: int | None = None, history_bytes: int | None = None) -> bool:
+        tasks = len(self.tasks) if tasks is None else tasks
+        history_bytes = self.history_bytes if history_bytes is None else history_bytes
+        return (
+            (self.max_tasks is not None and tasks > self.max_tasks)
+            or (self.max_history_bytes is not None and history_bytes > self.max_history_bytes)
+        )
+
+    def _enforce_limits(self) -> int:
+        """Evict least recently used finished tasks until under the limits."""
+        # Walk from the LRU end only as far as needed (no copy of the whole store)
+        tasks_left, bytes_left = len(self.tasks), self.history_bytes
+        victims = []
+        for task_id, task in self.tasks.items():
+            if not self._over_limits(tasks_left, bytes_left):
+                break
+            if self._is_evictable(task):
+                victims.append(task_id)
+                tasks_left -= 1
+                bytes_left -= self._history_sizes.get(task_id, 0)
+
+        for task_id in victims:
+            self._evict(task_id, "lru")
+        return len(victims)
+
+    def _expire(self) -> int:
+        """Evict tasks that stayed in their state longer than its TTL."""
+        now = time.monotonic()
+        expired = 0
+        for task_id, task in list(self.tasks.items()):
+            ttl = self.state_ttls.get(task.status.state)
+            if ttl is None or not self._is_evictable(task):
+                continue
+            if now - self._state_since.get(task_id, now) >= ttl:
+                self._evict(task_id, "ttl")
+                expired += 1
+        return expired
+
+    def sweep(self) -> int:
+        """
+        Run one eviction pass (TTLs, then size limits).
+
+        Returns:
+            int – number of tasks evicted
+        """
+        evicted = self._expire() + self._enforce_limits()
+        self.sweeps += 1
+        if evicted:
+            logger.info(
+                f"Task store sweep evicted {evicted} tasks; "
+                f"{len(self.tasks)} tasks / {self.history_bytes} history bytes resident"
+            )
+        return evicted
+
+    def store_stats(self) -> Dict[str, int]:
+        """Resident size and eviction counters, e.g. for logs or metrics."""
+        return {
+            "tasks": len(self.tasks),
+            "history_bytes": self.history_bytes,
+            "running": len(self.running),
+            "evicted_lru": self.evictions["lru"],
+            "evicted_ttl": self.evictions["ttl"],
+            "sweeps": self.sweeps,
+        }
+
+    def state_counts(self) -> Dict[str, int]:
+        """Number of stored tasks in each state (computed on demand, e.g. per metrics scrape)."""
+        counts = {state.value: 0 for state in TaskState}
+        for task in self.tasks.values():
+            counts[task.status.state] += 1
+        return counts
+
+    def _ensure_sweeper(self) -> None:
+        """Start the background sweeper on first use (needs a running loop)."""
+        if self.sweep_interval and (self._sweeper is None or self._sweeper.done()):
+            self._sweeper = asyncio.create_task(self._sweep_forever())
+
+    async def _sweep_forever(self) -> None:
+        while True:
+            await asyncio.sleep(self.sweep_interval)
+            try:
+                self.sweep()
+            except Exception as e:
+                logger.error(f"Task store sweep failed: {e}")
 
     # -------------------------------------------------------------------------
     # 💾 upsert_task: Create or update a task in memory
@@ -91,6 +452,7 @@ class InMemoryTaskManager(TaskManager):
     async def upsert_task(self, params: TaskSendParams) -> Task:
         """
         Create a new task if it doesn’t exist, or update the history if it does.
+        Either way the task is (back) in the "submitted" state afterwards.
 
         Args:
             params: TaskSendParams – includes task ID, session ID, and message
@@ -98,35 +460,368 @@ class InMemoryTaskManager(TaskManager):
         Returns:
             Task – the newly created or updated task
         """
-        async with self.lock:
+        self._ensure_sweeper()
+
+        async with self.lock_for(params.id):
+            if params.pushNotification is not None and self.push_sender is not None:
+                self.push_configs[params.id] = params.pushNotification
+
             task = self.tasks.get(params.id)  # Try to find an existing task with this ID
 
             if task is None:
                 # If task doesn't exist, create it with a "submitted" status
                 task = Task(
                     id=params.id,
+                    sessionId=params.sessionId,
                     status=TaskStatus(state=TaskState.SUBMITTED),
                     history=[params.message]
                 )
                 self.tasks[params.id] = task
             else:
-                # If task exists, add the new message to its history
+                # If task exists, add the new message to its history and
+                # mark it submitted again (a new turn; protects it from eviction)
                 task.history.append(params.message)
+                task.status = TaskStatus(state=TaskState.SUBMITTED)
+                self.tasks.move_to_end(params.id)
 
-            return task
+            self._state_since[params.id] = time.monotonic()
+            self._add_history_bytes(params.id, params.message)
+            self._record_change(task, params.message)
+            self._publish(task)
+
+        # Keep the store bounded between sweeps as well
+        if self._over_limits():
+            self._enforce_limits()
+        return task
 
     # -------------------------------------------------------------------------
-    # 🚫 on_send_task: Must be implemented by any subclass
+    # 🚫 invoke_agent: Must be implemented by any subclass
     # -------------------------------------------------------------------------
-    async def on_send_task(self, request: SendTaskRequest) -> SendTaskResponse:
+    async def invoke_agent(self, request: SendTaskRequest) -> str:
         """
-        This method is intentionally not implemented here.
-        Subclasses like `AgentTaskManager` should override it.
+        Run the agent for this request and return its reply text.
+        Subclasses like `AgentTaskManager` must override it.
 
         Raises:
             NotImplementedError: if someone tries to use it directly
         """
-        raise NotImplementedError("on_send_task() must be implemented in subclass")
+        raise NotImplementedError("invoke_agent() must be implemented in subclass")
+
+    # -------------------------------------------------------------------------
+    # 📥 on_send_task: Store the task, run the agent, record its reply
+    # -------------------------------------------------------------------------
+    async def on_send_task(self, request: SendTaskRequest) -> SendTaskResponse:
+        """
+        Handle a "tasks/send" request.
+
+        - Blocking mode: waits for the agent and returns the completed task.
+        - Background mode: returns the task as "working" right away; the
+          result shows up later via tasks/get.
+
+        `params.historyLength` limits how much history goes back, so a
+        long conversation isn't re-sent in full on every turn.
+        """
+        if request.params.pushNotification is not None and self.push_sender is None:
+            return SendTaskResponse(id=request.id, error=PushNotificationNotSupportedError())
+        if not self._claim_run(request.params.id):
+            return SendTaskResponse(id=request.id, error=task_running_error(request.params.id))
+
+        background = self._wants_background(request)
+        try:
+            with tracer.start_as_current_span(
+                "TaskManager.on_send_task",
+                attributes={"a2a.task_id": request.params.id, "a2a.background": background},
+            ):
+                task = await self.upsert_task(request.params)
+
+                if background:
+                    # The job inherits this span, so the agent's spans still nest under it
+                    snapshot = await self.update_task(task.id, TaskStatus(state=TaskState.WORKING))
+                    self._start_job(task.id, self._run_task(request, task), background=True)
+                else:
+                    await self._run_cancelable(task.id, self._run_task(request, task))
+                    snapshot = self.get_snapshot(task.id)
+        finally:
+            self._claimed.discard(request.params.id)  # From here on `running` tracks the run
+
+        result = self.trim_history(snapshot, request.params.historyLength)
+        return SendTaskResponse(id=request.id, result=result)
+
+    def _wants_background(self, request: SendTaskRequest) -> bool:
+        """Per-request `metadata.background` wins over the manager default."""
+        metadata = request.params.metadata or {}
+        return bool(metadata.get("background", self.background))
+
+    async def _run_task(self, request: SendTaskRequest, task: Task) -> None:
+        """
+        Invoke the agent and record the outcome on the task:
+        COMPLETED with the reply appended, or FAILED (and re-raise).
+        """
+        try:
+            reply_text = await self.invoke_agent(request)
+        except Exception as e:
+            await self.update_task(task.id, TaskStatus(
+                state=TaskState.FAILED,
+                message=Message(role="agent", parts=[TextPart(text=str(e))])
+            ))
+            raise
+
+        reply_message = Message(role="agent", parts=[TextPart(text=reply_text)])
+        await self.update_task(task.id, TaskStatus(state=TaskState.COMPLETED), reply_message)
+
+    # -------------------------------------------------------------------------
+    # 🏃 Tracked agent runs (what tasks/cancel stops)
+    # -------------------------------------------------------------------------
+    def _claim_run(self, task_id: str) -> bool:
+        """
+        Reserve `task_id` for a new agent run, before the first await.
+        False if a run for it is already in flight (or being set up): a second
+        job would replace it in `running`, and tasks/cancel could no longer
+        stop the first one. Callers discard the claim once the run is started.
+        """
+        if task_id in self.running or task_id in self._claimed:
+            return False
+        self._claimed.add(task_id)
+        return True
+
+    def _start_job(self, task_id: str, coro, background: bool = False) -> asyncio.Task:
+        """
+        Run `coro` (the agent's work on `task_id`) in a tracked asyncio task
+        that unregisters itself when done. Nobody awaits background jobs,
+        so their errors are logged here.
+        """
+        job = asyncio.create_task(self._record_cancel(task_id, coro))
+        self.running[task_id] = job
+
+        def _done(finished: asyncio.Task):
+            if self.running.get(task_id) is finished:
+                del self.running[task_id]
+            if finished.cancelled():
+                coro.close()           # Canceled before its first step, `coro` was never awaited
+            if background and not finished.cancelled() and finished.exception():
+                logger.error(f"Background task {task_id} failed: {finished.exception()}")
+
+        job.add_done_callback(_done)
+        return job
+
+    async def _record_cancel(self, task_id: str, coro):
+        """Await `coro`; if the run gets cancelled, mark the task canceled."""
+        try:
+            return await coro
+        except asyncio.CancelledError:
+            await self.update_task(task_id, canceled_status())
+            raise
+
+    async def _run_cancelable(self, task_id: str, coro) -> None:
+        """
+        Run `coro` as a tracked job and wait for it. A tasks/cancel just
+        ends the wait (the task is then "canceled"); agent errors re-raise.
+        """
+        job = self._start_job(task_id, coro)
+        try:
+            await asyncio.wait({job})
+        except asyncio.CancelledError:
+            job.cancel()               # Our caller went away: stop the agent too
+            raise
+        if not job.cancelled():
+            job.result()
+        else:
+            # Canceled before the job even started, so nothing recorded it yet
+            task = self.get_snapshot(task_id)
+            if task is not None and task.status.state in CANCELABLE_STATES:
+                await self.update_task(task_id, canceled_status())
+
+    async def _claimed_stream(
+        self, request: SendTaskStreamingRequest, events: AsyncIterable[SendTaskStreamingResponse]
+    ) -> AsyncIterable[SendTaskStreamingResponse]:
+        """
+        Stream `events` (a streamed send) only if no other run of its task is
+        in flight; otherwise the stream is a single error response.
+        """
+        task_id = request.params.id
+        if not self._claim_run(task_id):
+            yield SendTaskStreamingResponse(id=request.id, error=task_running_error(task_id))
+            return
+        try:
+            async for event in events:
+                yield event
+        finally:
+            await events.aclose()      # A client that went away stops the run right now
+            self._claimed.discard(task_id)
+
+    async def _cancelable_stream(
+        self, request: SendTaskStreamingRequest, events: AsyncIterable[SendTaskStreamingResponse]
+    ) -> AsyncIterable[SendTaskStreamingResponse]:
+        """
+        Re-yield a streaming agent run (`events`) while it runs as a tracked
+        job, so tasks/cancel can stop it mid-stream. If it is canceled, the
+        stream ends with the final "canceled" status event.
+        """
+        queue: asyncio.Queue = asyncio.Queue()
+        finished = object()
+
+        async def pump():
+            try:
+                async for event in events:
+                    queue.put_nowait(event)
+            finally:
+                queue.put_nowait(finished)
+
+        job = self._start_job(request.params.id, pump())
+        try:
+            while (event := await queue.get()) is not finished:
+                yield event
+        except BaseException:
+            job.cancel()               # The client stopped listening: stop the agent
+            raise
+
+        await asyncio.wait({job})
+        if not job.cancelled():
+            job.result()               # Re-raise the agent's error, if any
+            return
+        task = self.get_snapshot(request.params.id)
+        yield SendTaskStreamingResponse(
+            id=request.id,
+            result=TaskStatusUpdateEvent(id=task.id, status=task.status, final=True)
+        )
+
+    # -------------------------------------------------------------------------
+    # 🛑 on_cancel_task: Stop a running task
+    # -------------------------------------------------------------------------
+    async def on_cancel_task(self, request: CancelTaskRequest) -> CancelTaskResponse:
+        """
+        Handle "tasks/cancel": stop the agent run for this task (if one is
+        in flight) and mark the task "canceled".
+
+        Cancelling the run raises CancelledError inside invoke_agent(), so the
+        LLM call or child-agent call it was waiting on is abandoned (an
+        AgentConnector also cancels the child's task). We wait up to
+        `cancel_timeout` seconds for that cleanup before answering.
+
+        Returns:
+            CancelTaskResponse – the canceled task, TaskNotFoundError, or
+            TaskNotCancelableError if the task already finished
+        """
+        task_id = request.params.id
+        task = self.get_snapshot(task_id)
+        if task is None:
+            return CancelTaskResponse(id=request.id, error=TaskNotFoundError())
+        if task.status.state not in CANCELABLE_STATES:
+            return CancelTaskResponse(id=request.id, error=TaskNotCancelableError())
+
+        job = self.running.get(task_id)
+        if job is not None and not job.done():
+            job.cancel()
+            await asyncio.wait({job}, timeout=self.cancel_timeout)
+
+        task = self.get_snapshot(task_id)
+        if task.status.state in CANCELABLE_STATES:
+            # No run to record it (e.g. input-required), or it's still unwinding
+            task = await self.update_task(task_id, canceled_status())
+        elif task.status.state != TaskState.CANCELED:
+            # The run finished on its own before the cancel landed
+            return CancelTaskResponse(id=request.id, error=TaskNotCancelableError())
+        return CancelTaskResponse(id=request.id, result=task)
+
+    async def aclose(self) -> None:
+        """Stop the sweeper, cancel agent runs still in flight, stop push delivery."""
+        if self._sweeper is not None:
+            self._sweeper.cancel()
+        for job in list(self.running.values()):
+            job.cancel()
+        if self.running:
+            await asyncio.gather(*self.running.values(), return_exceptions=True)
+        if self.push_sender is not None:
+            await self.push_sender.aclose()
+
+    # -------------------------------------------------------------------------
+    # 📬 Push notifications: register / read a task's webhook
+    # -------------------------------------------------------------------------
+    async def on_set_task_push_notification(
+        self, request: SetTaskPushNotificationRequest
+    ) -> SetTaskPushNotificationResponse:
+        """
+        Handle "tasks/pushNotification/set": from now on every change of the
+        task is POSTed to the webhook. The current state is sent right away,
+        so a task that finished before the webhook was set isn't missed.
+        """
+        if self.push_sender is None:
+            return SetTaskPushNotificationResponse(id=request.id, error=PushNotificationNotSupportedError())
+
+        params: TaskPushNotificationConfig = request.params
+        async with self.lock_for(params.id):
+            task = self.get_snapshot(params.id)
+            if task is None:
+                return SetTaskPushNotificationResponse(id=request.id, error=TaskNotFoundError())
+            self.push_configs[params.id] = params.pushNotificationConfig
+            self.push_sender.notify(params.pushNotificationConfig, task)
+        return SetTaskPushNotificationResponse(id=request.id, result=params)
+
+    async def on_get_task_push_notification(
+        self, request: GetTaskPushNotificationRequest
+    ) -> GetTaskPushNotificationResponse:
+        """Handle "tasks/pushNotification/get" (result is null if none is set)."""
+        if self.push_sender is None:
+            return GetTaskPushNotificationResponse(id=request.id, error=PushNotificationNotSupportedError())
+        if self.get_snapshot(request.params.id) is None:
+            return GetTaskPushNotificationResponse(id=request.id, error=TaskNotFoundError())
+
+        config = self.push_configs.get(request.params.id)
+        result = None if config is None else TaskPushNotificationConfig(
+            id=request.params.id, pushNotificationConfig=config
+        )
+        return GetTaskPushNotificationResponse(id=request.id, result=result)
+
+    # -------------------------------------------------------------------------
+    # 📡 on_send_task_subscribe: Stream task updates (default implementation)
+    # -------------------------------------------------------------------------
+    async def on_send_task_subscribe(
+        self, request: SendTaskStreamingRequest
+    ) -> AsyncIterable[SendTaskStreamingResponse] | JSONRPCResponse:
+        """
+        Default streaming for agents that only produce a single reply.
+
+        Emits a "working" status right away (fast first byte), then runs
+        invoke_agent() and streams the reply as an artifact followed by
+        the final status. Subclasses with a real streaming agent override this.
+
+        Returns:
+            An async generator of SendTaskStreamingResponse events
+        """
+        return self._claimed_stream(request, self._stream_single_reply(request))
+
+    async def _stream_single_reply(
+        self, request: SendTaskStreamingRequest
+    ) -> AsyncIterable[SendTaskStreamingResponse]:
+        task_id = request.params.id
+
+        # 1) Tell the client right away that we're on it
+        yield SendTaskStreamingResponse(
+            id=request.id,
+            result=TaskStatusUpdateEvent(
+                id=task_id, status=TaskStatus(state=TaskState.WORKING)
+            )
+        )
+
+        # 2) Store the task and run the agent to completion (or until canceled)
+        task = await self.upsert_task(request.params)
+        send_request = SendTaskRequest(id=request.id, params=request.params)
+        await self._run_cancelable(task_id, self._run_task(send_request, task))
+        task = self.get_snapshot(task_id)
+
+        # 3) Send the agent's reply as a single artifact, then the final status
+        reply = task.history[-1] if task.history else None
+        if reply is not None and reply.role == "agent":
+            yield SendTaskStreamingResponse(
+                id=request.id,
+                result=TaskArtifactUpdateEvent(
+                    id=task_id, artifact=Artifact(parts=reply.parts, lastChunk=True)
+                )
+            )
+        yield SendTaskStreamingResponse(
+            id=request.id,
+            result=TaskStatusUpdateEvent(id=task_id, status=task.status, final=True)
+        )
 
     # -------------------------------------------------------------------------
     # 📥 on_get_task: Fetch a task by its ID
@@ -136,24 +831,24 @@ class InMemoryTaskManager(TaskManager):
         Look up a task using its ID, and optionally return only recent messages.
 
         Args:
-            request: A GetTaskRequest with an ID and optional history length
+            request: A GetTaskRequest with an ID, an optional history length
+                     and an optional `historySince` cursor (only messages
+                     added after the first `historySince`). The next cursor
+                     is historySince + len(history) unless historyLength
+                     trimmed the reply (len(history) == historyLength).
 
         Returns:
             GetTaskResponse – contains the task if found, or an error message
         """
-        async with self.lock:
-            query: TaskQueryParams = request.params
-            task = self.tasks.get(query.id)
+        query: TaskQueryParams = request.params
+        # Snapshots are never modified after publishing, so no lock is needed
+        task = self.get_snapshot(query.id)
 
-            if not task:
-                # If task not found, return a structured error
-                return GetTaskResponse(id=request.id, error={"message": "Task not found"})
+        if not task:
+            # If task not found, return a structured error
+            return GetTaskResponse(id=request.id, error=TaskNotFoundError())
 
-            # Optional: Trim the history to only show the last N messages
-            task_copy = task.model_copy()  # Make a copy so we don't affect the original
-            if query.historyLength is not None:
-                task_copy.history = task_copy.history[-query.historyLength:]  # Get last N messages
-            else:
-                task_copy.history = task_copy.history
+        # Optional: only new messages (cursor) and/or only the last N messages
+        task = self.trim_history(task, query.historyLength, query.historySince)
 
-            return GetTaskResponse(id=request.id, result=task_copy)
+        return GetTaskResponse(id=request.id, result=task)
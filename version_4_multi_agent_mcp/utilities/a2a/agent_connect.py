@@ -5,19 +5,53 @@
 # Provides a simple wrapper (`AgentConnector`) around the A2AClient to send tasks
 # to any remote agent identified by a base URL. This decouples the Orchestrator
 # from low-level HTTP details and HTTP client setup.
+#
+# In background mode the remote agent returns immediately and the connector
+# polls tasks/get until the task finishes, so no HTTP request is held open
+# for the whole length of a slow child task.
+#
+# If the caller is cancelled while waiting (e.g. the orchestrator's own task
+# got a tasks/cancel), the connector sends tasks/cancel to the child agent
+# too, so the child stops spending model tokens on an abandoned request.
+#
+# Every delegation is timed per child agent and counted by outcome (see
+# GET /metrics) and traced as a client span, so the slow hop in a
+# multi-agent chain is easy to find.
 # =============================================================================
 
+import asyncio                        # Retry-After waits; cancellation handling
 import uuid                           # Standard library for generating unique IDs
 import logging                        # Standard library for configurable logging
+import time                           # Delegation latency for metrics
 
 # Import our custom A2AClient which handles JSON-RPC task requests
-from client.client import A2AClient
+from client.client import A2AClient, A2AClientBusyError, A2AClientHTTPError, A2AClientRPCError
 # Import Task model to represent the full task response
 from models.task import Task
+# Process-wide metrics served by A2AServer at GET /metrics
+from server.metrics import Counter, Histogram
+# OpenTelemetry spans; the client passes the trace on to the child agent
+from server.tracing import tracer
+from opentelemetry.trace import SpanKind
 
 # Create a logger for this module using its namespace
 logger = logging.getLogger(__name__)
 
+# 📊 Delegation metrics, labeled with the child agent's name
+DELEGATION_LATENCY = Histogram(
+    "a2a_delegation_duration_seconds",
+    "Time for a child agent to finish a delegated task (incl. busy retries and polling)",
+    ("agent",),
+)
+DELEGATIONS = Counter(
+    "a2a_delegations_total",
+    "Tasks delegated to child agents by outcome (ok, error, busy, canceled)",
+    ("agent", "outcome"),
+)
+DELEGATION_BUSY_RETRIES = Counter(
+    "a2a_delegation_busy_retries_total", "Retries after a child agent answered busy", ("agent",)
+)
+
 
 class AgentConnector:
     """
@@ -26,20 +60,45 @@ class AgentConnector:
     Attributes:
         name (str): Human-readable identifier of the remote agent.
         client (A2AClient): HTTP client pointing at the agent's URL.
+        background (bool): Ask the agent to run tasks in the background and poll.
+        busy_retries (int): Retries after the agent sheds a request as busy.
+        cancel_timeout (float): Max seconds spent telling the child to cancel.
     """
 
-    def __init__(self, name: str, base_url: str):
+    def __init__(
+        self,
+        name: str,
+        base_url: str,
+        background: bool = False,
+        busy_retries: int = 2,
+        cancel_timeout: float = 5.0,
+    ):
         """
         Initialize the connector for a specific remote agent.
 
         Args:
             name (str): Identifier for the agent (e.g., "TellTimeAgent").
             base_url (str): The HTTP endpoint (e.g., "http://localhost:10000").
+            background (bool): If True, send tasks with metadata
+                {"background": true} and poll tasks/get for the result.
+            busy_retries (int): How many times to back off (honoring the
+                agent's Retry-After) and resend when the agent is at capacity.
         """
         # Store the agent’s name for logging and reference
         self.name = name
-        # Instantiate an A2AClient bound to the agent’s base URL
+        # Whether to use non-blocking send + polling
+        self.background = background
+        # How often to retry a request the agent rejected as busy
+        self.busy_retries = busy_retries
+        # How long to wait for the child to confirm a propagated cancel
+        self.cancel_timeout = cancel_timeout
+        # Instantiate an A2AClient bound to the agent’s base URL.
+        # It keeps a pooled HTTP client, so repeated delegations reuse connections.
         self.client = A2AClient(url=base_url)
+        # send_task calls in progress; set while there are none (see aclose_when_idle)
+        self._in_flight = 0
+        self._idle = asyncio.Event()
+        self._idle.set()
         # Log that the connector is ready for use
         logger.info(f"AgentConnector: initialized for {self.name} at {base_url}")
 
@@ -52,7 +111,7 @@ class AgentConnector:
             session_id (str): Session identifier to group related calls.
 
         Returns:
-            Task: The full Task object (including history) from the remote agent.
+            Task: The Task from the remote agent; its history holds just the reply.
         """
         # Generate a unique ID for this task using uuid4, hex form
         task_id = uuid.uuid4().hex
@@ -60,6 +119,7 @@ class AgentConnector:
         payload = {
             "id": task_id,
             "sessionId": session_id,
+            "historyLength": 1,                  # Only the reply is needed, not the transcript
             "message": {
                 "role": "user",                # Indicates this message is from the user
                 "parts": [                       # Wrap the text in a list of parts
@@ -67,10 +127,76 @@ class AgentConnector:
                 ]
             }
         }
+        if self.background:
+            payload["metadata"] = {"background": True}
 
-        # Use the A2AClient to send the task asynchronously and await the response
-        task_result = await self.client.send_task(payload)
+        started = time.perf_counter()
+        outcome = "error"
+        self._in_flight += 1
+        self._idle.clear()
+        try:
+            # One client span per delegation; its traceparent goes to the child agent
+            with tracer.start_as_current_span(
+                f"AgentConnector.send_task {self.name}",
+                kind=SpanKind.CLIENT,
+                attributes={"a2a.agent": self.name, "a2a.task_id": task_id},
+            ):
+                # Use the A2AClient to send the task asynchronously and await the response.
+                # If the agent is at capacity, wait as long as it asks and try again.
+                for attempt in range(self.busy_retries + 1):
+                    try:
+                        task_result = await self.client.send_task(payload)
+                        break
+                    except A2AClientBusyError as e:
+                        if attempt == self.busy_retries:
+                            raise
+                        logger.warning(f"AgentConnector: {self.name} busy, retrying in {e.retry_after}s")
+                        DELEGATION_BUSY_RETRIES.inc(agent=self.name)
+                        await asyncio.sleep(e.retry_after)
+                # In background mode the agent answered right away; poll until it's done
+                if self.background:
+                    task_result = await self.client.wait_for_task(task_id, history_length=1)
+            outcome = "ok"
+        except A2AClientBusyError:
+            outcome = "busy"
+            raise
+        except asyncio.CancelledError:
+            # We were cancelled mid-delegation: cancel the child's task as well
+            outcome = "canceled"
+            await self._cancel_child(task_id)
+            raise
+        finally:
+            DELEGATIONS.inc(agent=self.name, outcome=outcome)
+            DELEGATION_LATENCY.observe(time.perf_counter() - started, agent=self.name)
+            self._in_flight -= 1
+            if self._in_flight == 0:
+                self._idle.set()
         # Log receipt of the completed task for debugging/tracing
         logger.info(f"AgentConnector: received response from {self.name} for task {task_id}")
         # Return the Task Pydantic model for further processing by the orchestrator
         return task_result
+
+    async def _cancel_child(self, task_id: str) -> None:
+        """Best-effort tasks/cancel for a delegated task (never raises)."""
+        try:
+            await asyncio.wait_for(self.client.cancel_task({"id": task_id}), self.cancel_timeout)
+            logger.info(f"AgentConnector: canceled task {task_id} on {self.name}")
+        except (A2AClientRPCError, A2AClientHTTPError, asyncio.TimeoutError) as e:
+            # Unknown (not started yet) or already finished: nothing left to stop
+            logger.info(f"AgentConnector: could not cancel task {task_id} on {self.name}: {e}")
+        except Exception as e:
+            logger.warning(f"AgentConnector: cancel of task {task_id} on {self.name} failed: {e}")
+
+    async def aclose(self):
+        """
+        Close the underlying A2AClient and its pooled HTTP connections.
+        """
+        await self.client.aclose()
+
+    async def aclose_when_idle(self):
+        """
+        Close the connector once no send_task call is in progress, so a
+        connector that is dropped while delegations are running lets them finish.
+        """
+        await self._idle.wait()
+        await self.aclose()
@@ -5,20 +5,47 @@
 # It reads a registry of agent base URLs (from a JSON file) and fetches
 # each agent's metadata (AgentCard) from the standard discovery endpoint.
 # This allows any client or agent to dynamically learn about available agents.
+#
+# All URLs are queried concurrently (bounded by a semaphore), each with its own
+# deadline, so one slow or dead agent never stalls discovery of the others.
 # =============================================================================
 
 import os                            # os provides functions for interacting with the operating system, such as file paths
 import json                          # json allows encoding and decoding JSON data
+import time                          # time.perf_counter measures how long each lookup took
+import asyncio                       # asyncio runs the per-URL lookups concurrently
 import logging                       # logging is used to record warning/error/info messages
 from typing import List             # List is a type hint for functions that return lists
 
 import httpx                         # httpx is an async HTTP client library for sending requests
+from pydantic import BaseModel       # BaseModel describes the per-agent discovery result
 from models.agent import AgentCard   # AgentCard is a Pydantic model representing an agent's metadata
 
 # Create a named logger for this module; __name__ is the module's name
 logger = logging.getLogger(__name__)
 
 
+class DiscoveryResult(BaseModel):
+    """
+    📋 Outcome of looking up one registry URL.
+
+    Attributes:
+        url (str): Base URL from the registry.
+        card (AgentCard | None): The agent's card, if it was retrieved.
+        error (str | None): Why the lookup failed, if it did.
+        elapsed (float): Seconds spent on this URL.
+    """
+    url: str
+    card: AgentCard | None = None
+    error: str | None = None
+    elapsed: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        """True if the card was retrieved successfully."""
+        return self.card is not None
+
+
 class DiscoveryClient:
     """
     🔍 Discovers A2A agents by reading a registry file of URLs and querying
@@ -27,16 +54,31 @@ class DiscoveryClient:
     Attributes:
         registry_file (str): Path to the JSON file listing base URLs (strings).
         base_urls (List[str]): Loaded list of agent base URLs.
+        timeout (float): Deadline in seconds for each individual URL.
+        max_concurrency (int): Maximum number of URLs queried at once.
     """
 
-    def __init__(self, registry_file: str = None):
+    def __init__(
+        self,
+        registry_file: str = None,
+        timeout: float = 5.0,
+        max_concurrency: int = 10
+    ):
         """
         Initialize the DiscoveryClient.
 
         Args:
             registry_file (str, optional): Path to the registry JSON. If None,
                 defaults to 'agent_registry.json' in this utilities folder.
+            timeout (float): Per-URL deadline in seconds (connect + read + parse).
+            max_concurrency (int): How many agents to query in parallel.
         """
+        self.timeout = timeout
+        self.max_concurrency = max_concurrency
+        # Validators from the last successful fetch, per card URL:
+        # url → (ETag, Last-Modified, AgentCard). Used for conditional GETs.
+        self._validators: dict[str, tuple[str | None, str | None, AgentCard]] = {}
+
         # If the caller provided a custom path, use it; otherwise, build the default path
         if registry_file:
             self.registry_file = registry_file
@@ -76,33 +118,86 @@ class DiscoveryClient:
             logger.error(f"Error parsing registry file: {e}")
             return []
 
+    async def _fetch_card(
+        self,
+        client: httpx.AsyncClient,
+        semaphore: asyncio.Semaphore,
+        base: str
+    ) -> DiscoveryResult:
+        """
+        Fetch and parse one agent's card, never raising: failures and
+        timeouts are reported in the returned DiscoveryResult.
+
+        If the card was fetched before, the request is conditional
+        (If-None-Match / If-Modified-Since) and a 304 reuses the cached card.
+        """
+        # Normalize URL (remove trailing slash) and append the discovery path
+        url = base.rstrip("/") + "/.well-known/agent.json"
+        headers = {}
+        cached = self._validators.get(url)
+        if cached:
+            etag, last_modified, _ = cached
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                # Hard deadline for the whole lookup, even if the agent trickles bytes
+                response = await asyncio.wait_for(
+                    client.get(url, headers=headers), timeout=self.timeout
+                )
+                if response.status_code == 304 and cached:
+                    # Card unchanged since the last sweep: reuse it, no parsing
+                    card = cached[2]
+                else:
+                    # Raise an exception if the response status is 4xx or 5xx
+                    response.raise_for_status()
+                    # Parse the JSON bytes straight into an AgentCard Pydantic model
+                    card = AgentCard.model_validate_json(response.content)
+                    etag = response.headers.get("ETag")
+                    last_modified = response.headers.get("Last-Modified")
+                    if etag or last_modified:
+                        self._validators[url] = (etag, last_modified, card)
+                    else:
+                        self._validators.pop(url, None)
+                return DiscoveryResult(
+                    url=base, card=card, elapsed=time.perf_counter() - started
+                )
+            except asyncio.TimeoutError:
+                error = f"timed out after {self.timeout}s"
+            except Exception as e:
+                error = str(e) or type(e).__name__
+            # If anything goes wrong, log which URL failed and why
+            logger.warning(f"Failed to discover agent at {url}: {error}")
+            return DiscoveryResult(
+                url=base, error=error, elapsed=time.perf_counter() - started
+            )
+
+    async def discover(self) -> List[DiscoveryResult]:
+        """
+        Query every registered URL concurrently and report per-agent status.
+
+        Returns:
+            List[DiscoveryResult]: One result per registry URL, in registry order.
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        limits = httpx.Limits(max_connections=self.max_concurrency)
+        # Create a new AsyncClient and ensure it's closed when done
+        async with httpx.AsyncClient(limits=limits, timeout=self.timeout) as client:
+            return list(await asyncio.gather(
+                *(self._fetch_card(client, semaphore, base) for base in self.base_urls)
+            ))
+
     async def list_agent_cards(self) -> List[AgentCard]:
         """
         Asynchronously fetch the discovery endpoint from each registered URL
         and parse the returned JSON into AgentCard objects.
 
+        Agents that fail or time out are skipped (see discover() for details).
+
         Returns:
             List[AgentCard]: Successfully retrieved agent cards.
         """
-        cards: List[AgentCard] = []  # Prepare an empty list to collect AgentCard instances
-
-        # Create a new AsyncClient and ensure it's closed when done
-        async with httpx.AsyncClient() as client:
-            # Iterate through each base URL in the registry
-            for base in self.base_urls:
-                # Normalize URL (remove trailing slash) and append the discovery path
-                url = base.rstrip("/") + "/.well-known/agent.json"
-                try:
-                    # Send a GET request to the discovery endpoint with a timeout
-                    response = await client.get(url, timeout=5.0)
-                    # Raise an exception if the response status is 4xx or 5xx
-                    response.raise_for_status()
-                    # Convert the JSON response into an AgentCard Pydantic model
-                    card = AgentCard.model_validate(response.json())
-                    # Add the valid AgentCard to our list
-                    cards.append(card)
-                except Exception as e:
-                    # If anything goes wrong, log which URL failed and why
-                    logger.warning(f"Failed to discover agent at {url}: {e}")
-        # Return the list of successfully fetched AgentCards
-        return cards
+        return [result.card for result in await self.discover() if result.ok]
@@ -5,19 +5,30 @@
 #   Connect to each MCP server defined in mcp_config.json,
 #   open ephemeral sessions to list available tools, and
 #   provide an easy interface to call those tools on demand.
+#
+#   Tool calls go through a long-lived, per-server MCPServerSession so the
+#   MCP server subprocess and its initialize() handshake are paid once,
+#   not on every call. Each call is timed per server/tool (GET /metrics).
 # =============================================================================
 
 import os  # For accessing environment variables and file paths
 import asyncio  # For running asynchronous functions and event loop
 import logging  # For logging informational messages and warnings
+import anyio  # Stream exceptions raised by MCP when a connection breaks
 from dotenv import load_dotenv  # To load environment variables from a .env file
 
 # Import MCP core classes for stdio communication and session handling
 from mcp import ClientSession, StdioServerParameters
 from mcp.client.stdio import stdio_client
+from mcp.shared.exceptions import McpError
 
 # Local utility to read MCP server configuration
 from utilities.mcp.mcp_discovery import MCPDiscovery
+# Process-wide metrics served by A2AServer at GET /metrics
+from server.metrics import Counter, Histogram
+# OpenTelemetry spans (no-op unless tracing is set up)
+from server.tracing import tracer
+from opentelemetry.trace import SpanKind
 
 # Load environment variables (e.g., API keys) from .env into os.environ
 load_dotenv()
@@ -28,6 +39,167 @@ logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO)
 
 
+class MCPServerSession:
+    """
+    🔌 Keeps one initialized MCP ClientSession open for a single server and
+    shares it across tool calls.
+
+    - The session is opened lazily on the first call, inside the running
+      event loop (the server's loop, not the one used for tool discovery).
+    - A background "holder" task owns the stdio_client/ClientSession context
+      managers, because anyio requires them to be entered and exited by the
+      same task.
+    - A semaphore caps how many calls may be in flight on this server.
+    - If opening the session fails, it is tried once more. If the connection
+      breaks after a call was sent (e.g., the subprocess died), the call is
+      not re-sent (it may already have run): the error is raised and the
+      next call reconnects.
+
+    Attributes:
+        name (str): Server name from mcp_config.json (e.g., "terminal").
+        max_concurrency (int): Maximum simultaneous calls to this server.
+    """
+
+    # Exceptions that mean the underlying stdio pipe is gone
+    BROKEN_ERRORS = (
+        anyio.ClosedResourceError,
+        anyio.BrokenResourceError,
+        anyio.EndOfStream,
+        BrokenPipeError,
+        ConnectionError,
+    )
+
+    def __init__(
+        self,
+        name: str,
+        params: StdioServerParameters,
+        max_concurrency: int = 4
+    ):
+        self.name = name
+        self.max_concurrency = max_concurrency
+        self._params = params
+        # Caps in-flight calls to this server
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        # Serializes (re)connects so concurrent callers share one session
+        self._connect_lock = asyncio.Lock()
+        self._session: ClientSession | None = None
+        self._holder: asyncio.Task | None = None
+        self._closing: asyncio.Event | None = None
+
+    def _is_broken(self, error: Exception) -> bool:
+        """True if `error` means the connection is gone (not a tool failure)."""
+        if isinstance(error, self.BROKEN_ERRORS):
+            return True
+        # MCP reports a dead read stream as a "Connection closed" McpError
+        if isinstance(error, McpError) and "connection closed" in str(error).lower():
+            return True
+        # The holder exiting means the server process or its pipes went away
+        return not self._is_open()
+
+    def _is_open(self) -> bool:
+        """True if the session is initialized and its holder task is alive."""
+        return (
+            self._session is not None
+            and self._holder is not None
+            and not self._holder.done()
+        )
+
+    async def _hold(self, ready: asyncio.Future, closing: asyncio.Event):
+        """
+        Background task: spawn the server, initialize the session, hand it
+        to the caller via `ready`, then keep it open until `closing` is set.
+        """
+        try:
+            async with stdio_client(self._params) as (read_stream, write_stream):
+                async with ClientSession(read_stream, write_stream) as sess:
+                    await sess.initialize()
+                    logger.info(f"[MCPServerSession] Connected to MCP server: {self.name}")
+                    if not ready.done():
+                        ready.set_result(sess)
+                    await closing.wait()
+        except Exception as e:
+            if not ready.done():
+                ready.set_exception(e)
+            else:
+                logger.warning(f"[MCPServerSession] Connection to {self.name} lost: {e}")
+        finally:
+            if not ready.done():
+                ready.cancel()
+
+    async def _open(self) -> ClientSession:
+        """Return the live session, (re)connecting first if needed."""
+        async with self._connect_lock:
+            if self._is_open():
+                return self._session
+            await self._close_current()
+            ready = asyncio.get_running_loop().create_future()
+            self._closing = asyncio.Event()
+            self._holder = asyncio.create_task(self._hold(ready, self._closing))
+            self._session = await ready
+            return self._session
+
+    async def _close_current(self):
+        """Ask the holder task to exit its context managers and wait for it."""
+        if self._closing is not None:
+            self._closing.set()
+        if self._holder is not None:
+            try:
+                await self._holder
+            except BaseException as e:
+                logger.debug(f"[MCPServerSession] Holder for {self.name} exited with: {e}")
+        self._session = None
+        self._holder = None
+        self._closing = None
+
+    async def _reset(self, broken: ClientSession):
+        """Drop `broken` unless another caller already replaced it."""
+        async with self._connect_lock:
+            if self._session is broken:
+                await self._close_current()
+
+    async def call_tool(self, tool_name: str, args: dict):
+        """
+        Call a tool on this server over the shared session.
+
+        Only a failure to open the session is retried (nothing was sent
+        yet). If the connection breaks once the request is out, the server
+        may already have run the tool, and tools like `run_command` are not
+        idempotent: the session is dropped so the next call reconnects, and
+        the error is raised to the caller.
+        """
+        async with self._semaphore:
+            try:
+                sess = await self._open()
+            except Exception as e:
+                logger.warning(
+                    f"[MCPServerSession] Retrying connect to {self.name} after error: {e}"
+                )
+                sess = await self._open()
+
+            try:
+                return await sess.call_tool(tool_name, args)
+            except Exception as e:
+                if self._is_broken(e):
+                    logger.warning(
+                        f"[MCPServerSession] Connection to {self.name} broke during {tool_name}; "
+                        f"not re-sending it: {e}"
+                    )
+                    await self._reset(sess)
+                raise
+
+    async def aclose(self):
+        """Close the session and stop the MCP server subprocess."""
+        async with self._connect_lock:
+            await self._close_current()
+
+
+# 📊 MCP tool call metrics, labeled with the server and tool name
+TOOL_CALL_LATENCY = Histogram(
+    "mcp_tool_call_duration_seconds", "Time for an MCP tool call to return", ("server", "tool")
+)
+TOOL_CALLS = Counter("mcp_tool_calls_total", "MCP tool calls by outcome (ok, error)", ("server", "tool", "outcome"))
+
+
 class MCPTool:
     """
     🛠️ Wraps a single MCP-exposed tool so we can call it easily.
@@ -36,48 +208,46 @@ class MCPTool:
         name (str): Identifier for the tool (e.g., "run_command").
         description (str): Human-readable description of the tool.
         input_schema (dict): JSON schema defining the tool's expected arguments.
-        _params (StdioServerParameters): Command/args to start the MCP server.
+        _session (MCPServerSession): Shared session for the server hosting this tool.
     """
     def __init__(
         self,
         name: str,
         description: str,
         input_schema: dict,
-        server_cmd: str,
-        server_args: list[str]
+        session: MCPServerSession
     ):
         # Store the tool's name and description for later reference
         self.name = name
         self.description = description
         # Save the JSON schema to validate the `args` passed to run()
         self.input_schema = input_schema
-        # Prepare stdio connection params so we can spawn the server on each call
-        self._params = StdioServerParameters(
-            command=server_cmd,
-            args=server_args
-        )
+        # Reuse the server's long-lived session instead of spawning a new one
+        self._session = session
 
     async def run(self, args: dict) -> str:
         """
-        Invoke the tool by:
-          1. Spawning the MCP server via stdio
-          2. Initializing an MCP ClientSession
-          3. Calling the named tool with provided arguments
-          4. Closing the session automatically on exit
+        Invoke the tool over its server's shared MCP session.
+        The session is started on first use and reused afterwards.
 
         Returns:
             The `content` from the tool's response, or the raw response if no content.
         """
-        # Create a stdio connection to the MCP server (ephemeral session)
-        async with stdio_client(self._params) as (read_stream, write_stream):
-            # Wrap the stdio streams in an MCP ClientSession
-            async with ClientSession(read_stream, write_stream) as sess:
-                # Perform any handshake or setup required by MCP
-                await sess.initialize()
-                # Call the tool on the server with given arguments
-                resp = await sess.call_tool(self.name, args)
-                # Return the `content` attribute if present, else string-ify the response
-                return getattr(resp, "content", str(resp))
+        # Call the tool on the server with given arguments (timed for GET /metrics)
+        labels = {"server": self._session.name, "tool": self.name}
+        outcome = "error"
+        try:
+            with tracer.start_as_current_span(
+                f"MCPTool.run {self.name}",
+                kind=SpanKind.CLIENT,
+                attributes={"mcp.server": self._session.name, "mcp.tool": self.name},
+            ), TOOL_CALL_LATENCY.time(**labels):
+                resp = await self._session.call_tool(self.name, args)
+            outcome = "ok"
+        finally:
+            TOOL_CALLS.inc(outcome=outcome, **labels)
+        # Return the `content` attribute if present, else string-ify the response
+        return getattr(resp, "content", str(resp))
 
 
 class MCPConnector:
@@ -89,12 +259,17 @@ class MCPConnector:
         connector = MCPConnector()
         tools = connector.get_tools()
         result = await tools[0].run({"arg1": "value"})
+        await connector.aclose()
     """
-    def __init__(self, config_file: str = None):
+    def __init__(self, config_file: str = None, max_concurrency: int = 4):
         # Initialize MCPDiscovery to load server definitions from JSON
         self.discovery = MCPDiscovery(config_file=config_file)
         # Prepare an empty list to hold MCPTool objects
         self.tools: list[MCPTool] = []
+        # One long-lived session per MCP server (server name → session)
+        self.sessions: dict[str, MCPServerSession] = {}
+        # Maximum concurrent tool calls per MCP server
+        self.max_concurrency = max_concurrency
         # Load tools from all configured MCP servers immediately
         self._load_all_tools()
 
@@ -115,6 +290,12 @@ class MCPConnector:
                 logger.info(f"[MCPConnector] Fetching tools from MCP server: {name}")
                 # Prepare parameters for stdio_client
                 params = StdioServerParameters(command=cmd, args=args)
+                # Shared session that every tool on this server will reuse
+                session = MCPServerSession(
+                    name=name,
+                    params=params,
+                    max_concurrency=self.max_concurrency
+                )
                 try:
                     # Open a stdio connection to the MCP server
                     async with stdio_client(params) as (r, w):
@@ -131,10 +312,10 @@ class MCPConnector:
                                         name=t.name,
                                         description=t.description,
                                         input_schema=t.inputSchema,
-                                        server_cmd=cmd,
-                                        server_args=args
+                                        session=session
                                     )
                                 )
+                            self.sessions[name] = session
                             logger.info(
                                 f"[MCPConnector] Loaded {len(tool_list)} tools from {name}"
                             )
@@ -153,3 +334,11 @@ class MCPConnector:
         Ensures external code cannot modify our internal cache.
         """
         return self.tools.copy()
+
+    async def aclose(self):
+        """
+        Close every pooled MCP session (and its server subprocess).
+        Call this when the owning agent shuts down.
+        """
+        for session in self.sessions.values():
+            await session.aclose()
@@ -27,8 +27,13 @@ from google.genai import types
 from google.adk.tools.function_tool import FunctionTool
 
 # Utilities we wrote for agent discovery and HTTP connection:
-from utilities.a2a.agent_discovery import DiscoveryClient
-from utilities.a2a.agent_connect import AgentConnector
+from utilities.a2a.agent_catalog import AgentCatalog
+
+# OpenTelemetry tracer (ADK's LLM/tool spans and delegations nest under invoke)
+from server.tracing import tracer
+
+# Gemini by default; a deterministic offline fake with A2A_LLM_BACKEND=fake
+from utilities.llm.fake_llm import model_from_env
 
 # Create a module-level logger using this file’s name
 logger = logging.getLogger(__name__)
@@ -66,11 +71,9 @@ class GreetingAgent:
             memory_service=InMemoryMemoryService(),           # conversation memory
         )
 
-        # A helper client to discover what agents are registered
-        self.discovery = DiscoveryClient()
-
-        # Cache for created connectors so we reuse them
-        self.connectors: dict[str, AgentConnector] = {}
+        # Cached catalog of registered agents (and their connectors).
+        # Refreshes itself in the background, so tool calls don't hit discovery.
+        self.catalog = AgentCatalog()
 
 
     def _build_orchestrator(self) -> LlmAgent:
@@ -84,8 +87,8 @@ class GreetingAgent:
             Fetch all AgentCard metadata from the registry,
             return as a list of plain dicts.
             """
-            # Ask DiscoveryClient for all cards (returns Pydantic models)
-            cards = await self.discovery.list_agent_cards()
+            # Ask the catalog for all cards (returns Pydantic models)
+            cards = await self.catalog.list_cards()
             # Convert each card to a dict (dropping None fields)
             return [card.model_dump(exclude_none=True) for card in cards]
 
@@ -96,38 +99,23 @@ class GreetingAgent:
             Given an agent_name string and a user message,
             find that agent’s URL, send the task, and return its reply.
             """
-            # Re-fetch registry each call to catch new agents dynamically
-            cards = await self.discovery.list_agent_cards()
-
-            # Try to match exactly by name or id (case-insensitive)
-            matched = next(
-                (c for c in cards
-                 if c.name.lower() == agent_name.lower()
-                 or getattr(c, "id", "").lower() == agent_name.lower()),
-                None
-            )
+            # Exact (case-insensitive) lookup in the cached catalog – no HTTP here
+            connector = await self.catalog.get_connector(agent_name)
 
             # Fallback: substring match if no exact found
-            if not matched:
+            if connector is None:
                 matched = next(
-                    (c for c in cards if agent_name.lower() in c.name.lower()),
+                    (c for c in await self.catalog.list_cards()
+                     if agent_name.lower() in c.name.lower()),
                     None
                 )
+                if matched:
+                    connector = await self.catalog.get_connector(matched.name)
 
             # If still nothing, error out
-            if not matched:
+            if connector is None:
                 raise ValueError(f"Agent '{agent_name}' not found.")
 
-            # Use Pydantic model’s name field as key
-            key = matched.name
-            # If we haven’t built a connector yet, create and cache one
-            if key not in self.connectors:
-                self.connectors[key] = AgentConnector(
-                    name=matched.name,
-                    base_url=matched.url
-                )
-            connector = self.connectors[key]
-
             # Use a single session per greeting agent run (could be improved)
             session_id = self.user_id
 
@@ -160,7 +148,11 @@ class GreetingAgent:
 
         # Finally, create and return the LlmAgent with everything wired up
         return LlmAgent(
-            model="gemini-1.5-flash-latest",               # which Gemini model
+            # which Gemini model (the offline fake follows the same tool steps)
+            model=model_from_env("gemini-1.5-flash-latest", tool_plan=[
+                {"name": "list_agents"},
+                {"name": "call_agent", "args": {"agent_name": "TellTimeAgent", "message": "What is the current time?"}},
+            ]),
             name="greeting_orchestrator",                  # internal name
             description="Orchestrates time fetching and generates poetic greetings.",
             instruction=system_instr,                      # system prompt
@@ -168,6 +160,7 @@ class GreetingAgent:
         )
 
 
+    @tracer.start_as_current_span("GreetingAgent.invoke")
     async def invoke(self, query: str, session_id: str) -> str:
         """
         🔄 Public: send a user query through the orchestrator LLM pipeline,
@@ -222,4 +215,10 @@ class GreetingAgent:
             return ""
 
         # 📤 Extract and join all text responses into one string
-        return "\n".join([p.text for p in last_event.content.parts if p.text])
\ No newline at end of file
+        return "\n".join([p.text for p in last_event.content.parts if p.text])
+
+    async def aclose(self):
+        """
+        🧹 Close the catalog's cached AgentConnectors and their pooled HTTP connections.
+        """
+        await self.catalog.aclose()
\ No newline at end of file
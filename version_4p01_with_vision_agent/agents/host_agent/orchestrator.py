@@ -34,8 +34,7 @@ from google.genai import types                                 # For wrapping us
 # A2A infrastructure imports: task manager and message models for JSON-RPC
 # -----------------------------------------------------------------------------
 from server.task_manager import InMemoryTaskManager               # Base class for task storage and locking
-from models.request import SendTaskRequest, SendTaskResponse      # JSON-RPC request/response models
-from models.task import Message, TaskStatus, TaskState, TextPart   # Task, message, and status data models
+from models.request import SendTaskRequest                        # JSON-RPC request model
 
 # -----------------------------------------------------------------------------
 # A2A discovery & connector imports: to find and call remote A2A agents
@@ -50,6 +49,8 @@ from utilities.mcp.mcp_connect import MCPConnector              # Connects to MC
 
 # Import AgentCard model for typing
 from models.agent import AgentCard                              # Metadata structure describing an agent
+from server.tracing import tracer                               # OpenTelemetry spans around invoke()
+from utilities.llm.fake_llm import model_from_env               # Offline fake model (A2A_LLM_BACKEND=fake)
 
 # -----------------------------------------------------------------------------
 # Logging setup: configure root logger to show INFO and above
@@ -138,7 +139,10 @@ class OrchestratorAgent:
         # Create and return the LlmAgent
         return LlmAgent(
             # model="gemini-1.5-flash-latest",                 # Gemini model variant
-            model="gemini-2.5-flash",
+            # Offline fake: delegate the query to the GreetingAgent (→ TellTimeAgent)
+            model=model_from_env("gemini-2.5-flash", tool_plan=[
+                {"name": "_delegate_task", "args": {"agent_name": "GreetingAgent", "message": "{query}"}},
+            ]),
             name="orchestrator_agent",                        # Unique name for this agent
             description="Routes requests to A2A agents or MCP tools.",
             instruction=self._root_instruction,                  # System prompt callback
@@ -214,10 +218,11 @@ class OrchestratorAgent:
         # Send the task and await its completion
         task = await self.connectors[agent_name].send_task(message, session_id)
         # Extract the last history entry if present
-        if task.history and len(task.history) > 1:
+        if task.history and task.history[-1].role == "agent":
             return task.history[-1].parts[0].text
         return ""
 
+    @tracer.start_as_current_span("OrchestratorAgent.invoke")
     async def invoke(self, query: str, session_id: str) -> str:
         """
         Primary entrypoint: handles a user query.
@@ -275,14 +280,23 @@ class OrchestratorAgent:
         # 📤 Extract and join all text responses into one string
         return "\n".join([p.text for p in last_event.content.parts if p.text])
 
+    async def aclose(self):
+        """
+        Shut down long-lived resources: pooled HTTP connections to child
+        agents, pooled MCP sessions, and the MCP server subprocesses behind them.
+        """
+        for connector in self.connectors.values():
+            await connector.aclose()
+        await self.mcp.aclose()
+
 
 class OrchestratorTaskManager(InMemoryTaskManager):
     """
     TaskManager wrapper: exposes OrchestratorAgent.invoke()
     over the `tasks/send` JSON-RPC endpoint.
     """
-    def __init__(self, agent: OrchestratorAgent):
-        super().__init__()             # Initialize in-memory store and lock
+    def __init__(self, agent: OrchestratorAgent, **kwargs):
+        super().__init__(**kwargs)     # Initialize in-memory store and lock (+ options like push_sender)
         self.agent = agent             # Store reference to orchestrator logic
 
     def _get_user_text(self, request: SendTaskRequest) -> str:
@@ -297,25 +311,18 @@ class OrchestratorTaskManager(InMemoryTaskManager):
         """
         return request.params.message.parts[0].text
 
-    async def on_send_task(self, request: SendTaskRequest) -> SendTaskResponse:
+    async def aclose(self):
+        """Close the orchestrator's pooled connections on server shutdown."""
+        await super().aclose()
+        await self.agent.aclose()
+
+    async def invoke_agent(self, request: SendTaskRequest) -> str:
         """
-        Handle `tasks/send` calls:
-          1) Store incoming message in memory
-          2) Invoke the orchestrator to get a reply
-          3) Append the reply, mark task COMPLETED
-          4) Return the full Task in the response
+        Handle `tasks/send` calls: invoke the orchestrator and return its
+        reply. Storing the task and recording the reply is done by
+        InMemoryTaskManager.on_send_task().
         """
         logger.info(f"OrchestratorTaskManager received task {request.params.id}")
-        # Store or update the task record
-        task = await self.upsert_task(request.params)
         # Extract the text and invoke orchestration logic
         user_text = self._get_user_text(request)
-        reply_text = await self.agent.invoke(user_text, request.params.sessionId)
-        # Wrap reply in a Message object
-        msg = Message(role="agent", parts=[TextPart(text=reply_text)])
-        # Safely append reply and update status under lock
-        async with self.lock:
-            task.status = TaskStatus(state=TaskState.COMPLETED)
-            task.history.append(msg)
-        # Return the RPC response including the updated task
-        return SendTaskResponse(id=request.id, result=task)
+        return await self.agent.invoke(user_text, request.params.sessionId)
@@ -12,6 +12,7 @@
 # -----------------------------------------------------------------------------
 
 from datetime import datetime  # Used to get the current system time
+import time                    # perf_counter() for per-path latency
 
 # 🧠 Gemini-based AI agent provided by Google's ADK
 from google.adk.agents.llm_agent import LlmAgent
@@ -27,12 +28,31 @@ from google.adk.runners import Runner
 # 🧾 Gemini-compatible types for formatting input/output messages
 from google.genai import types
 
+# 🔭 OpenTelemetry tracer (ADK's own LLM spans nest under our invoke span)
+from server.tracing import tracer
+
+# 📊 Per-path latency histogram, exposed by A2AServer at GET /metrics
+from server.metrics import Histogram
+
+# ⚡ Local (no-LLM) answers for simple time/date/time-zone questions
+from agents.tell_time_agent.time_intent import answer_locally
+
+# 🧪 Gemini by default; a deterministic offline fake with A2A_LLM_BACKEND=fake
+from utilities.llm.fake_llm import model_from_env
+
 # 🔐 Load environment variables (like API keys) from a `.env` file
 from dotenv import load_dotenv
 load_dotenv()  # Load variables like GOOGLE_API_KEY into the system
 # This allows you to keep sensitive data out of your code.
 
 
+# ⏱️ How each query was answered ("local" fast path or "llm") and how long it took
+ANSWER_LATENCY = Histogram(
+    "tell_time_answer_seconds", "TellTimeAgent answer latency by path", ("path",),
+    buckets=(0.0001, 0.001, 0.01, 0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0),
+)
+
+
 # -----------------------------------------------------------------------------
 # 🕒 TellTimeAgent: Your AI agent that tells the time
 # -----------------------------------------------------------------------------
@@ -67,12 +87,13 @@ class TellTimeAgent:
             LlmAgent: An agent object from Google's ADK
         """
         return LlmAgent(
-            model="gemini-1.5-flash-latest",         # Gemini model version
+            model=model_from_env("gemini-1.5-flash-latest"),  # Gemini model version (or the fake)
             name="tell_time_agent",                  # Name of the agent
             description="Tells the current time",    # Description for metadata
             instruction="Reply with the current time in the format YYYY-MM-DD HH:MM:SS."  # System prompt
         )
 
+    @tracer.start_as_current_span("TellTimeAgent.invoke")
     async def invoke(self, query: str, session_id: str) -> str:
         """
         📥 Handle a user query and return a response string.
@@ -84,6 +105,22 @@ class TellTimeAgent:
         Returns:
             str: Agent's reply (usually the current time)
         """
+        started = time.perf_counter()
+
+        # ⚡ "What time is it in Tokyo?" needs a clock, not a model
+        reply = answer_locally(query)
+        path = "local"
+        if reply is None:
+            reply = await self._invoke_llm(query, session_id)
+            path = "llm"
+
+        ANSWER_LATENCY.observe(time.perf_counter() - started, path=path)
+        return reply
+
+    async def _invoke_llm(self, query: str, session_id: str) -> str:
+        """
+        🧠 Free-form queries: run the Gemini agent through the ADK Runner.
+        """
 
         # 🔁 Try to reuse an existing session (or create one if needed)
         session = await self._runner.session_service.get_session(
@@ -132,5 +169,6 @@ class TellTimeAgent:
         """
         yield {
             "is_task_complete": True,
-            "content": f"The current time is: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+            "content": answer_locally(query)
+                       or f"The current time is: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
         }
@@ -8,6 +8,7 @@
 # - Extract the question (like "What time is it?")
 # - Ask the agent to respond
 # - Save and return the agent’s answer
+# - Or stream the agent's answer as it is produced (tasks/sendSubscribe)
 # =============================================================================
 
 
@@ -16,6 +17,7 @@
 # -----------------------------------------------------------------------------
 
 import logging  # Standard Python module for logging debug/info messages
+from typing import AsyncIterable  # Type hint for the streamed events
 
 # 🔁 Import the shared in-memory task manager from the server
 from server.task_manager import InMemoryTaskManager
@@ -24,8 +26,10 @@ from server.task_manager import InMemoryTaskManager
 from agents.tell_time_agent.agent import TellTimeAgent
 
 # 📦 Import data models used to structure and return tasks
-from models.request import SendTaskRequest, SendTaskResponse
+from models.request import SendTaskRequest
+from models.request import SendTaskStreamingRequest, SendTaskStreamingResponse
 from models.task import Message, Task, TextPart, TaskStatus, TaskState
+from models.task import Artifact, TaskStatusUpdateEvent, TaskArtifactUpdateEvent
 
 
 # -----------------------------------------------------------------------------
@@ -45,12 +49,12 @@ class AgentTaskManager(InMemoryTaskManager):
     🧠 This class connects the Gemini agent to the task system.
 
     - It "inherits" all the logic from InMemoryTaskManager
-    - It overrides the part where we handle a new task (on_send_task)
+    - It implements the part where we ask the agent for a reply (invoke_agent)
     - It uses the Gemini agent to generate a response
     """
 
-    def __init__(self, agent: TellTimeAgent):
-        super().__init__()     # Call parent class constructor
+    def __init__(self, agent: TellTimeAgent, **kwargs):
+        super().__init__(**kwargs)  # Parent constructor (options like push_sender)
         self.agent = agent     # Store the Gemini-based agent as a property
 
     # -------------------------------------------------------------------------
@@ -71,42 +75,90 @@ class AgentTaskManager(InMemoryTaskManager):
         return request.params.message.parts[0].text
 
     # -------------------------------------------------------------------------
-    # 🧠 Main logic to handle and complete a task
+    # 🧠 Main logic: ask the agent for a reply
     # -------------------------------------------------------------------------
-    async def on_send_task(self, request: SendTaskRequest) -> SendTaskResponse:
+    async def invoke_agent(self, request: SendTaskRequest) -> str:
         """
         This is the heart of the task manager.
 
         It does the following:
-        1. Save the task into memory (or update it)
-        2. Ask the Gemini agent for a reply
-        3. Format that reply as a message
-        4. Save the agent’s reply into the task history
-        5. Return the updated task to the caller
+        1. Get what the user asked
+        2. Ask the Gemini agent for a reply and return it
+
+        Saving the task and recording the reply is handled by
+        InMemoryTaskManager.on_send_task().
         """
 
         logger.info(f"Processing new task: {request.params.id}")
 
-        # Step 1: Save the task using the base class helper
-        task = await self.upsert_task(request.params)
-
-        # Step 2: Get what the user asked
+        # Step 1: Get what the user asked
         query = self._get_user_query(request)
 
-        # Step 3: Ask the Gemini agent to respond (synchronous call here)
-        result_text = await self.agent.invoke(query, request.params.sessionId)
+        # Step 2: Ask the Gemini agent to respond
+        return await self.agent.invoke(query, request.params.sessionId)
+
+    # -------------------------------------------------------------------------
+    # 📡 Streaming: forward each item from agent.stream() as an SSE event
+    # -------------------------------------------------------------------------
+    async def on_send_task_subscribe(
+        self, request: SendTaskStreamingRequest
+    ) -> AsyncIterable[SendTaskStreamingResponse]:
+        """
+        Handle "tasks/sendSubscribe" using the agent's stream() generator.
 
-        # Step 4: Turn the agent's response into a Message object
-        agent_message = Message(
-            role="agent",                       # The role is "agent" not "user"
-            parts=[TextPart(text=result_text)]  # The reply text is stored inside a TextPart
-        )
+        Progress items become "working" status events; the final item becomes
+        an artifact event followed by the final "completed" status event.
+        """
+        logger.info(f"Streaming new task: {request.params.id}")
+        return self._claimed_stream(request, self._stream_agent(request))
 
-        # Step 5: Update the task state and add the message to history
-        async with self.lock:                   # Lock access to avoid concurrent writes
-            task.status = TaskStatus(state=TaskState.COMPLETED)  # Mark task as done
-            task.history.append(agent_message)  # Append the agent's message to the task history
+    async def _stream_agent(
+        self, request: SendTaskStreamingRequest
+    ) -> AsyncIterable[SendTaskStreamingResponse]:
+        # Save the task, then run the agent as a tracked job (tasks/cancel can stop it)
+        task = await self.upsert_task(request.params)
+        async for event in self._cancelable_stream(request, self._agent_events(request, task)):
+            yield event
 
-        # Step 6: Return a structured response back to the A2A client
-        return SendTaskResponse(id=request.id, result=task)
+    async def _agent_events(
+        self, request: SendTaskStreamingRequest, task: Task
+    ) -> AsyncIterable[SendTaskStreamingResponse]:
+        # Hand the query to the streaming agent
+        query = self._get_user_query(request)
 
+        try:
+            async for item in self.agent.stream(query, request.params.sessionId):
+                if not item["is_task_complete"]:
+                    # Intermediate update: report progress, keep the task "working"
+                    status = TaskStatus(
+                        state=TaskState.WORKING,
+                        message=Message(role="agent", parts=[TextPart(text=item["updates"])])
+                    )
+                    await self.update_task(task.id, status)
+                    yield SendTaskStreamingResponse(
+                        id=request.id,
+                        result=TaskStatusUpdateEvent(id=task.id, status=status)
+                    )
+                    continue
+
+                # Final answer: save it, then send it as an artifact + final status
+                parts = [TextPart(text=item["content"])]
+                snapshot = await self.update_task(
+                    task.id,
+                    TaskStatus(state=TaskState.COMPLETED),
+                    Message(role="agent", parts=parts)
+                )
+                yield SendTaskStreamingResponse(
+                    id=request.id,
+                    result=TaskArtifactUpdateEvent(
+                        id=task.id, artifact=Artifact(parts=parts, lastChunk=True)
+                    )
+                )
+                yield SendTaskStreamingResponse(
+                    id=request.id,
+                    result=TaskStatusUpdateEvent(id=task.id, status=snapshot.status, final=True)
+                )
+        except Exception:
+            # Record the failure so tasks/get reflects it, then let the server report it
+            await self.update_task(task.id, TaskStatus(state=TaskState.FAILED))
+            raise
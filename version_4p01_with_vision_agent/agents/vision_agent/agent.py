@@ -38,6 +38,12 @@ from dotenv import load_dotenv
 # aiohttp is an async library for making HTTP requests (used to fetch remote images)
 import aiohttp
 
+# OpenTelemetry tracer (ADK's own LLM spans nest under our invoke span)
+from server.tracing import tracer
+
+# Gemini by default; a deterministic offline fake with A2A_LLM_BACKEND=fake
+from utilities.llm.fake_llm import model_from_env
+
 # -----------------------------------------------------------------------------
 # Load environment variables from .env (e.g., GOOGLE_API_KEY)
 # -----------------------------------------------------------------------------
@@ -80,7 +86,7 @@ class GeminiVisionAgent:
 
         # Create a Gemini agent using a specific model version and description
         agent = LlmAgent(
-            model="gemini-2.0-flash",  # Gemini model version (vision-capable)
+            model=model_from_env("gemini-2.0-flash"),  # Gemini model version (vision-capable), or the fake
             name="gemini_vision_agent",  # Internal name for the agent
             description="Answers questions about images from file or URL.",  # Description shown in UI or agent directory
             instruction="Analyze the image and answer the user's question based on its content."  # System-level prompt
@@ -186,6 +192,7 @@ class GeminiVisionAgent:
             # Wrap and re-raise the error with a clearer message
             raise RuntimeError(f"Image loading failed: {e}")
         
+    @tracer.start_as_current_span("GeminiVisionAgent.invoke")
     async def invoke(self, query: str, session_id: str) -> str:
         # Log start of invocation
         print(f"\n[Invoke] New invocation with session_id={session_id}")
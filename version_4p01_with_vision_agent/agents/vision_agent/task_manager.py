@@ -19,15 +19,8 @@ from server.task_manager import InMemoryTaskManager
 # Import the agent class that will handle vision queries.
 from agents.vision_agent.agent import GeminiVisionAgent
 
-# Import the request and response types for sending and receiving tasks
-from models.request import SendTaskRequest, SendTaskResponse
-
-# Import models used to structure the conversation task:
-# - Message: a message sent/received by the agent
-# - TaskStatus: status of the task (e.g., completed, in progress)
-# - TaskState: enum-like object representing the state itself (e.g., COMPLETED)
-# - TextPart: holds the actual text portion of a message
-from models.task import Message, TaskStatus, TaskState, TextPart
+# Import the request type for incoming tasks
+from models.request import SendTaskRequest
 
 # Create a logger for this module (good for printing debug info)
 logger = logging.getLogger(__name__)
@@ -45,9 +38,9 @@ class AgentTaskManager(InMemoryTaskManager):
     - Returning the structured result
     """
 
-    def __init__(self, agent: GeminiVisionAgent):
-        # Call the constructor of the parent (InMemoryTaskManager)
-        super().__init__()
+    def __init__(self, agent: GeminiVisionAgent, **kwargs):
+        # Call the constructor of the parent (InMemoryTaskManager, options like push_sender)
+        super().__init__(**kwargs)
 
         # Save the agent instance so we can call its invoke method later
         self.agent = agent
@@ -67,42 +60,24 @@ class AgentTaskManager(InMemoryTaskManager):
         # We assume the message has at least one "part", and it's a text part.
         return request.params.message.parts[0].text
 
-    async def on_send_task(self, request: SendTaskRequest) -> SendTaskResponse:
+    async def invoke_agent(self, request: SendTaskRequest) -> str:
         """
         The main handler that processes incoming tasks.
 
         Steps:
-        1. Save the task in memory (upsert = update or insert)
-        2. Extract the user's query from the request
-        3. Call the Gemini agent to process the image and get a response
-        4. Wrap the response in a message object
-        5. Mark the task as complete and add the message to its history
-        6. Return the updated task wrapped in a response object
+        1. Extract the user's query from the request
+        2. Call the Gemini agent to process the image and return its response
+
+        InMemoryTaskManager.on_send_task() saves the task before this runs
+        and records the reply (status COMPLETED + history) afterwards.
         """
 
         # Log that we are processing a new task (for visibility in logs)
         logger.info(f"Processing new task: {request.params.id}")
 
-        # Step 1: Save the task in memory (insert if new, update if exists)
-        task = await self.upsert_task(request.params)
-
-        # Step 2: Extract the actual text query from the request
+        # Step 1: Extract the actual text query from the request
         query = self._get_user_query(request)
 
-        # Step 3: Ask the agent to process the query and image
+        # Step 2: Ask the agent to process the query and image
         # This returns a string like "This is a photo of a dog"
-        result_text = await self.agent.invoke(query, request.params.sessionId)
-
-        # Step 4: Format the result into a structured Message object
-        agent_message = Message(
-            role="agent",  # Who is sending this message? The agent
-            parts=[TextPart(text=result_text)]  # The reply content
-        )
-
-        # Step 5: Mark the task as completed and append the message to history
-        async with self.lock:  # Locking to avoid race conditions
-            task.status = TaskStatus(state=TaskState.COMPLETED)  # Mark as done
-            task.history.append(agent_message)  # Add the agent's reply
-
-        # Step 6: Wrap and return the final updated task inside a SendTaskResponse
-        return SendTaskResponse(id=request.id, result=task)
\ No newline at end of file
+        return await self.agent.invoke(query, request.params.sessionId)
@@ -0,0 +1,36 @@
+# =============================================================================
+# benchmarks/stats.py
+# =============================================================================
+# 🎯 Purpose:
+# Small helpers shared by the benchmark scripts: latency percentiles and a
+# one-line summary of them.
+# =============================================================================
+
+from typing import Iterable, List
+
+
+def percentile(sorted_samples: List[float], pct: float) -> float:
+    """
+    Nearest-rank percentile of an already sorted list (0 if empty).
+
+    Args:
+        sorted_samples: Latencies in ascending order.
+        pct: Percentile between 0 and 100.
+    """
+    if not sorted_samples:
+        return 0.0
+    rank = max(0, min(len(sorted_samples) - 1, round(pct / 100 * len(sorted_samples)) - 1))
+    return sorted_samples[rank]
+
+
+def summarize(name: str, samples_s: Iterable[float]) -> str:
+    """Format count and p50/p95/p99/max of latencies given in seconds, in ms."""
+    ordered = sorted(samples_s)
+    if not ordered:
+        return f"{name:<24} n=0"
+    ms = lambda v: f"{v * 1000:8.2f}"
+    return (
+        f"{name:<24} n={len(ordered):<6} "
+        f"p50={ms(percentile(ordered, 50))}  p95={ms(percentile(ordered, 95))}  "
+        f"p99={ms(percentile(ordered, 99))}  max={ms(ordered[-1])}  (ms)"
+    )
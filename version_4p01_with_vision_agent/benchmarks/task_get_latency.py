@@ -0,0 +1,114 @@
+# =============================================================================
+# benchmarks/task_get_latency.py
+# =============================================================================
+# 🎯 Purpose:
+# Measures tasks/get latency while many tasks/send calls are in flight.
+#
+# An A2AServer runs in-process (httpx ASGI transport, no sockets) with a
+# dummy agent that just sleeps. The benchmark keeps `--inflight` blocking
+# tasks/send requests open and, at the same time, polls tasks/get for tasks
+# that are already stored. Compare runs with `--stripes 1` (every task shares
+# one lock) and the default to see the effect of lock striping.
+#
+# Usage:
+#   uv run python3 -m benchmarks.task_get_latency --inflight 500 --gets 2000
+# =============================================================================
+
+import asyncio                    # Runs the concurrent senders and pollers
+import contextlib                 # redirect_stdout silences per-request debug prints
+import io                         # Sink for the silenced output
+import time                       # perf_counter for latencies
+from uuid import uuid4            # Unique task IDs
+
+import asyncclick as click        # Same CLI library as app/cmd/cmd.py
+import httpx                      # ASGI transport talks to the app in-process
+
+from server.server import A2AServer
+from server.task_manager import InMemoryTaskManager
+from models.agent import AgentCard, AgentCapabilities
+from models.request import SendTaskRequest
+from benchmarks.stats import summarize
+
+
+class SleepyTaskManager(InMemoryTaskManager):
+    """Dummy agent: waits `delay` seconds and echoes the user's text."""
+
+    def __init__(self, delay: float, lock_stripes: int):
+        super().__init__(lock_stripes=lock_stripes)
+        self.delay = delay
+
+    async def invoke_agent(self, request: SendTaskRequest) -> str:
+        await asyncio.sleep(self.delay)
+        return request.params.message.parts[0].text
+
+
+def _rpc(method: str, params: dict) -> dict:
+    return {"jsonrpc": "2.0", "id": uuid4().hex, "method": method, "params": params}
+
+
+def _send_params(task_id: str) -> dict:
+    return {
+        "id": task_id,
+        "sessionId": "bench",
+        "message": {"role": "user", "parts": [{"type": "text", "text": "ping"}]},
+    }
+
+
+@click.command()
+@click.option("--inflight", default=500, help="Concurrent tasks/send calls kept open")
+@click.option("--gets", default=2000, help="Number of tasks/get calls to time")
+@click.option("--get-concurrency", default=20, help="Concurrent tasks/get pollers")
+@click.option("--agent-delay", default=0.5, help="Seconds each dummy agent run takes")
+@click.option("--stripes", default=64, help="Number of lock stripes in the task manager")
+async def cli(inflight: int, gets: int, get_concurrency: int, agent_delay: float, stripes: int):
+    """Report tasks/get p50/p95/p99 with and without tasks/send load."""
+    manager = SleepyTaskManager(agent_delay, stripes)
+    card = AgentCard(
+        name="Bench", description="benchmark agent", url="http://bench/",
+        version="1.0", capabilities=AgentCapabilities(), skills=[],
+    )
+    server = A2AServer(agent_card=card, task_manager=manager)
+    transport = httpx.ASGITransport(app=server.app)
+    limits = httpx.Limits(max_connections=None)
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", limits=limits) as client:
+        # Seed tasks that tasks/get will read (long history makes copies visible)
+        seed_ids = [uuid4().hex for _ in range(get_concurrency)]
+        for task_id in seed_ids:
+            for _ in range(50):
+                await manager.upsert_task(SendTaskRequest(params=_send_params(task_id)).params)
+
+        async def send_one():
+            await client.post("/", json=_rpc("tasks/send", _send_params(uuid4().hex)))
+
+        async def poll(worker: int, count: int, samples: list):
+            task_id = seed_ids[worker]
+            for _ in range(count):
+                start = time.perf_counter()
+                response = await client.post("/", json=_rpc("tasks/get", {"id": task_id, "historyLength": 10}))
+                samples.append(time.perf_counter() - start)
+                assert "result" in response.json()
+
+        async def run_gets() -> list:
+            samples: list = []
+            per_worker = max(1, gets // get_concurrency)
+            await asyncio.gather(*(poll(w, per_worker, samples) for w in range(get_concurrency)))
+            return samples
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            idle = await run_gets()
+
+            senders = [asyncio.create_task(send_one()) for _ in range(inflight)]
+            # Wait until every send is stored and sitting in the agent
+            while len(manager.tasks) < len(seed_ids) + inflight:
+                await asyncio.sleep(0.01)
+            loaded = await run_gets()
+            await asyncio.gather(*senders)
+
+    print(f"stripes={stripes} inflight={inflight} agent_delay={agent_delay}s")
+    print(summarize("tasks/get idle", idle))
+    print(summarize(f"tasks/get +{inflight} sends", loaded))
+
+
+if __name__ == "__main__":
+    asyncio.run(cli())
@@ -13,7 +13,14 @@
 # - JSONRPCRequest: A call from one agent to another
 # - JSONRPCResponse: The reply to a request (either result or error)
 # - JSONRPCError: The structure of an error response
+# - JSONParseError / InvalidRequestError: Standard errors for malformed requests
+# - MethodNotFoundError: The request names a method this agent doesn't have
 # - InternalError: A predefined standard error for unexpected failures
+# - UnsupportedOperationError: The agent does not support the requested method
+# - TaskNotFoundError: The requested task ID is unknown
+# - TaskNotCancelableError: The task already finished and can't be canceled
+# - PushNotificationNotSupportedError: The agent can't send push notifications
+# - ServerBusyError: The agent is at capacity; retry later
 # =============================================================================
 
 # -----------------------------------------------------------------------------
@@ -81,6 +88,34 @@ class JSONRPCResponse(JSONRPCMessage):
     error: JSONRPCError | None = None
 
 
+# -----------------------------------------------------------------------------
+# JSONParseError / InvalidRequestError (subclasses of JSONRPCError)
+# -----------------------------------------------------------------------------
+# Standard JSON-RPC errors: the body is not valid JSON (-32700), or it is JSON
+# but not a valid request object for any supported method (-32600).
+class JSONParseError(JSONRPCError):
+    code: int = -32700
+    message: str = "Invalid JSON payload"
+    data: Any | None = None
+
+
+class InvalidRequestError(JSONRPCError):
+    code: int = -32600
+    message: str = "Request payload validation error"
+    data: Any | None = None
+
+
+# -----------------------------------------------------------------------------
+# MethodNotFoundError (subclass of JSONRPCError)
+# -----------------------------------------------------------------------------
+# Standard JSON-RPC error (-32601): the request is well formed, but its
+# `method` is not one this agent supports.
+class MethodNotFoundError(JSONRPCError):
+    code: int = -32601
+    message: str = "Method not found"
+    data: Any | None = None
+
+
 # -----------------------------------------------------------------------------
 # InternalError (subclass of JSONRPCError)
 # -----------------------------------------------------------------------------
@@ -95,3 +130,80 @@ class InternalError(JSONRPCError):
 
     # Optional debug details (e.g., traceback or context info)
     data: Any | None = None
+
+
+# -----------------------------------------------------------------------------
+# UnsupportedOperationError (subclass of JSONRPCError)
+# -----------------------------------------------------------------------------
+# Returned when the agent understands the request but does not support it
+# (e.g., streaming on an agent that only answers with a single reply).
+class UnsupportedOperationError(JSONRPCError):
+    # A2A-specific error code for unsupported operations
+    code: int = -32004
+
+    # Default error message
+    message: str = "This operation is not supported"
+
+    # Optional details
+    data: Any | None = None
+
+
+# -----------------------------------------------------------------------------
+# TaskNotFoundError (subclass of JSONRPCError)
+# -----------------------------------------------------------------------------
+# Returned when a request refers to a task ID the agent does not know about.
+class TaskNotFoundError(JSONRPCError):
+    # A2A-specific error code for unknown tasks
+    code: int = -32001
+
+    # Default error message
+    message: str = "Task not found"
+
+    # Optional details
+    data: Any | None = None
+
+
+# -----------------------------------------------------------------------------
+# TaskNotCancelableError (subclass of JSONRPCError)
+# -----------------------------------------------------------------------------
+# Returned by tasks/cancel for a task that already reached a final state.
+class TaskNotCancelableError(JSONRPCError):
+    # A2A-specific error code for tasks that can't be canceled
+    code: int = -32002
+
+    # Default error message
+    message: str = "Task cannot be canceled"
+
+    # Optional details
+    data: Any | None = None
+
+
+# -----------------------------------------------------------------------------
+# PushNotificationNotSupportedError (subclass of JSONRPCError)
+# -----------------------------------------------------------------------------
+# Returned by tasks/pushNotification/set|get when the agent has no push sender.
+class PushNotificationNotSupportedError(JSONRPCError):
+    # A2A-specific error code for missing push notification support
+    code: int = -32003
+
+    # Default error message
+    message: str = "Push Notification is not supported"
+
+    # Optional details
+    data: Any | None = None
+
+
+# -----------------------------------------------------------------------------
+# ServerBusyError (subclass of JSONRPCError)
+# -----------------------------------------------------------------------------
+# Returned (with HTTP 429/503 and a Retry-After header) when the server sheds
+# a request because it is already running and queueing as much as allowed.
+class ServerBusyError(JSONRPCError):
+    # Implementation-defined server error (JSON-RPC reserves -32000..-32099)
+    code: int = -32000
+
+    # Default error message
+    message: str = "Server busy, retry later"
+
+    # Optional details (reason, retryAfter, queue depth)
+    data: Any | None = None
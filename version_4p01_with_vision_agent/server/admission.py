@@ -0,0 +1,143 @@
+# =============================================================================
+# server/admission.py
+# =============================================================================
+# 🎯 Purpose:
+# Admission control for A2AServer: at most `max_in_flight` agent runs at once,
+# a bounded FIFO queue for the next ones, and a cap on how long a request may
+# wait in that queue. Everything beyond that is shed immediately with a
+# "busy" error, so a burst fails some requests fast instead of making every
+# request slow.
+# =============================================================================
+
+import asyncio                    # Futures hand free slots to queued requests
+import math                       # ceil() for Retry-After seconds
+import time                       # Queue wait / service time measurement
+from collections import deque     # FIFO of waiting requests
+from typing import Dict
+
+
+class ServerBusy(Exception):
+    """
+    Raised by AdmissionController.acquire() when a request is shed.
+
+    Attributes:
+        reason (str): "queue_full" or "queue_timeout"
+        retry_after (int): Suggested seconds before retrying
+        status_code (int): 429 when the queue is full, 503 on queue timeout
+    """
+
+    def __init__(self, reason: str, retry_after: int):
+        super().__init__(f"Server busy ({reason}), retry after {retry_after}s")
+        self.reason = reason
+        self.retry_after = retry_after
+        self.status_code = 429 if reason == "queue_full" else 503
+
+
+class AdmissionController:
+    """
+    🚦 Limits concurrent work and sheds load past a bounded queue.
+
+    Usage:
+        controller = AdmissionController(max_in_flight=8)
+        await controller.acquire()      # may raise ServerBusy
+        try:
+            ...                         # run the agent
+        finally:
+            controller.release()
+
+    Attributes:
+        max_in_flight (int): Requests allowed to run at the same time.
+        max_queue (int): Requests allowed to wait for a slot.
+        max_queue_time (float): Seconds a request may wait before being shed.
+    """
+
+    def __init__(self, max_in_flight: int, max_queue: int = 100, max_queue_time: float = 30.0):
+        self.max_in_flight = max_in_flight
+        self.max_queue = max_queue
+        self.max_queue_time = max_queue_time
+
+        self.in_flight = 0
+        self._waiters: deque[asyncio.Future] = deque()
+
+        # Counters for metrics
+        self.admitted = 0
+        self.shed = {"queue_full": 0, "queue_timeout": 0}
+        self.queue_wait_seconds = 0.0
+        # Moving average of how long an admitted request holds its slot
+        self._avg_service_time = 1.0
+        self._started: deque[float] = deque()
+
+    @property
+    def queued(self) -> int:
+        return sum(1 for waiter in self._waiters if not waiter.done())
+
+    def retry_after(self) -> int:
+        """Rough seconds until a slot frees up for a new request (at least 1)."""
+        backlog = (self.queued + 1) / max(1, self.max_in_flight)
+        return max(1, math.ceil(self._avg_service_time * backlog))
+
+    async def acquire(self) -> None:
+        """Take a slot, waiting in the queue if needed; raise ServerBusy if shed."""
+        if self.in_flight < self.max_in_flight and not self.queued:
+            self._admit(0.0)
+            return
+
+        if self.queued >= self.max_queue:
+            self.shed["queue_full"] += 1
+            raise ServerBusy("queue_full", self.retry_after())
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        queued_at = time.monotonic()
+        try:
+            # release() passes its slot to us by resolving the future
+            await asyncio.wait_for(waiter, timeout=self.max_queue_time)
+        except asyncio.TimeoutError:
+            self.shed["queue_timeout"] += 1
+            raise ServerBusy("queue_timeout", self.retry_after())
+        except BaseException:
+            # Cancelled right after release() handed us its slot: pass it on,
+            # or in_flight never comes back down
+            if waiter.done() and not waiter.cancelled():
+                self._pass_slot()
+            raise
+        finally:
+            if waiter in self._waiters:
+                self._waiters.remove(waiter)
+        self._admit(time.monotonic() - queued_at, slot_transferred=True)
+
+    def _admit(self, waited: float, slot_transferred: bool = False) -> None:
+        if not slot_transferred:
+            self.in_flight += 1
+        self.admitted += 1
+        self.queue_wait_seconds += waited
+        self._started.append(time.monotonic())
+
+    def release(self) -> None:
+        """Give the slot to the oldest waiting request, or free it."""
+        if self._started:
+            held = time.monotonic() - self._started.popleft()
+            self._avg_service_time = 0.8 * self._avg_service_time + 0.2 * held
+        self._pass_slot()
+
+    def _pass_slot(self) -> None:
+        """Hand a held slot to the oldest live waiter, or free it."""
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)     # Slot moves to the waiter; in_flight unchanged
+                return
+        self.in_flight -= 1
+
+    def stats(self) -> Dict[str, float]:
+        """Current queue depth and counters, e.g. for logs or metrics."""
+        return {
+            "in_flight": self.in_flight,
+            "queued": self.queued,
+            "max_in_flight": self.max_in_flight,
+            "max_queue": self.max_queue,
+            "admitted": self.admitted,
+            "shed_queue_full": self.shed["queue_full"],
+            "shed_queue_timeout": self.shed["queue_timeout"],
+            "queue_wait_seconds": self.queue_wait_seconds,
+        }
@@ -5,8 +5,22 @@
 # This file defines a very simple A2A (Agent-to-Agent) server.
 # It supports:
 # - Receiving task requests via POST ("/")
-# - Letting clients discover the agent's details via GET ("/.well-known/agent.json")
-# NOTE: It does not support streaming or push notifications in this version.
+# - Streaming task updates over Server-Sent Events ("tasks/sendSubscribe")
+# - Polling a task's current state ("tasks/get")
+# - Stopping a running task ("tasks/cancel")
+# - Letting clients discover the agent's details via GET ("/.well-known/agent.json"),
+#   pre-rendered once and cacheable (ETag + Cache-Control, 304 on revalidation)
+# - JSON-RPC 2.0 batches: a JSON array of requests answered by an array of
+#   responses, in order (items validated and run individually, concurrently)
+# - Optional admission control: a cap on concurrent agent runs plus a bounded
+#   wait queue; excess requests get a "busy" error (HTTP 429/503 + Retry-After)
+# - Push notifications: registering a webhook for a task's updates
+#   ("tasks/pushNotification/set|get"), if the task manager supports it
+# - Prometheus metrics via GET ("/metrics"): latency per JSON-RPC method,
+#   requests in flight, task store size / states, admission queue, plus
+#   child-agent delegation and MCP tool call latency recorded in-process
+# - OpenTelemetry spans per request, continuing the caller's trace from its
+#   W3C `traceparent` header (see server/tracing.py)
 # =============================================================================
 
 
@@ -16,45 +30,105 @@
 
 # 🌐 Starlette is a lightweight web framework for building ASGI applications
 from starlette.applications import Starlette            # To create our web app
-from starlette.responses import JSONResponse            # To send responses as JSON
+from starlette.responses import Response                # Sends pre-serialized JSON bytes
+from starlette.responses import StreamingResponse       # To stream Server-Sent Events (SSE)
 from starlette.requests import Request                  # Represents incoming HTTP requests
 
 # 📦 Importing our custom models and logic
 from models.agent import AgentCard                      # Describes the agent's identity and skills
 from models.request import A2ARequest, SendTaskRequest  # Request models for tasks
+from models.request import GetTaskRequest               # Request model for polling a task
+from models.request import SendTaskStreamingRequest     # Request model for streamed tasks
+from models.request import CancelTaskRequest            # Request model for canceling a task
+from models.request import SetTaskPushNotificationRequest  # Register a task's webhook
+from models.request import GetTaskPushNotificationRequest  # Read a task's webhook
 from models.json_rpc import JSONRPCResponse, InternalError  # JSON-RPC utilities for structured messaging
+from models.json_rpc import JSONParseError, InvalidRequestError  # Errors for malformed requests
+from models.json_rpc import MethodNotFoundError          # Error for an unknown method
+from models.json_rpc import ServerBusyError              # Error for shed requests
+from models.json_rpc import UnsupportedOperationError    # Streaming can't be batched
 from server import task_manager              # Our actual task handling logic (Gemini agent)
+from server.admission import AdmissionController, ServerBusy  # Concurrency cap + wait queue
+from server.metrics import REGISTRY, CONTENT_TYPE, Counter, Gauge, Histogram  # GET /metrics
+from server.metrics import render_stats, render_labeled
+from server.tracing import tracer, extract_context, setup_tracing  # OpenTelemetry spans
+from opentelemetry import trace
+from opentelemetry.trace import SpanKind
 
 # 🛠️ General utilities
-import json                                              # Used for printing the request payloads (for debugging)
+import asyncio                                           # Runs batch items concurrently
+import contextlib                                        # Builds the app lifespan (startup/shutdown hook)
+import json                                              # Splits a batch array into its items
+import hashlib                                           # Strong ETag for the agent card
 import logging                                           # Used to log errors and info messages
+import random                                            # Picks which requests to log (sampling)
+import time                                              # Request latency for /metrics
+from typing import AsyncIterable                         # Type of the streamed task events
+from pydantic import BaseModel, ValidationError          # Models serialize themselves; parse errors
 logger = logging.getLogger(__name__)                     # Setup logger for this file
 
-# 🕒 datetime import for serialization
-from datetime import datetime
+# Longest request body (in characters) written to the log
+LOG_BODY_LIMIT = 2000
 
-# 📦 Encoder to help convert complex data like datetime into JSON
-from fastapi.encoders import jsonable_encoder
+# A JSON-RPC batch is a JSON array; a single request is an object
+BATCH_START = ord("[")
+WHITESPACE = b" \t\r\n"
+
+# 📊 Request metrics (per JSON-RPC method, shared by all servers in the process)
+REQUEST_LATENCY = Histogram(
+    "a2a_request_duration_seconds",
+    "Time to answer an A2A request (until the last event for streams)",
+    ("method",),
+)
+REQUESTS = Counter("a2a_requests_total", "A2A requests by outcome (ok, error, shed)", ("method", "outcome"))
+REQUESTS_IN_FLIGHT = Gauge("a2a_requests_in_flight", "A2A requests being handled right now", ("method",))
 
 
 # -----------------------------------------------------------------------------
-# 🔧 Serializer for datetime
+# 🔧 Fast JSON responses
 # -----------------------------------------------------------------------------
-def json_serializer(obj):
+def json_response(model: BaseModel, status_code: int = 200) -> Response:
+    """
+    Serialize a Pydantic model straight to JSON bytes in one pass
+    (pydantic-core handles datetime, UUID, enums, ...) and send them as-is.
+    """
+    if isinstance(model, JSONRPCResponse):
+        content = dump_response(model)
+    else:
+        content = model.model_dump_json(exclude_none=True)
+    return Response(content=content, media_type="application/json", status_code=status_code)
+
+
+def dump_response(response: JSONRPCResponse) -> str:
     """
-    This function can convert Python datetime objects to ISO strings.
-    If you try to serialize a type it doesn't know, it will raise an error.
+    JSON for one JSON-RPC response, leaving out unset fields. An error reply
+    never has a "result" member and always has an "id" (null when the
+    request's id couldn't be read), as JSON-RPC requires.
     """
-    if isinstance(obj, datetime):
-        return obj.isoformat()
-    raise TypeError(f"Type {type(obj)} not serializable")
+    if response.error is None:
+        return response.model_dump_json(exclude_none=True)
+    error = response.error.model_dump_json(exclude_none=True)
+    return f'{{"jsonrpc":"2.0","id":{json.dumps(response.id)},"error":{error}}}'
 
 
 # -----------------------------------------------------------------------------
 # 🚀 A2AServer Class: The Core Server Logic
 # -----------------------------------------------------------------------------
 class A2AServer:
-    def __init__(self, host="0.0.0.0", port=5000, agent_card: AgentCard = None, task_manager: task_manager = None):
+    def __init__(
+        self,
+        host="0.0.0.0",
+        port=5000,
+        agent_card: AgentCard = None,
+        task_manager: task_manager = None,
+        log_sample_rate: float = 0.0,
+        card_max_age: int = 300,
+        max_in_flight: int | None = None,
+        max_queue: int = 100,
+        max_queue_time: float = 30.0,
+        max_batch_size: int = 100,
+        batch_concurrency: int = 16,
+    ):
         """
         🔧 Constructor for our A2AServer
 
@@ -63,14 +137,32 @@ class A2AServer:
             port: Port number to listen on (default is 5000)
             agent_card: Metadata that describes our agent (name, skills, capabilities)
             task_manager: Logic to handle the task (using Gemini agent here)
+            log_sample_rate: Fraction of request bodies to log (0 = off, 1 = all)
+            card_max_age: Seconds clients may cache the agent card (Cache-Control)
+            max_in_flight: Max agent runs (tasks/send, tasks/sendSubscribe) at once;
+                None disables admission control
+            max_queue: Max requests waiting for a free slot before new ones are shed
+            max_queue_time: Max seconds a request may wait for a slot
+            max_batch_size: Max requests in one JSON-RPC batch array
+            batch_concurrency: Max items of one batch handled at the same time
         """
         self.host = host
         self.port = port
-        self.agent_card = agent_card
+        self.card_max_age = card_max_age
+        self.agent_card = agent_card          # Also renders the card bytes (see setter)
         self.task_manager = task_manager
+        self.log_sample_rate = log_sample_rate
+        self.max_batch_size = max_batch_size
+        self.batch_concurrency = batch_concurrency
+
+        # 🚦 Admission control (tasks/get and tasks/cancel are never queued: they're cheap)
+        self.admission = (
+            AdmissionController(max_in_flight, max_queue, max_queue_time)
+            if max_in_flight is not None else None
+        )
 
-        # 🌐 Starlette app initialization
-        self.app = Starlette()
+        # 🌐 Starlette app initialization (lifespan closes the task manager on shutdown)
+        self.app = Starlette(lifespan=self._lifespan)
 
         # 📥 Register a route to handle task requests (JSON-RPC POST)
         self.app.add_route("/", self._handle_request, methods=["POST"])
@@ -78,6 +170,9 @@ class A2AServer:
         # 🔎 Register a route for agent discovery (metadata as JSON)
         self.app.add_route("/.well-known/agent.json", self._get_agent_card, methods=["GET"])
 
+        # 📊 Register a route for Prometheus scrapes
+        self.app.add_route("/metrics", self._get_metrics, methods=["GET"])
+
     # -----------------------------------------------------------------------------
     # ▶️ start(): Launch the web server using uvicorn
     # -----------------------------------------------------------------------------
@@ -89,74 +184,404 @@ class A2AServer:
         if not self.agent_card or not self.task_manager:
             raise ValueError("Agent card and task manager are required")
 
+        # Export traces if OTEL_EXPORTER_OTLP_ENDPOINT is set (no-op otherwise)
+        setup_tracing(service_name=self.agent_card.name)
+
         # Dynamically import uvicorn so it’s only loaded when needed
         import uvicorn
         uvicorn.run(self.app, host=self.host, port=self.port)
 
+    # -----------------------------------------------------------------------------
+    # ♻️ _lifespan(): Startup/shutdown hook for the Starlette app
+    # -----------------------------------------------------------------------------
+    @contextlib.asynccontextmanager
+    async def _lifespan(self, app: Starlette):
+        """
+        Runs for the lifetime of the server. When uvicorn shuts down,
+        gives the task manager a chance to close pooled connections,
+        MCP sessions, and other long-lived resources.
+        """
+        yield
+        if self.task_manager is not None:
+            await self.task_manager.aclose()
+
+    # -----------------------------------------------------------------------------
+    # 🪪 agent_card: rendered to bytes once, re-rendered only when replaced
+    # -----------------------------------------------------------------------------
+    @property
+    def agent_card(self) -> AgentCard:
+        return self._agent_card
+
+    @agent_card.setter
+    def agent_card(self, card: AgentCard):
+        self._agent_card = card
+        self.refresh_agent_card()
+
+    def refresh_agent_card(self):
+        """
+        Render the agent card to JSON bytes and compute its strong ETag.
+        Assigning a new `agent_card` does this automatically; call it
+        yourself after editing the current card in place.
+        """
+        if self._agent_card is None:
+            self._card_body, self._card_etag = None, None
+            return
+        self._card_body = self._agent_card.model_dump_json(exclude_none=True).encode()
+        self._card_etag = f'"{hashlib.sha256(self._card_body).hexdigest()[:32]}"'
+
     # -----------------------------------------------------------------------------
     # 🔎 _get_agent_card(): Return the agent’s metadata (GET request)
     # -----------------------------------------------------------------------------
-    def _get_agent_card(self, request: Request) -> JSONResponse:
+    def _get_agent_card(self, request: Request) -> Response:
         """
         Endpoint for agent discovery (GET /.well-known/agent.json)
 
+        Serves the pre-rendered card bytes with a strong ETag and
+        Cache-Control. If the client already has this version
+        (If-None-Match), answers 304 Not Modified with no body.
+
         Returns:
-            JSONResponse: Agent metadata as a dictionary
+            Response: Agent metadata as JSON, or an empty 304
         """
-        return JSONResponse(self.agent_card.model_dump(exclude_none=True))
+        headers = {
+            "ETag": self._card_etag,
+            "Cache-Control": f"public, max-age={self.card_max_age}",
+        }
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match:
+            candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+            if self._card_etag in candidates or "*" in candidates:
+                return Response(status_code=304, headers=headers)
+
+        return Response(content=self._card_body, media_type="application/json", headers=headers)
+
+    # -----------------------------------------------------------------------------
+    # 📊 _get_metrics(): Prometheus text format (GET /metrics)
+    # -----------------------------------------------------------------------------
+    def _get_metrics(self, request: Request) -> Response:
+        """
+        Endpoint for Prometheus (GET /metrics)
+
+        Recorded metrics (requests, delegations, MCP tool calls) come from
+        the process registry; task store, admission and push-delivery
+        numbers are read from their stats() at scrape time.
+        """
+        body = REGISTRY.render()
+        store_stats = getattr(self.task_manager, "store_stats", None)
+        if store_stats is not None:
+            body += render_stats("a2a_task_store", store_stats(), "Task store")
+            body += render_labeled("a2a_tasks", "state", self.task_manager.state_counts(), "Stored tasks by state")
+        if self.admission is not None:
+            body += render_stats("a2a_admission", self.admission.stats(), "Admission control")
+        push_sender = getattr(self.task_manager, "push_sender", None)
+        if push_sender is not None:
+            body += render_stats("a2a_push", push_sender.stats(), "Push notification delivery")
+        return Response(content=body, media_type=CONTENT_TYPE)
 
     # -----------------------------------------------------------------------------
     # 📥 _handle_request(): Handle incoming POST requests for tasks
     # -----------------------------------------------------------------------------
     async def _handle_request(self, request: Request):
         """
-        This method handles task requests sent to the root path ("/").
+        This method handles task requests sent to the root path ("/"),
+        inside a server span that continues the caller's trace (if its
+        request carries a `traceparent` header).
+        """
+        with tracer.start_as_current_span(
+            "A2AServer.handle_request", context=extract_context(request.headers), kind=SpanKind.SERVER
+        ) as span:
+            response = await self._handle_json_rpc(request)
+            span.set_attribute("http.response.status_code", response.status_code)
+            return response
 
-        - Parses incoming JSON
-        - Validates the JSON-RPC message
+    async def _handle_json_rpc(self, request: Request):
+        """
+        Parses a POSTed JSON-RPC request (or batch) and answers it.
+
+        - Parses and validates the raw JSON-RPC body in one pass
         - For supported task types, delegates to the task manager
-        - Returns a response or error
+        - Returns a response or error (or an SSE stream for tasks/sendSubscribe)
         """
         try:
-            # Step 1: Parse incoming JSON body
-            body = await request.json()
-            print("\n🔍 Incoming JSON:", json.dumps(body, indent=2))  # Log input for visibility
+            # Step 1: Read the raw body; log a sample of requests if enabled
+            body = await request.body()
+            if self.log_sample_rate and random.random() < self.log_sample_rate:
+                logger.info(f"Incoming request: {body[:LOG_BODY_LIMIT].decode(errors='replace')}")
 
-            # Step 2: Parse and validate request using discriminated union
-            json_rpc = A2ARequest.validate_python(body)
+            # Step 2: A JSON array is a batch; anything else one request
+            if body.lstrip(WHITESPACE)[:1] == bytes([BATCH_START]):
+                return await self._handle_batch(body)
 
-            # Step 3: If it’s a send-task request, call the task manager to handle it
-            if isinstance(json_rpc, SendTaskRequest):
-                result = await self.task_manager.on_send_task(json_rpc)
-            else:
-                raise ValueError(f"Unsupported A2A method: {type(json_rpc)}")
+            # Parse and validate the bytes directly (discriminated union)
+            json_rpc = A2ARequest.validate_json(body)
+
+            # Step 3: Call the task manager (agent runs go through admission control)
+            result = await self._run(json_rpc)
 
             # Step 4: Convert the result into a proper JSON response
             return self._create_response(result)
 
+        except ServerBusy as e:
+            # Shed: answer right away so the caller can back off and retry
+            error = self._busy_error(e)
+            logger.warning(f"Shed request ({e.reason}): {self.admission.stats()}")
+            response = json_response(JSONRPCResponse(id=json_rpc.id, error=error), status_code=e.status_code)
+            response.headers["Retry-After"] = str(e.retry_after)
+            return response
+
+        except ValidationError as e:
+            # Malformed JSON, or valid JSON that isn't a supported request
+            if any(err["type"] == "json_invalid" for err in e.errors()):
+                response = JSONRPCResponse(id=None, error=JSONParseError())
+            else:
+                response = self._invalid_request(e, json.loads(body))
+            logger.error(f"Invalid request: {response.error.message}")
+            return json_response(response, status_code=400)
+
         except Exception as e:
             logger.error(f"Exception: {e}")
             # Return a JSON-RPC compliant error response if anything fails
-            return JSONResponse(
-                JSONRPCResponse(id=None, error=InternalError(message=str(e))).model_dump(),
-                status_code=400
+            return json_response(
+                JSONRPCResponse(id=None, error=InternalError(message=str(e))),
+                status_code=400,
             )
 
     # -----------------------------------------------------------------------------
-    # 🧾 _create_response(): Converts result object to JSONResponse
+    # 📦 _handle_batch(): JSON-RPC 2.0 batch (array of requests)
+    # -----------------------------------------------------------------------------
+    async def _handle_batch(self, body: bytes) -> Response:
+        """
+        Handles a JSON-RPC batch: every item is validated and answered on
+        its own (one bad item doesn't fail the others), up to
+        `batch_concurrency` items run at once, and the responses come back
+        as an array in request order. Notifications (items without an "id")
+        get no response; a batch of only notifications gets HTTP 204.
+        """
+        try:
+            items = json.loads(body)
+        except ValueError:
+            return json_response(JSONRPCResponse(id=None, error=JSONParseError()), status_code=400)
+
+        if not items:
+            error = InvalidRequestError(message="Empty batch")
+            return json_response(JSONRPCResponse(id=None, error=error), status_code=400)
+        if len(items) > self.max_batch_size:
+            error = InvalidRequestError(message=f"Batch larger than {self.max_batch_size} requests")
+            return json_response(JSONRPCResponse(id=None, error=error), status_code=400)
+
+        limit = asyncio.Semaphore(self.batch_concurrency)
+
+        async def run(item):
+            async with limit:
+                return await self._handle_batch_item(item)
+
+        responses = await asyncio.gather(*(run(item) for item in items))
+        replies = [
+            dump_response(response)
+            for item, response in zip(items, responses)
+            if not (isinstance(item, dict) and "id" not in item)      # Notification
+        ]
+        if not replies:
+            return Response(status_code=204)
+        return Response(content=f"[{','.join(replies)}]", media_type="application/json")
+
+    async def _handle_batch_item(self, item) -> JSONRPCResponse:
+        """Validate and run one batch item; errors become that item's response."""
+        request_id = item.get("id") if isinstance(item, dict) else None
+        try:
+            json_rpc = A2ARequest.validate_python(item)
+            if isinstance(json_rpc, SendTaskStreamingRequest):
+                return JSONRPCResponse(id=request_id, error=UnsupportedOperationError(
+                    message="tasks/sendSubscribe can't be part of a batch"
+                ))
+            return await self._run(json_rpc)
+
+        except ValidationError as e:
+            return self._invalid_request(e, item)
+        except ServerBusy as e:
+            return JSONRPCResponse(id=request_id, error=self._busy_error(e))
+        except Exception as e:
+            logger.error(f"Exception in batch item: {e}")
+            return JSONRPCResponse(id=request_id, error=InternalError(message=str(e)))
+
+    # -----------------------------------------------------------------------------
+    # ⏱️ _run(): Admission + dispatch for one request, with metrics
+    # -----------------------------------------------------------------------------
+    async def _run(self, json_rpc):
+        """
+        Runs a parsed request (agent runs go through admission control) and
+        records its latency, outcome and in-flight count per method. For a
+        stream, the request counts as in flight until its last event.
+
+        The request gets a span named after its method; the task manager and
+        agent spans nest under it (for a stream, until its last event).
+        """
+        method = json_rpc.method
+        started = time.perf_counter()
+        REQUESTS_IN_FLIGHT.inc(method=method)
+        span = tracer.start_span(method, attributes={
+            "rpc.system": "jsonrpc",
+            "rpc.method": method,
+            "a2a.task_id": getattr(json_rpc.params, "id", "") or "",
+        })
+        try:
+            with trace.use_span(span):
+                if self.admission is not None and isinstance(json_rpc, (SendTaskRequest, SendTaskStreamingRequest)):
+                    result = await self._admitted(json_rpc)
+                else:
+                    result = await self._dispatch(json_rpc)
+        except ServerBusy:
+            self._observe(method, started, "shed", span)
+            raise
+        except BaseException:
+            self._observe(method, started, "error", span)
+            raise
+
+        if isinstance(result, AsyncIterable):
+            return self._observe_stream(method, started, span, result)
+        self._observe(method, started, "error" if result.error is not None else "ok", span)
+        return result
+
+    @staticmethod
+    def _observe(method: str, started: float, outcome: str, span: trace.Span) -> None:
+        REQUESTS_IN_FLIGHT.dec(method=method)
+        REQUESTS.inc(method=method, outcome=outcome)
+        if outcome != "shed":          # Shed requests never ran; keep them out of latency
+            REQUEST_LATENCY.observe(time.perf_counter() - started, method=method)
+        span.set_attribute("a2a.outcome", outcome)
+        span.end()
+
+    async def _observe_stream(
+        self, method: str, started: float, span: trace.Span, results: AsyncIterable[JSONRPCResponse]
+    ):
+        """Pass a stream through (inside its span), recording the request when it ends."""
+        outcome = "error"
+        try:
+            with trace.use_span(span):
+                async for item in results:
+                    yield item
+            outcome = "ok"
+        finally:
+            self._observe(method, started, outcome, span)
+
+    # -----------------------------------------------------------------------------
+    # 🔀 _dispatch(): Route a parsed request to the task manager
+    # -----------------------------------------------------------------------------
+    async def _dispatch(self, json_rpc):
+        if isinstance(json_rpc, SendTaskRequest):
+            return await self.task_manager.on_send_task(json_rpc)
+        elif isinstance(json_rpc, SendTaskStreamingRequest):
+            return await self.task_manager.on_send_task_subscribe(json_rpc)
+        elif isinstance(json_rpc, GetTaskRequest):
+            return await self.task_manager.on_get_task(json_rpc)
+        elif isinstance(json_rpc, CancelTaskRequest):
+            return await self.task_manager.on_cancel_task(json_rpc)
+        elif isinstance(json_rpc, SetTaskPushNotificationRequest):
+            return await self.task_manager.on_set_task_push_notification(json_rpc)
+        elif isinstance(json_rpc, GetTaskPushNotificationRequest):
+            return await self.task_manager.on_get_task_push_notification(json_rpc)
+        else:
+            raise ValueError(f"Unsupported A2A method: {type(json_rpc)}")
+
+    # -----------------------------------------------------------------------------
+    # 🚦 _admitted(): Run a request inside an admission slot
+    # -----------------------------------------------------------------------------
+    async def _admitted(self, json_rpc):
+        """
+        Waits for a free slot (or raises ServerBusy), then dispatches.
+
+        The slot is held for as long as the agent works on the request:
+        until the reply for tasks/send, until the last event for
+        tasks/sendSubscribe, and until the background job finishes for
+        background tasks/send (which answers while the agent still runs).
+        """
+        await self.admission.acquire()
+        try:
+            result = await self._dispatch(json_rpc)
+        except BaseException:
+            self.admission.release()
+            raise
+
+        if isinstance(result, AsyncIterable):
+            return self._release_after(result)
+
+        job = getattr(self.task_manager, "running", {}).get(json_rpc.params.id)
+        if job is not None and not job.done():
+            job.add_done_callback(lambda _: self.admission.release())
+        else:
+            self.admission.release()
+        return result
+
+    def _busy_error(self, busy: ServerBusy) -> ServerBusyError:
+        """JSON-RPC error for a shed request, with the queue state for the caller."""
+        return ServerBusyError(data={
+            "reason": busy.reason,
+            "retryAfter": busy.retry_after,
+            **self.admission.stats(),
+        })
+
+    @staticmethod
+    def _invalid_request(error: ValidationError, item) -> JSONRPCResponse:
+        """
+        JSON-RPC error for a request object that failed validation: -32601 if
+        only its method is unknown, else -32600. Echoes the request's id when
+        it has a usable one.
+        """
+        request_id = item.get("id") if isinstance(item, dict) else None
+        if not isinstance(request_id, (str, int)):
+            request_id = None
+        if any(err["type"] == "union_tag_invalid" and not err["loc"] for err in error.errors()):
+            return JSONRPCResponse(id=request_id, error=MethodNotFoundError(data={"method": item["method"]}))
+        data = error.errors(include_url=False, include_context=False)
+        return JSONRPCResponse(id=request_id, error=InvalidRequestError(data=data))
+
+    async def _release_after(self, results: AsyncIterable[JSONRPCResponse]):
+        """Pass a stream through, freeing the admission slot when it ends."""
+        try:
+            async for item in results:
+                yield item
+        finally:
+            self.admission.release()
+
+    # -----------------------------------------------------------------------------
+    # 🧾 _create_response(): Converts result object to an HTTP response
     # -----------------------------------------------------------------------------
     def _create_response(self, result):
         """
-        Converts a JSONRPCResponse object into a JSON HTTP response.
+        Converts a JSONRPCResponse object into a JSON HTTP response,
+        or an async stream of responses into a Server-Sent Events stream.
 
         Args:
-            result: The response object (must be a JSONRPCResponse)
+            result: The response object (a JSONRPCResponse or an async iterable of them)
 
         Returns:
-            JSONResponse: Starlette-compatible HTTP response with JSON body
+            Response or StreamingResponse: Starlette-compatible HTTP response
         """
-        if isinstance(result, JSONRPCResponse):
-            # jsonable_encoder automatically handles datetime and UUID
-            return JSONResponse(content=jsonable_encoder(result.model_dump(exclude_none=True)))
+        if isinstance(result, AsyncIterable):
+            # Each streamed JSONRPCResponse becomes one "data:" SSE event
+            return StreamingResponse(
+                self._sse_events(result),
+                media_type="text/event-stream",
+                headers={"Cache-Control": "no-cache"}
+            )
+        elif isinstance(result, JSONRPCResponse):
+            # One pass: model → JSON bytes (no dict / jsonable_encoder / json.dumps)
+            return json_response(result)
         else:
             raise ValueError("Invalid response type")
+
+    # -----------------------------------------------------------------------------
+    # 📡 _sse_events(): Formats streamed responses as Server-Sent Events
+    # -----------------------------------------------------------------------------
+    async def _sse_events(self, results: AsyncIterable[JSONRPCResponse]):
+        """
+        Serializes each JSONRPCResponse into an SSE "data:" frame.
+        If the stream fails midway, a final JSON-RPC error event is sent.
+        """
+        try:
+            async for item in results:
+                yield f"data: {dump_response(item)}\n\n"
+        except Exception as e:
+            logger.error(f"Streaming exception: {e}")
+            error = JSONRPCResponse(id=None, error=InternalError(message=str(e)))
+            yield f"data: {dump_response(error)}\n\n"
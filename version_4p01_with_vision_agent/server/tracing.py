@@ -0,0 +1,100 @@
+# =============================================================================
+# server/tracing.py
+# =============================================================================
+# 🎯 Purpose:
+# OpenTelemetry tracing shared by the A2A server, client, connectors and
+# agents, so one user request can be followed across every hop:
+#
+#   A2AServer (POST /)  →  tasks/send  →  TaskManager.on_send_task
+#     →  <Agent>.invoke  →  ADK invocation / call_llm / execute_tool spans
+#       →  AgentConnector delegation  ──traceparent──▶  child A2AServer ...
+#       →  MCP tool call
+#
+# ✅ Design:
+# - Code only uses the OpenTelemetry API (`tracer` below); until a tracer
+#   provider is configured, every span is a cheap no-op.
+# - W3C `traceparent` is injected into outgoing A2A request headers and
+#   extracted from incoming ones (`inject_headers` / `extract_context`).
+# - `setup_tracing()` configures the SDK: an OTLP/HTTP exporter when
+#   OTEL_EXPORTER_OTLP_ENDPOINT is set (A2AServer.start() calls it), or any
+#   exporter you pass in – e.g. an in-process one for tests:
+#
+#       from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+#       exporter = InMemorySpanExporter()
+#       setup_tracing("test", exporter=exporter)
+#       ...
+#       spans = exporter.get_finished_spans()
+#
+# The OpenTelemetry API and SDK are regular dependencies (google-adk traces
+# its own LLM and tool calls with them too); the OTLP/HTTP exporter is the
+# optional `otlp` extra: `uv sync --extra otlp`.
+# =============================================================================
+
+import logging                    # Reports how tracing was configured
+import os                         # OTEL_* environment variables
+from typing import Mapping
+
+from opentelemetry import propagate, trace
+from opentelemetry.context import Context
+
+logger = logging.getLogger(__name__)
+
+# One tracer for all spans created by this project
+tracer = trace.get_tracer("a2a")
+
+# Only the first configured provider counts (OpenTelemetry allows one per process)
+_provider = None
+
+
+def setup_tracing(service_name: str, exporter=None):
+    """
+    Install an SDK tracer provider (once per process) and return it.
+
+    Args:
+        service_name (str): Reported as `service.name` on every span.
+        exporter (SpanExporter | None): Where spans go. Exported right away
+            (SimpleSpanProcessor), which suits tests. If None, spans are
+            batched to OTLP/HTTP when OTEL_EXPORTER_OTLP_ENDPOINT (or
+            OTEL_EXPORTER_OTLP_TRACES_ENDPOINT) is set; otherwise tracing
+            stays off and None is returned.
+    """
+    global _provider
+    if _provider is not None:
+        return _provider
+
+    from opentelemetry.sdk.resources import Resource
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import BatchSpanProcessor, SimpleSpanProcessor
+
+    if exporter is not None:
+        processor = SimpleSpanProcessor(exporter)
+    elif os.getenv("OTEL_EXPORTER_OTLP_ENDPOINT") or os.getenv("OTEL_EXPORTER_OTLP_TRACES_ENDPOINT"):
+        from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+        exporter = OTLPSpanExporter()                         # Reads the endpoint from the environment
+        processor = BatchSpanProcessor(exporter)
+    else:
+        return None
+
+    _provider = TracerProvider(resource=Resource.create({"service.name": service_name}))
+    _provider.add_span_processor(processor)
+    trace.set_tracer_provider(_provider)
+    logger.info(f"Tracing enabled for {service_name} ({type(exporter).__name__})")
+    return _provider
+
+
+def inject_headers(headers: Mapping[str, str]) -> Mapping[str, str]:
+    """
+    `headers` plus `traceparent` (and `tracestate`) for the current span,
+    so the receiving agent continues the same trace. Returned unchanged
+    when no span is active.
+    """
+    if not trace.get_current_span().get_span_context().is_valid:
+        return headers
+    carrier = dict(headers)
+    propagate.inject(carrier)
+    return carrier
+
+
+def extract_context(headers: Mapping[str, str]) -> Context:
+    """Trace context from an incoming request's `traceparent` header (if any)."""
+    return propagate.extract(headers)
@@ -0,0 +1,180 @@
+# =============================================================================
+# utilities/a2a/agent_catalog.py
+# =============================================================================
+# 🎯 Purpose:
+# Keeps the AgentCards found by DiscoveryClient in memory so agents can look
+# up a child agent (and a ready AgentConnector for it) without running a
+# discovery sweep on every delegation.
+#
+# - Cards are cached for `ttl` seconds.
+# - Once stale, the next lookup still answers from the cache immediately and
+#   a single background task refreshes it (stale-while-revalidate).
+# - Refreshes use conditional GETs (ETag / Last-Modified) via DiscoveryClient.
+# - An agent whose lookup fails in a sweep keeps its last known card; it is
+#   only dropped once it leaves the registry or its URL changes, and its
+#   connector is closed after the delegations still using it have finished.
+# =============================================================================
+
+import time                          # time.monotonic tracks when the cache was filled
+import asyncio                       # asyncio runs the background refresh task
+import logging                       # logging records refresh results and failures
+from typing import List             # List is a type hint for functions that return lists
+
+from models.agent import AgentCard                      # Agent metadata model
+from utilities.a2a.agent_discovery import DiscoveryClient  # Fetches cards from the registry
+from utilities.a2a.agent_connect import AgentConnector    # Sends tasks to a child agent
+
+# Create a named logger for this module
+logger = logging.getLogger(__name__)
+
+
+class AgentCatalog:
+    """
+    📚 In-memory, TTL-cached catalog of A2A agents.
+
+    Attributes:
+        discovery (DiscoveryClient): Used to (re)load the cards.
+        ttl (float): Seconds before cached cards are considered stale.
+
+    Usage:
+        catalog = AgentCatalog()
+        card = await catalog.get_card("TellTimeAgent")
+        connector = await catalog.get_connector("TellTimeAgent")
+        await catalog.aclose()
+    """
+
+    def __init__(self, discovery: DiscoveryClient = None, ttl: float = 60.0):
+        """
+        Args:
+            discovery (DiscoveryClient, optional): Discovery client to use.
+                Defaults to one reading the default agent registry.
+            ttl (float): Cache lifetime in seconds.
+        """
+        self.discovery = discovery or DiscoveryClient()
+        self.ttl = ttl
+        # Lower-cased agent name → AgentCard (case-insensitive O(1) lookups)
+        self._cards: dict[str, AgentCard] = {}
+        # Registry URL → last successfully fetched AgentCard
+        self._cards_by_url: dict[str, AgentCard] = {}
+        # Lower-cased agent name → AgentConnector, created on first use
+        self._connectors: dict[str, AgentConnector] = {}
+        # Dropped connectors → task closing them once their calls are done
+        self._retired: dict[AgentConnector, asyncio.Task] = {}
+        # Monotonic time of the last successful refresh (None = never loaded)
+        self._refreshed_at: float | None = None
+        # Single in-flight refresh shared by all callers
+        self._refresh_task: asyncio.Task | None = None
+
+    # -------------------------------------------------------------------------
+    # Cache maintenance
+    # -------------------------------------------------------------------------
+    def is_stale(self) -> bool:
+        """True if the cache was never loaded or is older than the TTL."""
+        return (
+            self._refreshed_at is None
+            or time.monotonic() - self._refreshed_at >= self.ttl
+        )
+
+    async def refresh(self) -> None:
+        """
+        Run one discovery sweep and swap in the new cards.
+        Concurrent callers share the same in-flight sweep.
+        """
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._refresh())
+        await asyncio.shield(self._refresh_task)
+
+    async def _refresh(self) -> None:
+        """Fetch all cards and rebuild the lookup tables."""
+        results = await self.discovery.discover()
+        # A URL that failed this sweep (timeout, 5xx, ...) keeps its last good
+        # card, so one missed sweep doesn't make a live agent disappear
+        cards_by_url = {}
+        for r in results:
+            if r.ok:
+                cards_by_url[r.url] = r.card
+            elif r.url in self._cards_by_url:
+                cards_by_url[r.url] = self._cards_by_url[r.url]
+        cards = {card.name.lower(): card for card in cards_by_url.values()}
+
+        # Drop connectors whose agent left the registry or moved to another URL
+        for key, connector in list(self._connectors.items()):
+            card = cards.get(key)
+            if card is None or card.url != connector.client.url:
+                del self._connectors[key]
+                self._retire(connector)
+
+        # Swap the table in one assignment so readers never see a partial view
+        self._cards_by_url = cards_by_url
+        self._cards = cards
+        self._refreshed_at = time.monotonic()
+        logger.info(
+            f"AgentCatalog: refreshed {sum(r.ok for r in results)}/{len(results)} agents"
+            f" ({len(cards)} known)"
+        )
+
+    def _retire(self, connector: AgentConnector) -> None:
+        """Close a dropped connector in the background once it is idle."""
+        task = asyncio.create_task(connector.aclose_when_idle())
+        self._retired[connector] = task
+        task.add_done_callback(lambda _: self._retired.pop(connector, None))
+
+    async def _ensure_fresh(self) -> None:
+        """
+        Load the catalog on first use; afterwards, never block a lookup —
+        just kick off a background refresh when the cache is stale.
+        """
+        if self._refreshed_at is None:
+            await self.refresh()
+        elif self.is_stale() and (
+            self._refresh_task is None or self._refresh_task.done()
+        ):
+            self._refresh_task = asyncio.create_task(self._refresh())
+            self._refresh_task.add_done_callback(self._log_refresh_error)
+
+    @staticmethod
+    def _log_refresh_error(task: asyncio.Task) -> None:
+        """Background refresh failures keep the old cards; just log them."""
+        if not task.cancelled() and task.exception():
+            logger.warning(f"AgentCatalog: background refresh failed: {task.exception()}")
+
+    # -------------------------------------------------------------------------
+    # Lookups (O(1), no network calls once loaded)
+    # -------------------------------------------------------------------------
+    async def list_cards(self) -> List[AgentCard]:
+        """Return all known AgentCards."""
+        await self._ensure_fresh()
+        return list(self._cards.values())
+
+    async def get_card(self, name: str) -> AgentCard | None:
+        """Return the AgentCard for `name` (case-insensitive), or None."""
+        await self._ensure_fresh()
+        return self._cards.get(name.lower())
+
+    async def get_connector(self, name: str) -> AgentConnector | None:
+        """
+        Return a cached AgentConnector for `name` (case-insensitive),
+        creating it on first use, or None if the agent is unknown.
+        """
+        card = await self.get_card(name)
+        if card is None:
+            return None
+        key = card.name.lower()
+        connector = self._connectors.get(key)
+        if connector is None:
+            connector = AgentConnector(name=card.name, base_url=card.url)
+            self._connectors[key] = connector
+        return connector
+
+    async def aclose(self) -> None:
+        """Stop any background refresh and close all cached and retired connectors."""
+        if self._refresh_task is not None and not self._refresh_task.done():
+            self._refresh_task.cancel()
+        for connector in self._connectors.values():
+            await connector.aclose()
+        self._connectors.clear()
+        # Shutting down: don't wait for retired connectors to go idle
+        for connector, task in list(self._retired.items()):
+            task.cancel()
+            await connector.aclose()
+        self._retired.clear()
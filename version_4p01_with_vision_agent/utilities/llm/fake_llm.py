@@ -0,0 +1,143 @@
+# =============================================================================
+# utilities/llm/fake_llm.py
+# =============================================================================
+# 🎯 Purpose:
+# A deterministic, offline stand-in for Gemini, so the agent graph (servers,
+# task managers, delegation, MCP) can be load-tested without network access
+# or API quota.
+#
+# ✅ How it behaves:
+# - It first calls the tools in its `tool_plan`, one per model turn, exactly
+#   like a model that decided to use them (e.g. the GreetingAgent's fake
+#   calls list_agents(), then call_agent("TellTimeAgent", ...)).
+# - Then it answers with a fixed-length reply built from the user's query
+#   and the last tool result.
+# - `latency` is the time to the first token, `token_delay` the time per
+#   further token; with streaming, the reply arrives token by token.
+#
+# ✅ How agents use it:
+# Every agent builds its LlmAgent with `model=model_from_env("gemini-...", ...)`.
+# That returns the Gemini model name unless the agent process is started
+# with A2A_LLM_BACKEND=fake:
+#
+#   A2A_LLM_BACKEND=fake A2A_FAKE_LLM_LATENCY=0.2 A2A_FAKE_LLM_TOKEN_DELAY=0.01 \
+#       uv run python3 -m agents.tell_time_agent
+#
+# Environment variables (fake backend only):
+#   A2A_FAKE_LLM_LATENCY      seconds to the first token      (default 0.05)
+#   A2A_FAKE_LLM_TOKEN_DELAY  seconds per further token       (default 0.0)
+#   A2A_FAKE_LLM_TOKENS       tokens in every final reply     (default 16)
+# =============================================================================
+
+import asyncio                    # Simulated model latency
+import os                         # Backend selection via environment variables
+from typing import AsyncGenerator, Dict, List
+
+from google.adk.models.base_llm import BaseLlm       # ADK's model interface
+from google.adk.models.llm_request import LlmRequest
+from google.adk.models.llm_response import LlmResponse
+from google.genai import types                        # Content / Part / FunctionCall
+
+
+class FakeLlm(BaseLlm):
+    """
+    🤖 Scripted ADK model: calls `tool_plan` in order, then replies.
+
+    Attributes:
+        latency (float): Seconds before the first token of every turn.
+        token_delay (float): Seconds between tokens of the final reply.
+        reply_tokens (int): Number of (whitespace-separated) tokens in the reply.
+        tool_plan (list[dict]): Tool calls to make before replying, as
+            {"name": ..., "args": {...}}. String args may contain "{query}",
+            replaced by the user's message. Tools the agent doesn't have
+            are skipped.
+    """
+
+    model: str = "fake-llm"
+    latency: float = 0.05
+    token_delay: float = 0.0
+    reply_tokens: int = 16
+    tool_plan: List[Dict] = []
+
+    async def generate_content_async(
+        self, llm_request: LlmRequest, stream: bool = False
+    ) -> AsyncGenerator[LlmResponse, None]:
+        query, tool_results = _turn_state(llm_request.contents)
+        await asyncio.sleep(self.latency)
+
+        # 🛠️ Next planned tool call (one per model turn)
+        plan = [step for step in self.tool_plan if step["name"] in llm_request.tools_dict]
+        if len(tool_results) < len(plan):
+            step = plan[len(tool_results)]
+            args = {
+                key: value.replace("{query}", query) if isinstance(value, str) else value
+                for key, value in step.get("args", {}).items()
+            }
+            yield LlmResponse(content=types.Content(
+                role="model",
+                parts=[types.Part(function_call=types.FunctionCall(name=step["name"], args=args))],
+            ))
+            return
+
+        # 💬 Final reply, token by token when streaming
+        tokens = self._reply_tokens(query, tool_results)
+        if stream:
+            for i, token in enumerate(tokens):
+                if i:
+                    await asyncio.sleep(self.token_delay)
+                yield LlmResponse(
+                    content=types.Content(role="model", parts=[types.Part(text=token + " ")]),
+                    partial=True,
+                )
+        else:
+            await asyncio.sleep(self.token_delay * (len(tokens) - 1))
+        yield LlmResponse(
+            content=types.Content(role="model", parts=[types.Part(text=" ".join(tokens))]),
+            partial=False,
+            turn_complete=True,
+        )
+
+    def _reply_tokens(self, query: str, tool_results: List[str]) -> List[str]:
+        """Deterministic reply: echo the query (and last tool result), padded to `reply_tokens`."""
+        words = ["Reply", "to:", *query.split()]
+        if tool_results:
+            words += ["|", *tool_results[-1].split()]
+        words = words[:self.reply_tokens]
+        words += [f"t{i}" for i in range(len(words), self.reply_tokens)]
+        return words
+
+
+def _turn_state(contents: List[types.Content]) -> tuple[str, List[str]]:
+    """
+    The latest user text and the tool results received since it.
+
+    ADK sends tool results back as "user" contents with function_response
+    parts, so we walk back until the first real user text.
+    """
+    results: List[str] = []
+    for content in reversed(contents):
+        parts = content.parts or []
+        responses = [p.function_response for p in parts if p.function_response]
+        if responses:
+            results[:0] = [str(r.response) for r in responses]
+            continue
+        if content.role == "user":
+            text = " ".join(p.text for p in parts if p.text)
+            if text:
+                return text, results
+    return "", results
+
+
+def model_from_env(default: str, tool_plan: List[Dict] | None = None) -> str | BaseLlm:
+    """
+    The model an agent should use: `default` (a Gemini model name), or a
+    FakeLlm with `tool_plan` if A2A_LLM_BACKEND=fake.
+    """
+    if os.getenv("A2A_LLM_BACKEND", "gemini").lower() != "fake":
+        return default
+    return FakeLlm(
+        latency=float(os.getenv("A2A_FAKE_LLM_LATENCY", "0.05")),
+        token_delay=float(os.getenv("A2A_FAKE_LLM_TOKEN_DELAY", "0.0")),
+        reply_tokens=int(os.getenv("A2A_FAKE_LLM_TOKENS", "16")),
+        tool_plan=tool_plan or [],
+    )
@@ -20,6 +20,7 @@ from dotenv import load_dotenv  # Loads .env file for environment variables
 # Import the agent logic and its executor
 from .agent import TellTimeAgent                # Defines the actual agent logic
 from .agent_executor import TellTimeAgentExecutor  # Bridges the agent with A2A server
+from .checkpointer import CheckpointStore        # Where conversations are kept (memory or SQLite)
 
 # Import A2A SDK components to create a working agent server
 from a2a.server.apps import A2AStarletteApplication  # Main application class based on Starlette
@@ -38,7 +39,14 @@ load_dotenv()
 @click.command()
 @click.option('--host', 'host', default='localhost')     # Host where the agent will listen (default: localhost)
 @click.option('--port', 'port', default=10000)            # Port where the agent will listen (default: 10000)
-def main(host: str, port: int):
+@click.option('--checkpointer', type=click.Choice(['memory', 'sqlite']), default='memory',
+              help='Where conversations are kept; sqlite survives restarts')
+@click.option('--checkpoint-db', default='checkpoints.sqlite', help='SQLite file for --checkpointer sqlite')
+@click.option('--thread-ttl', default=24 * 3600, help='Seconds an idle conversation is kept (0 = forever)')
+@click.option('--max-threads', default=10_000, help='Most recently used conversations kept (0 = no limit)')
+@click.option('--max-messages', default=20, help='Messages kept per conversation')
+def main(host: str, port: int, checkpointer: str, checkpoint_db: str,
+         thread_ttl: int, max_threads: int, max_messages: int):
     # Check if the required API key is set in environment
     if not os.getenv('GOOGLE_API_KEY'):
         print("GOOGLE_API_KEY environment variable not set.")
@@ -48,8 +56,12 @@ def main(host: str, port: int):
     client = httpx.AsyncClient()
 
     # Set up the request handler for processing incoming tasks
+    # Conversation storage with per-thread retention and a message window
+    checkpoints = CheckpointStore(checkpointer, checkpoint_db, thread_ttl, max_threads)
+    agent = TellTimeAgent(checkpoints, max_messages)
+
     handler = DefaultRequestHandler(
-        agent_executor=TellTimeAgentExecutor(),  # Hook in our custom agent
+        agent_executor=TellTimeAgentExecutor(agent),  # Hook in our custom agent
         task_store=InMemoryTaskStore(),          # Use in-memory store to manage task state
         push_notifier=InMemoryPushNotifier(client),  # Enable server push updates (e.g., via webhook)
     )
@@ -60,9 +72,12 @@ def main(host: str, port: int):
         http_handler=handler,                     # Attach the request handler
     )
 
+    # Close the checkpoint database and the push client when the server stops
+    app = server.build(on_shutdown=[checkpoints.aclose, client.aclose])
+
     # Start the server using uvicorn async server
     import uvicorn
-    uvicorn.run(server.build(), host=host, port=port)
+    uvicorn.run(app, host=host, port=port)
 
 # -----------------------------------------------------------------------------
 # Defines the metadata card for this agent
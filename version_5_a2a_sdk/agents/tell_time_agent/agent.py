@@ -4,7 +4,11 @@
 # Purpose:
 # This file defines the TellTimeAgent.
 # - It uses LangChain ReAct agent with Gemini (via langchain-google-genai)
-# - It supports streaming responses
+# - It supports streaming responses, down to the model's individual tokens
+# - It runs the graph asynchronously (astream / aget_state), so one process
+#   can serve many conversations at once
+# - Its conversations are kept by a CheckpointStore (checkpointer.py): in
+#   memory or in SQLite, with TTL/LRU eviction and a message window
 # - It defines a simple tool: get_time_now()
 # - It handles structured responses with support for multi-turn logic
 # =============================================================================
@@ -18,18 +22,18 @@ from typing import Any, Literal, AsyncIterable     # Type annotations for cleane
 import logging                                     # To optionally print internal debug/info messages
 
 from pydantic import BaseModel                     # Used to define response validation schemas
-from langchain_core.messages import AIMessage, ToolMessage  # Message types from LangChain for interpreting outputs
+from langchain_core.messages import AIMessage, AIMessageChunk, ToolMessage  # Message types from LangChain for interpreting outputs
 from langchain_core.runnables.config import RunnableConfig  # To configure LangChain's agent calls
 from langchain_core.tools import tool              # To define a callable tool for the agent
 from langchain_google_genai import ChatGoogleGenerativeAI  # Gemini LLM integration
-from langgraph.checkpoint.memory import MemorySaver         # In-memory store to manage multi-turn conversation state
 from langgraph.prebuilt import create_react_agent           # To build a full LangGraph ReAct agent from components
 
+from .checkpointer import CheckpointStore, trim_history      # Where conversations are kept, and how much of them
+
 # -----------------------------------------------------------------------------
 # Logging setup
 # -----------------------------------------------------------------------------
 logger = logging.getLogger(__name__)               # Setup logging for debugging (not actively used)
-memory = MemorySaver()                             # Simple in-memory storage for graph state
 
 # -----------------------------------------------------------------------------
 # Tool Definition: get_time_now()
@@ -70,21 +74,35 @@ class TellTimeAgent:
         "and 'error' if something fails. Always include a user-facing message."
     )
 
-    def __init__(self):
+    def __init__(self, checkpoints: CheckpointStore | None = None, max_messages: int = 20):
         # Initialize the Gemini LLM model (fast variant)
         self.model = ChatGoogleGenerativeAI(model="gemini-2.0-flash")
 
         # Register the available tools for this agent
         self.tools = [get_time_now]
 
-        # Create a complete ReAct-style agent graph using LangGraph
-        self.graph = create_react_agent(
-            self.model,
-            tools=self.tools,
-            checkpointer=memory,
-            prompt=self.SYSTEM_INSTRUCTION,
-            response_format=(self.RESPONSE_FORMAT_INSTRUCTION, ResponseFormat),
-        )
+        # Conversation state per session (default: in memory, 24h TTL, 10k threads)
+        self.checkpoints = checkpoints or CheckpointStore()
+        self.max_messages = max_messages  # Message window kept per conversation
+
+        # The graph is built on first use: the SQLite checkpointer needs the running event loop
+        self.graph = None
+
+    async def _get_graph(self):
+        """Create the ReAct-style agent graph (once) with the store's checkpointer."""
+        if self.graph is None:
+            checkpointer = await self.checkpoints.saver()
+            if self.graph is None:
+                # Create a complete ReAct-style agent graph using LangGraph
+                self.graph = create_react_agent(
+                    self.model,
+                    tools=self.tools,
+                    checkpointer=checkpointer,
+                    prompt=self.SYSTEM_INSTRUCTION,
+                    response_format=(self.RESPONSE_FORMAT_INSTRUCTION, ResponseFormat),
+                    pre_model_hook=trim_history(self.max_messages),  # Keep only the latest messages
+                )
+        return self.graph
 
     # -----------------------------------------------------------------------------
     # The `stream` method streams partial updates from the agent in real-time.
@@ -93,6 +111,8 @@ class TellTimeAgent:
 
     # Define an asynchronous method that returns an iterable (like a loop) of dictionaries.
     # Each dictionary is a partial update from the agent.
+    # The graph runs with `astream`, so the server's event loop stays free for other
+    # requests while we wait on the LLM or the tool.
     async def stream(self, query: str, session_id: str) -> AsyncIterable[dict[str, Any]]:
         """
         This function is used when a user sends a message to the agent.
@@ -101,6 +121,8 @@ class TellTimeAgent:
         - 'query' is the user’s question or command (e.g., "What time is it?")
         - 'session_id' is a unique ID for this user's interaction (to maintain context)
         - It yields updates such as "Looking up time...", "Processing...", and the final result.
+        - While the model writes its answer, each new piece of text is yielded
+          right away with 'is_token': True (a delta, not the whole text so far).
         """
 
         # --------------------------------------------------------------
@@ -120,19 +142,45 @@ class TellTimeAgent:
         # --------------------------------------------------------------
         inputs = {"messages": [("user", query)]}
 
+        # --------------------------------------------------------------
+        # Mark this conversation as used (and drop expired / least
+        # recently used ones), then get the graph.
+        # --------------------------------------------------------------
+        await self.checkpoints.touch(session_id)
+        graph = await self._get_graph()
+
         # --------------------------------------------------------------
         # Begin streaming the agent's thinking steps using LangGraph.
-        # Each 'item' is a step in the reasoning (like a thought bubble).
-        # 'stream_mode="values"' tells it to yield useful results only.
+        # With two stream modes, each item is a (mode, chunk) pair:
+        # - "messages": (token chunk, metadata) as the LLM generates text
+        # - "values":   the full state after each step (like a thought bubble)
         # --------------------------------------------------------------
-        for item in self.graph.stream(inputs, config, stream_mode="values"):
+        async for mode, chunk in graph.astream(inputs, config, stream_mode=["messages", "values"]):
+
+            # ----------------------------------------------------------
+            # A token from the model's answer: pass it on immediately.
+            # Only the ReAct "agent" node counts (not the structured-response
+            # call), and tool-call chunks carry no user-facing text.
+            # ----------------------------------------------------------
+            if mode == "messages":
+                token, metadata = chunk
+                text = _text_of(token)
+                if (isinstance(token, AIMessageChunk) and not token.tool_call_chunks
+                        and metadata.get("langgraph_node") == "agent" and text):
+                    yield {
+                        "is_task_complete": False,
+                        "require_user_input": False,
+                        "is_token": True,              # A piece of the answer, not a progress note
+                        "content": text,
+                    }
+                continue
 
             # ----------------------------------------------------------
             # Get the most recent message from the list of all messages.
             # The agent might add multiple messages during the thinking.
             # We only care about the last one for status.
             # ----------------------------------------------------------
-            message = item["messages"][-1]
+            message = chunk["messages"][-1]
 
             # ----------------------------------------------------------
             # If the message is from the AI and includes tool usage,
@@ -160,20 +208,20 @@ class TellTimeAgent:
         # Once the stream ends (no more partial steps), send the final result.
         # This could be a completed message or a follow-up question.
         # --------------------------------------------------------------
-        yield self._final_response(config)
+        yield await self._final_response(config)
 
     # -----------------------------------------------------------------------------
     # This private method gives the final structured result after the stream ends.
     # It reads the agent’s final decision and returns a dictionary with flags.
     # -----------------------------------------------------------------------------
-    def _final_response(self, config: RunnableConfig) -> dict[str, Any]:
+    async def _final_response(self, config: RunnableConfig) -> dict[str, Any]:
         """
         After all streaming messages are done, this function checks what the agent finally decided.
         It uses the config to find the saved response (called 'structured_response').
         """
 
-        # Get the internal memory state from the LangGraph session
-        state = self.graph.get_state(config)
+        # Get the internal memory state from the LangGraph session (without blocking the loop)
+        state = await self.graph.aget_state(config)
 
         # Pull out the structured result (should match the ResponseFormat schema)
         structured = state.values.get("structured_response")
@@ -209,3 +257,18 @@ class TellTimeAgent:
             "content": "Unable to process your request at the moment. Please try again.",  # Default fallback message
         }
     SUPPORTED_CONTENT_TYPES = ["text", "text/plain"]  # Declares formats this agent can handle for input/output
+
+
+# -----------------------------------------------------------------------------
+# Helper: the text of a (streamed) message
+# -----------------------------------------------------------------------------
+def _text_of(message: Any) -> str:
+    """Gemini sends content as a string or as a list of parts; keep only the text."""
+    content = getattr(message, "content", "")
+    if isinstance(content, str):
+        return content
+    return "".join(
+        part if isinstance(part, str) else part.get("text", "")
+        for part in content
+        if isinstance(part, str) or part.get("type") == "text"
+    )
@@ -11,6 +11,8 @@
 # Imports
 # -----------------------------------------------------------------------------
 
+import asyncio  # CancelledError: how tasks/cancel stops a running agent
+
 from .agent import TellTimeAgent  # Imports the TellTimeAgent class from the same directory
 
 # Importing base classes from the A2A SDK to define agent behavior
@@ -22,12 +24,17 @@ from a2a.server.events.event_queue import EventQueue
 
 # Importing event and status types for responding to client
 from a2a.types import (
+    Task,                    # The task being worked on
     TaskArtifactUpdateEvent,  # Event for sending result artifacts back to the client
     TaskStatusUpdateEvent,   # Event for sending status updates (e.g., working, completed)
     TaskStatus,              # Object that holds the current status of the task
     TaskState,               # Enum that defines states: working, completed, input_required, etc.
+    TaskNotCancelableError,  # Error for canceling a task that already finished
 )
 
+# Raises A2A errors (like TaskNotCancelableError) back to the client
+from a2a.utils.errors import ServerError
+
 # Utility functions to create standardized message and artifact formats
 from a2a.utils import (
     new_agent_text_message,  # Creates a message object from agent to client
@@ -35,6 +42,9 @@ from a2a.utils import (
     new_text_artifact        # Creates a textual result artifact
 )
 
+# Tasks in these states are finished and can no longer be canceled
+TERMINAL_STATES = {TaskState.completed, TaskState.canceled, TaskState.failed}
+
 # -----------------------------------------------------------------------------
 # TellTimeAgentExecutor: Connects the agent logic to A2A server infrastructure
 # -----------------------------------------------------------------------------
@@ -45,8 +55,10 @@ class TellTimeAgentExecutor(AgentExecutor):  # Define a new executor by extendin
     the `execute` function to run tasks and push updates to the event queue.
     """
 
-    def __init__(self):  # Constructor for the executor class
-        self.agent = TellTimeAgent()  # Creates an instance of the TellTimeAgent for handling queries
+    def __init__(self, agent: TellTimeAgent | None = None):  # Constructor for the executor class
+        self.agent = agent or TellTimeAgent()  # The TellTimeAgent that handles queries (default settings if not given)
+        self._running: set[str] = set()   # IDs of tasks whose execute() is in progress
+        self._canceled: set[str] = set()  # Those of them stopped by cancel() (see execute)
 
     async def execute(self, context: RequestContext, event_queue: EventQueue) -> None:
         # This method is called when a new task is received
@@ -62,9 +74,44 @@ class TellTimeAgentExecutor(AgentExecutor):  # Define a new executor by extendin
             event_queue.enqueue_event(task)        # Enqueue the new task to notify the A2A server
 
         # Use the agent to handle the query via async stream
+        self._running.add(task.id)
+        try:
+            await self._stream_events(query, task, event_queue)
+        except asyncio.CancelledError:
+            # Stopped by tasks/cancel: cancel() already queued the final "canceled"
+            # status, so return normally and let the request handler close the stream.
+            # Any other cancellation (server shutdown, client gone) propagates.
+            if task.id not in self._canceled:
+                raise
+        finally:
+            self._running.discard(task.id)    # Forget the run, so nothing outlives it
+            self._canceled.discard(task.id)
+
+    async def _stream_events(self, query: str, task: Task, event_queue: EventQueue) -> None:
+        # Forward each update from the agent's stream to the event queue
+        # (The LangGraph run is async, so tasks/cancel interrupts it at its next await)
         async for event in self.agent.stream(query, task.contextId):
+            if event.get('is_token'):  # A piece of the model's answer, as it is generated
+                # Send the new text right away as a "working" update; metadata marks it
+                # as a delta so clients can print tokens inline instead of as messages
+                event_queue.enqueue_event(
+                    TaskStatusUpdateEvent(
+                        taskId=task.id,                 # Task ID
+                        contextId=task.contextId,       # Context ID
+                        status=TaskStatus(
+                            state=TaskState.working,    # Still working: the answer isn't final yet
+                            message=new_agent_text_message(
+                                event['content'],       # Only the new text (a delta)
+                                task.contextId,         # Context ID
+                                task.id                 # Task ID
+                            ),
+                        ),
+                        final=False,                    # More tokens (and the result) follow
+                        metadata={'token': True},       # Marks the update as a token delta
+                    )
+                )
 
-            if event['is_task_complete']:  # If the task has been successfully completed
+            elif event['is_task_complete']:  # If the task has been successfully completed
                 # Send the result artifact to the A2A server
                 event_queue.enqueue_event(
                     TaskArtifactUpdateEvent(
@@ -126,5 +173,25 @@ class TellTimeAgentExecutor(AgentExecutor):  # Define a new executor by extendin
                 )
 
     async def cancel(self, context: RequestContext, event_queue: EventQueue) -> None:
-        # Optional method to cancel long-running tasks (not supported here)
-        raise Exception('Cancel not supported')  # Raise error since this agent doesn’t support canceling
+        # Called for "tasks/cancel". We publish the final "canceled" status here;
+        # the request handler then cancels the asyncio task running execute(),
+        # which stops the agent at its next step.
+        task = context.current_task
+        if task.status.state in TERMINAL_STATES:  # Already finished: nothing to cancel
+            raise ServerError(error=TaskNotCancelableError())
+        event_queue.enqueue_event(self._canceled_event(task.id, task.contextId))
+        if task.id in self._running:              # Tell execute() this cancellation is ours
+            self._canceled.add(task.id)
+
+    @staticmethod
+    def _canceled_event(task_id: str, context_id: str) -> TaskStatusUpdateEvent:
+        # Final "canceled" status update for a task
+        return TaskStatusUpdateEvent(
+            taskId=task_id,                     # ID of the task
+            contextId=context_id,               # Context ID
+            status=TaskStatus(
+                state=TaskState.canceled,       # Mark task as canceled
+                message=new_agent_text_message('Task canceled', context_id, task_id),
+            ),
+            final=True,                         # Nothing follows a cancel
+        )
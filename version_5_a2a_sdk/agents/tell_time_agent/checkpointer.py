@@ -0,0 +1,216 @@
+# =============================================================================
+# agents/tell_time_agent/checkpointer.py
+# =============================================================================
+# Purpose:
+# This file decides where the TellTimeAgent keeps its conversations
+# (LangGraph "checkpoints", one thread per A2A contextId) and how much of them.
+# - "memory": in-process MemorySaver (fast, lost on restart)
+# - "sqlite": a SQLite file, so conversations survive restarts; a thread is
+#   only read back when that conversation continues
+# - Per-thread retention: threads idle longer than a TTL, or beyond the
+#   newest `max_threads` (LRU), are deleted, so storage stays flat no
+#   matter how many contextIds come in
+# - Message window: `trim_history()` keeps only the last N messages of a
+#   thread in its state (and in what the LLM sees)
+# =============================================================================
+
+# -----------------------------------------------------------------------------
+# Imports
+# -----------------------------------------------------------------------------
+
+import asyncio                                     # Lock for the lazily created saver
+import logging                                     # Reports evicted threads
+import time                                        # Wall-clock "last used" times (survive restarts)
+from collections import OrderedDict                # In-memory LRU order of threads
+from typing import Any, Callable, Literal
+
+from langchain_core.messages import RemoveMessage, trim_messages  # Message-window trimming
+from langgraph.checkpoint.base import BaseCheckpointSaver        # Common checkpointer interface
+from langgraph.checkpoint.memory import MemorySaver              # In-memory checkpointer
+from langgraph.graph.message import REMOVE_ALL_MESSAGES          # "Replace the whole message list"
+
+logger = logging.getLogger(__name__)
+
+# At most this many expired threads are deleted per request, so one request
+# never pays for a large backlog (the rest go on the next requests)
+EVICT_BATCH = 100
+
+
+# -----------------------------------------------------------------------------
+# CheckpointStore: the checkpointer plus per-thread TTL / LRU retention
+# -----------------------------------------------------------------------------
+class CheckpointStore:
+    """
+    Owns the LangGraph checkpointer and deletes threads that are no longer needed.
+
+    - 'kind' is "memory" or "sqlite" ('path' is the SQLite file)
+    - 'ttl_seconds': threads not used for this long are deleted (0 = never)
+    - 'max_threads': only the most recently used threads are kept (0 = no limit)
+
+    The agent calls `touch(thread_id)` at the start of every request; expired
+    and least-recently-used threads are deleted right there, so no background
+    task is needed.
+    """
+
+    def __init__(
+        self,
+        kind: Literal["memory", "sqlite"] = "memory",
+        path: str = "checkpoints.sqlite",
+        ttl_seconds: float = 24 * 3600,
+        max_threads: int = 10_000,
+    ):
+        if kind not in ("memory", "sqlite"):
+            raise ValueError(f"Unknown checkpointer: {kind!r} (use 'memory' or 'sqlite')")
+        self.kind = kind
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_threads = max_threads
+        self._saver: BaseCheckpointSaver | None = None
+        self._index: _MemoryIndex | _SqliteIndex | None = None
+        self._lock = asyncio.Lock()
+
+    async def saver(self) -> BaseCheckpointSaver:
+        """
+        The checkpointer to compile the graph with. The SQLite one needs a
+        running event loop, so it is created on first use, not in __init__.
+        """
+        if self._saver is None:
+            async with self._lock:
+                if self._saver is None:
+                    self._saver, self._index = await self._open()
+        return self._saver
+
+    async def touch(self, thread_id: str) -> None:
+        """Mark a thread as used now and delete the threads that expired or overflowed."""
+        saver = await self.saver()
+        now = time.time()
+        cutoff = now - self.ttl_seconds if self.ttl_seconds else float("-inf")
+        evicted = await self._index.touch(thread_id, now, cutoff, self.max_threads)
+        for old_thread_id in evicted:
+            await saver.adelete_thread(old_thread_id)
+        if evicted:
+            logger.info(f"Evicted {len(evicted)} checkpoint thread(s)")
+
+    async def aclose(self) -> None:
+        """Close the SQLite connections (no-op for the in-memory store)."""
+        if self._index is not None:
+            await self._index.aclose()
+        if self.kind == "sqlite" and self._saver is not None:
+            await self._saver.conn.close()
+
+    async def _open(self) -> tuple[BaseCheckpointSaver, "_MemoryIndex | _SqliteIndex"]:
+        if self.kind == "memory":
+            return MemorySaver(), _MemoryIndex()
+
+        # Only needed for the SQLite option: pip/uv add langgraph-checkpoint-sqlite aiosqlite
+        import aiosqlite
+        from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
+
+        saver = AsyncSqliteSaver(aiosqlite.connect(self.path))
+        await saver.setup()                           # Creates the checkpoint tables once
+        index = _SqliteIndex(await aiosqlite.connect(self.path))
+        await index.setup()
+        return saver, index
+
+
+# -----------------------------------------------------------------------------
+# "Last used" indexes: which threads to evict
+# -----------------------------------------------------------------------------
+class _MemoryIndex:
+    """Threads in least-recently-used order (lost on restart, like MemorySaver)."""
+
+    def __init__(self):
+        self._last_used: OrderedDict[str, float] = OrderedDict()
+
+    async def touch(self, thread_id: str, now: float, cutoff: float, max_threads: int) -> list[str]:
+        self._last_used[thread_id] = now
+        self._last_used.move_to_end(thread_id)
+
+        # The oldest threads are at the front: pop while over the limit or expired
+        evicted = []
+        while len(self._last_used) > 1 and len(evicted) < EVICT_BATCH:
+            oldest, last_used = next(iter(self._last_used.items()))
+            if not (max_threads and len(self._last_used) > max_threads) and last_used >= cutoff:
+                break
+            self._last_used.popitem(last=False)
+            evicted.append(oldest)
+        return evicted
+
+    async def aclose(self) -> None:
+        pass
+
+
+class _SqliteIndex:
+    """
+    Threads' last-used times in a table next to the checkpoints, so retention
+    keeps working across restarts without loading anything up front.
+    """
+
+    def __init__(self, conn):
+        self.conn = conn
+        self._count = 0                               # Threads in the table (kept in step, no COUNT(*) per request)
+
+    async def setup(self) -> None:
+        await self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS thread_last_used (thread_id TEXT PRIMARY KEY, last_used REAL NOT NULL)"
+        )
+        await self.conn.execute(
+            "CREATE INDEX IF NOT EXISTS thread_last_used_by_time ON thread_last_used (last_used)"
+        )
+        await self.conn.commit()
+        async with self.conn.execute("SELECT COUNT(*) FROM thread_last_used") as cur:
+            self._count = (await cur.fetchone())[0]
+
+    async def touch(self, thread_id: str, now: float, cutoff: float, max_threads: int) -> list[str]:
+        async with self.conn.execute(
+            "UPDATE thread_last_used SET last_used = ? WHERE thread_id = ?", (now, thread_id)
+        ) as cur:
+            is_new = cur.rowcount == 0
+        if is_new:
+            await self.conn.execute("INSERT INTO thread_last_used VALUES (?, ?)", (thread_id, now))
+            self._count += 1
+
+        # Expired threads first, then the least recently used beyond the limit
+        overflow = max(self._count - max_threads, 0) if max_threads else 0
+        async with self.conn.execute(
+            "SELECT thread_id FROM thread_last_used WHERE thread_id != ? AND (last_used < ? OR rowid IN "
+            "(SELECT rowid FROM thread_last_used ORDER BY last_used LIMIT ?)) ORDER BY last_used LIMIT ?",
+            (thread_id, cutoff, overflow, EVICT_BATCH),
+        ) as cur:
+            evicted = [row[0] for row in await cur.fetchall()]
+        if evicted:
+            await self.conn.executemany("DELETE FROM thread_last_used WHERE thread_id = ?", [(t,) for t in evicted])
+            self._count -= len(evicted)
+        await self.conn.commit()
+        return evicted
+
+    async def aclose(self) -> None:
+        await self.conn.close()
+
+
+# -----------------------------------------------------------------------------
+# Message window: keep only the latest messages of a conversation
+# -----------------------------------------------------------------------------
+def trim_history(max_messages: int) -> Callable[[dict[str, Any]], dict[str, Any]]:
+    """
+    A `pre_model_hook` for create_react_agent that keeps the last
+    'max_messages' messages (starting at a user message, so tool calls and
+    their results stay together). The trimmed list replaces the thread's
+    state, so checkpoints stop growing with the conversation.
+    """
+    def pre_model_hook(state: dict[str, Any]) -> dict[str, Any]:
+        messages = state["messages"]
+        if len(messages) <= max_messages:
+            return {"llm_input_messages": messages}  # Nothing to trim: leave the state alone
+
+        kept = trim_messages(
+            messages,
+            strategy="last",           # Keep the newest messages
+            token_counter=len,         # Count messages, not tokens
+            max_tokens=max_messages,
+            start_on="human",          # Never start with an orphaned tool result
+            include_system=True,
+        )
+        return {"messages": [RemoveMessage(id=REMOVE_ALL_MESSAGES), *kept]}
+
+    return pre_model_hook
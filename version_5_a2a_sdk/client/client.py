@@ -104,9 +104,19 @@ async def handle_streaming(client: A2AClient, text: str, task_id: str | None = N
     latest_task_id = None
     latest_context_id = None
     input_required = False
+    in_tokens = False  # True while token deltas are being printed on one line
 
     # Process each streamed update
     async for update in client.send_message_streaming(request):
+        result = getattr(update.root, "result", None)
+        if getattr(result, "metadata", None) and result.metadata.get("token"):
+            # Token deltas: print the text inline as it arrives, not as a JSON block each
+            print("".join(p.root.text for p in result.status.message.parts if hasattr(p.root, "text")), end="", flush=True)
+            in_tokens = True
+            continue
+        if in_tokens:
+            print()  # End the line of streamed tokens
+            in_tokens = False
         print_json_response(update, "Streaming Update")  # Print each update as it comes
 
         # Extract context/task from current update
@@ -60,7 +60,10 @@ async def main(host: str, port: int):
     config = uvicorn.Config(server.build(), host=host, port=port)
     server_instance = uvicorn.Server(config)
     
-    await server_instance.serve()
+    try:
+        await server_instance.serve()
+    finally:
+        await agent_executor.aclose()
 
 
 if __name__ == "__main__":
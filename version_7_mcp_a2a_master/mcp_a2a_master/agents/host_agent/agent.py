@@ -1,12 +1,16 @@
+import asyncio
 from collections.abc import AsyncIterable
+from contextvars import ContextVar
 import json
-from typing import Any
+from typing import Any, Callable
 from uuid import uuid4
-from utilities.a2a.agent_connect import AgentConnector
+from utilities.a2a.agent_catalog import AgentCatalog
 from utilities.a2a.agent_discovery import AgentDiscovery
 from utilities.common.file_loader import load_instructions_file
+from utilities.common.adk_events import event_text
 from google.adk.agents import LlmAgent
 from google.adk import Runner
+from google.adk.agents.run_config import RunConfig, StreamingMode
 
 from google.adk.artifacts import InMemoryArtifactService
 from google.adk.sessions import InMemorySessionService
@@ -19,11 +23,17 @@ from rich.syntax import Syntax
 
 from utilities.mcp.mcp_connect import MCPConnector
 
-from a2a.types import AgentCard
+from a2a.types import AgentCard, Artifact
 
 from dotenv import load_dotenv
 load_dotenv()
 
+# Set by invoke() for its run: passes the text a child agent streams back
+# to the delegating _delgate_task call on to invoke()'s caller
+_child_chunks: ContextVar[Callable[[str, Artifact, str], None] | None] = ContextVar(
+    "child_chunks", default=None
+)
+
 class HostAgent:
     """
     Orchestrator agent 
@@ -38,6 +48,7 @@ class HostAgent:
         
         self.MCPConnector = MCPConnector()
         self.AgentDiscovery = AgentDiscovery()
+        self.AgentCatalog = AgentCatalog(discovery=self.AgentDiscovery)
         
         self._agent = None
         self._user_id = "host_agent_user"
@@ -53,6 +64,12 @@ class HostAgent:
             memory_service=InMemoryMemoryService(),
         )
 
+    async def aclose(self):
+        """
+        Closes the cached A2A agent connectors
+        """
+        await self.AgentCatalog.aclose()
+
     async def _list_agents(self) -> list[dict]:
         """
         A2A tool: returns the list of dictionaries with agent card 
@@ -61,26 +78,23 @@ class HostAgent:
         Returns:
             list[dict]: List of agent card object dictionaries
         """
-        cards = await self.AgentDiscovery.list_agent_cards()
+        cards = await self.AgentCatalog.list_cards()
 
         return [card.model_dump(exclude_none=True) for card in cards]
 
     async def _delgate_task(self, agent_name: str, message: str) -> str:
-        cards = await self.AgentDiscovery.list_agent_cards()
-
-        matched_card = None
-        for card in cards:
-            if card.name.lower() == agent_name.lower():
-                matched_card = card
-            elif getattr(card, "id","").lower() == agent_name.lower():
-                matched_card = card
-        
-        if matched_card is None:
+        connector = await self.AgentCatalog.get_connector(agent_name)
+
+        if connector is None:
             return "Agent not found"
-        
-        connector = AgentConnector(agent_card=matched_card)
 
-        return await connector.send_task(message=message, session_id=str(uuid4()))
+        forward = _child_chunks.get()
+        on_chunk = None
+        if forward is not None:
+            def on_chunk(artifact: Artifact, text: str) -> None:
+                forward(agent_name, artifact, text)
+
+        return await connector.send_task(message=message, session_id=str(uuid4()), on_chunk=on_chunk)
 
                 
     
@@ -108,6 +122,9 @@ class HostAgent:
         {
             'is_task_complete': bool,  # Indicates if the task is complete
             'updates': str,  # Updates on the task progress
+            'delta': str,  # Next piece of the answer's text, as the model streams it
+            'source': str,  # With 'delta' from a child agent: which streamed answer it belongs to
+            'name': str,  # With 'source': name for that answer's artifact
             'content': str  # Final result of the task if complete
         }
         
@@ -132,30 +149,81 @@ class HostAgent:
             parts = [types.Part.from_text(text=query)]
         )
 
-        async for event in self._runner.run_async(
-            user_id=self._user_id,
-            session_id=session_id,
-            new_message=user_content
-        ):
-            print_json_response(event, "================ NEW EVENT ================")
-            
-            print(f"is_final_response: {event.is_final_response()}")    
-            
-            if event.is_final_response():
-                
-                final_response = ""
-                if event.content and event.content.parts and event.content.parts[-1].text:
-                    final_response = event.content.parts[-1].text
-                
-                yield {
-                    'is_task_complete': True,
-                    'content': final_response
-                }
-            else:
-                yield {
+        # The runner is pumped in its own task, so a child agent's streamed
+        # answer (put on `items` by _delgate_task) can be passed on while the
+        # tool call that delegated it is still running
+        items: asyncio.Queue = asyncio.Queue()
+        done = object()
+
+        def forward_child_chunk(agent_name: str, artifact: Artifact, text: str) -> None:
+            items.put_nowait({
+                'is_task_complete': False,
+                'delta': text,
+                'source': f"{agent_name}/{artifact.artifactId}",
+                'name': f"{agent_name}: {artifact.name or 'response'}",
+            })
+
+        async def pump() -> None:
+            try:
+                async for event in self._runner.run_async(
+                    user_id=self._user_id,
+                    session_id=session_id,
+                    new_message=user_content,
+                    run_config=RunConfig(streaming_mode=StreamingMode.SSE)
+                ):
+                    items.put_nowait(event)
+            finally:
+                items.put_nowait(done)
+
+        token = _child_chunks.set(forward_child_chunk)
+        runner = asyncio.create_task(pump())   # The task copies the context, so tools see the callback
+        _child_chunks.reset(token)
+
+        try:
+            while (item := await items.get()) is not done:
+                update = item if isinstance(item, dict) else self._update(item)
+                if update is not None:
+                    yield update
+            await runner   # Re-raises the runner's error, if any
+        finally:
+            if not runner.done():
+                # Stopped early (e.g. tasks/cancel): stop the run too, and let
+                # an in-flight AgentConnector cancel its child's task
+                runner.cancel()
+                await asyncio.gather(runner, return_exceptions=True)
+
+    def _update(self, event: Any) -> dict | None:
+        """
+        The update invoke() yields for one runner event (None for nothing)
+        """
+        if event.partial:
+            # Streamed chunk of the answer: pass the new text on right away
+            delta = event_text(event)
+            if delta:
+                return {
                     'is_task_complete': False,
-                    'updates': "Agent is processing your request..."
+                    'delta': delta
                 }
+            return None
+
+        print_json_response(event, "================ NEW EVENT ================")
+        
+        print(f"is_final_response: {event.is_final_response()}")    
+        
+        if event.is_final_response():
+            
+            final_response = ""
+            if event.content and event.content.parts and event.content.parts[-1].text:
+                final_response = event.content.parts[-1].text
+            
+            return {
+                'is_task_complete': True,
+                'content': final_response
+            }
+        return {
+            'is_task_complete': False,
+            'updates': "Agent is processing your request..."
+        }
 
 def print_json_response(response: Any, title: str) -> None:
     # Displays a formatted and color-highlighted view of the response
@@ -1,7 +1,9 @@
 from collections.abc import AsyncIterable
 from utilities.common.file_loader import load_instructions_file
+from utilities.common.adk_events import event_text
 from google.adk.agents import LlmAgent
 from google.adk import Runner
+from google.adk.agents.run_config import RunConfig, StreamingMode
 
 from google.adk.artifacts import InMemoryArtifactService
 from google.adk.sessions import InMemorySessionService
@@ -54,6 +56,7 @@ class WebsiteBuilderSimple:
         {
             'is_task_complete': bool,  # Indicates if the task is complete
             'updates': str,  # Updates on the task progress
+            'delta': str,  # Next piece of the answer's text, as the model streams it
             'content': str  # Final result of the task if complete
         }
         
@@ -80,8 +83,19 @@ class WebsiteBuilderSimple:
         async for event in self._runner.run_async(
             user_id=self._user_id,
             session_id=session_id,
-            new_message=user_content
+            new_message=user_content,
+            run_config=RunConfig(streaming_mode=StreamingMode.SSE)
         ):
+            if event.partial:
+                # Streamed chunk of the answer: pass the new text on right away
+                delta = event_text(event)
+                if delta:
+                    yield {
+                        'is_task_complete': False,
+                        'delta': delta
+                    }
+                continue
+
             print_json_response(event, "================ NEW EVENT ================")
             
             print(f"is_final_response: {event.is_final_response()}")    
@@ -8,12 +8,13 @@ from a2a.utils import (
     new_agent_text_message
 )
 
-from a2a.utils.errors import ServerError
+from utilities.a2a.artifact_stream import ArtifactStreams
+from utilities.a2a.event_flush import flush_events
+from utilities.a2a.task_cancel import CancelTracker, cancel_task
 
 from a2a.types import (
     Task,
-    TaskState,
-    UnsupportedOperationError
+    TaskState
 )
 
 import asyncio
@@ -26,6 +27,7 @@ class WebsiteBuilderSimpleAgentExecutor(AgentExecutor):
 
     def __init__(self):
         self.agent = WebsiteBuilderSimple()
+        self._cancels = CancelTracker()
     
     async def execute(self, context: RequestContext, event_queue: EventQueue) -> None:
         """
@@ -38,12 +40,24 @@ class WebsiteBuilderSimpleAgentExecutor(AgentExecutor):
             await event_queue.enqueue_event(task)
 
         updater = TaskUpdater(event_queue, task.id, task.contextId)
+
+        # Streamed text goes to artifacts chunk by chunk: one per model turn
+        # (and per child agent answer passed on), closed when the turn ends
+        artifacts = ArtifactStreams(updater)
         
+        self._cancels.start(task.id)
         try:
             async for item in self.agent.invoke(query, task.contextId):
                 is_task_complete = item.get("is_task_complete", False)
 
-                if not is_task_complete:
+                if item.get('delta'):
+                    await artifacts.add(
+                        item['delta'],
+                        source=item.get('source', ''),
+                        name=item.get('name', 'response'),
+                    )
+                elif not is_task_complete:
+                    await artifacts.close()  # The model turn ended (e.g. with a tool call)
                     message = item.get('updates','The Agent is still working on your request.')
                     await updater.update_status(
                         TaskState.working,
@@ -51,14 +65,21 @@ class WebsiteBuilderSimpleAgentExecutor(AgentExecutor):
                     )
                 else:
                     final_result = item.get('content','no result received')
+                    # The last artifact holds the final turn's text, which the completed status also carries
+                    await artifacts.close()
                     await updater.update_status(
                         TaskState.completed,
                         new_agent_text_message(final_result, task.contextId, task.id)
                     )
 
-                    await asyncio.sleep(0.1)  # Allow time for the message to be processed
+                    await flush_events(event_queue)  # Returns once the completed update is consumed
 
                     break
+        except asyncio.CancelledError:
+            # Stopped by tasks/cancel: cancel() already published "canceled",
+            # so return and let the request handler close the stream
+            if not self._cancels.stopped_by_cancel(task.id):
+                raise
         except Exception as e:
             error_message = f"An error occurred: {str(e)}"
             await updater.update_status(
@@ -66,7 +87,13 @@ class WebsiteBuilderSimpleAgentExecutor(AgentExecutor):
                 new_agent_text_message(error_message, task.contextId, task.id)
             )
             raise
+        finally:
+            self._cancels.finish(task.id)
 
     async def cancel(self, request: RequestContext, event_queue: EventQueue) -> Task | None:
-        raise ServerError(error=UnsupportedOperationError())
+        """
+        Publishes the final "canceled" status (see utilities.a2a.task_cancel)
+        """
+        await cancel_task(request, event_queue, self._cancels)
+        return None
     
\ No newline at end of file
@@ -3,6 +3,7 @@ from uuid import uuid4
 from a2a.client import A2ACardResolver
 from a2a.types import (
     AgentCard,
+    Artifact,
 )
 import asyncclick as click
 import httpx
@@ -41,8 +42,28 @@ async def cli(agent: str, session: str):
 
         connector = AgentConnector(card)
 
-        response = await connector.send_task(message=prompt, session_id=session_id)
-        print("\nAgent says:", response)
+        # Print the text as it streams in, one block per artifact (model turn or
+        # child agent's answer); artifact id -> text streamed so far
+        streamed: dict[str, str] = {}
+
+        def print_chunk(artifact: Artifact, text: str) -> None:
+            if artifact.artifactId not in streamed:
+                label = "Agent says" if artifact.name == "response" else artifact.name
+                print(f"\n{label}: ", end="")
+                streamed[artifact.artifactId] = ""
+            streamed[artifact.artifactId] += text
+            print(text, end="", flush=True)
+
+        try:
+            response = await connector.send_task(message=prompt, session_id=session_id, on_chunk=print_chunk)
+        finally:
+            await connector.aclose()
+        if streamed:
+            print()
+        # The last streamed block is the final answer unless the agent didn't stream it
+        last = list(streamed.values())[-1] if streamed else None
+        if last is None or last.strip() != response.strip():
+            print("\nAgent says:", response)
 
 if __name__ == "__main__":
     asyncio.run(cli())
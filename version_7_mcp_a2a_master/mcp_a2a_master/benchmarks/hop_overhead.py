@@ -0,0 +1,137 @@
+"""
+Per-hop overhead of an A2A delegation chain (host -> child -> ... -> leaf)
+
+Every hop runs the real WebsiteBuilderSimpleAgentExecutor behind a real
+A2A server on localhost, with a scripted agent instead of the LLM: the
+leaf answers at once, every other hop forwards the query to the next one
+with AgentConnector. What is left is the framework's own cost per hop
+(HTTP, JSON-RPC, event queue, executor), e.g. a fixed sleep after the
+final status update would show up here as +100 ms per hop.
+
+Usage:
+    uv run python3 -m benchmarks.hop_overhead --hops 3 --requests 50
+    uv run python3 -m benchmarks.hop_overhead --hops 3 --legacy-sleep   # old 100 ms sleep, for comparison
+"""
+import asyncio
+import socket
+import statistics
+import time
+from uuid import uuid4
+
+import asyncclick as click
+import uvicorn
+from a2a.server.apps import A2AStarletteApplication
+from a2a.server.request_handlers import DefaultRequestHandler
+from a2a.server.tasks import InMemoryTaskStore
+from a2a.types import AgentCapabilities, AgentCard
+
+import agents.website_builder_simple.agent_executor as executor_module
+from agents.website_builder_simple.agent_executor import WebsiteBuilderSimpleAgentExecutor
+from utilities.a2a.agent_connect import AgentConnector
+
+
+class ScriptedAgent:
+    """
+    Stands in for the LLM agent: one progress update, then the reply
+    (the leaf's own, or the next hop's)
+    """
+
+    def __init__(self, next_hop: AgentConnector | None):
+        self.next_hop = next_hop
+
+    async def invoke(self, query: str, session_id: str):
+        yield {"is_task_complete": False, "updates": "working"}
+        if self.next_hop is None:
+            content = f"leaf:{query}"
+        else:
+            content = await self.next_hop.send_task(query, session_id)
+        yield {"is_task_complete": True, "content": content}
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _card(port: int) -> AgentCard:
+    return AgentCard(
+        name=f"hop_{port}",
+        description="benchmark hop",
+        url=f"http://127.0.0.1:{port}/",
+        version="1.0.0",
+        defaultInputModes=["text"],
+        defaultOutputModes=["text"],
+        skills=[],
+        capabilities=AgentCapabilities(streaming=True),
+    )
+
+
+async def _start_chain(hops: int) -> tuple[AgentCard, list[uvicorn.Server]]:
+    """
+    Start `hops` servers, leaf first; returns the first hop's card
+    """
+    servers, next_hop, card = [], None, None
+    for _ in range(hops):
+        port = _free_port()
+        card = _card(port)
+        executor = WebsiteBuilderSimpleAgentExecutor()
+        executor.agent = ScriptedAgent(next_hop)
+        app = A2AStarletteApplication(
+            agent_card=card,
+            http_handler=DefaultRequestHandler(agent_executor=executor, task_store=InMemoryTaskStore()),
+        ).build()
+        server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning"))
+        asyncio.create_task(server.serve())
+        while not server.started:
+            await asyncio.sleep(0.01)
+        servers.append(server)
+        next_hop = AgentConnector(card)
+    return card, servers
+
+
+async def _measure(hops: int, requests: int) -> list[float]:
+    card, servers = await _start_chain(hops)
+    connector = AgentConnector(card)
+    try:
+        await connector.send_task("warmup", uuid4().hex)
+        samples = []
+        for _ in range(requests):
+            started = time.perf_counter()
+            reply = await connector.send_task("ping", uuid4().hex)
+            samples.append(time.perf_counter() - started)
+            assert reply == "leaf:ping", reply
+        return samples
+    finally:
+        for server in servers:
+            server.should_exit = True
+        await asyncio.sleep(0.2)
+
+
+@click.command()
+@click.option("--hops", default=3, help="Length of the longest chain (1 = the client talks to the leaf)")
+@click.option("--requests", default=50, help="Sequential tasks per chain length")
+@click.option("--legacy-sleep", is_flag=True, help="Put back the fixed 100 ms sleep after the final update")
+async def cli(hops: int, requests: int, legacy_sleep: bool):
+    """
+    Measure end-to-end latency for chains of 1..hops agents and the cost of each extra hop
+    """
+    if legacy_sleep:
+        async def sleep_instead_of_flush(event_queue):
+            await asyncio.sleep(0.1)
+        executor_module.flush_events = sleep_instead_of_flush
+
+    medians = []
+    for depth in range(1, hops + 1):
+        samples = sorted(await _measure(depth, requests))
+        medians.append(statistics.median(samples))
+        p95 = samples[max(0, round(0.95 * len(samples)) - 1)]
+        print(f"{depth} hop(s): p50={medians[-1] * 1000:8.2f} ms  p95={p95 * 1000:8.2f} ms  (n={len(samples)})")
+
+    if hops > 1:
+        per_hop = (medians[-1] - medians[0]) / (hops - 1)
+        print(f"per-hop overhead (p50): {per_hop * 1000:.2f} ms")
+
+
+if __name__ == "__main__":
+    asyncio.run(cli())
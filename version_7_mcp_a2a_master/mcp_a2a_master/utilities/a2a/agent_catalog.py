@@ -0,0 +1,134 @@
+import asyncio
+import time
+
+from a2a.types import AgentCard
+
+from utilities.a2a.agent_connect import AgentConnector
+from utilities.a2a.agent_discovery import AgentDiscovery
+
+
+class AgentCatalog:
+    """
+    In-memory, TTL-cached view of the agents found by AgentDiscovery.
+
+    Lookups by name are O(1) dictionary reads and never hit the network
+    once the catalog is loaded. When the cache is older than the TTL the
+    current cards are still served and a single background task refreshes
+    them (conditional requests via AgentDiscovery keep that cheap).
+
+    An agent whose lookup fails in a sweep keeps its last known card; it is
+    only dropped once it leaves the registry or its card changes.
+
+    Attributes:
+        discovery (AgentDiscovery): Used to (re)load the agent cards.
+        ttl (float): Seconds before the cached cards are considered stale.
+    """
+
+    def __init__(self, discovery: AgentDiscovery = None, ttl: float = 60.0):
+        self.discovery = discovery or AgentDiscovery()
+        self.ttl = ttl
+        # registry url -> last successfully fetched AgentCard
+        self._cards_by_url: dict[str, AgentCard] = {}
+        # lower-cased agent name -> AgentCard / AgentConnector
+        self._cards: dict[str, AgentCard] = {}
+        self._connectors: dict[str, AgentConnector] = {}
+        # Dropped connectors still finishing a delegation -> their closing task
+        self._retired: dict[AgentConnector, asyncio.Task] = {}
+        self._refreshed_at: float | None = None
+        self._refresh_task: asyncio.Task | None = None
+
+    def is_stale(self) -> bool:
+        return (
+            self._refreshed_at is None
+            or time.monotonic() - self._refreshed_at >= self.ttl
+        )
+
+    async def refresh(self) -> None:
+        """
+        Runs one discovery sweep; concurrent callers share the same sweep.
+        """
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._refresh())
+        await asyncio.shield(self._refresh_task)
+
+    async def _refresh(self) -> None:
+        results = await self.discovery.discover()
+        # A url that failed this sweep keeps its last good card
+        cards_by_url = {}
+        for r in results:
+            if r.ok:
+                cards_by_url[r.url] = r.card
+            elif r.url in self._cards_by_url:
+                cards_by_url[r.url] = self._cards_by_url[r.url]
+        cards = {card.name.lower(): card for card in cards_by_url.values()}
+
+        # Forget connectors for agents that disappeared or changed
+        for key, connector in list(self._connectors.items()):
+            if cards.get(key) != connector.agent_card:
+                del self._connectors[key]
+                self._retire(connector)
+
+        self._cards_by_url = cards_by_url
+        self._cards = cards
+        self._refreshed_at = time.monotonic()
+
+    def _retire(self, connector: AgentConnector) -> None:
+        """
+        Closes a dropped connector in the background once it is idle
+        """
+        task = asyncio.create_task(connector.aclose_when_idle())
+        self._retired[connector] = task
+        task.add_done_callback(lambda _: self._retired.pop(connector, None))
+
+    async def _ensure_fresh(self) -> None:
+        if self._refreshed_at is None:
+            await self.refresh()
+        elif self.is_stale() and (
+            self._refresh_task is None or self._refresh_task.done()
+        ):
+            self._refresh_task = asyncio.create_task(self._refresh())
+            self._refresh_task.add_done_callback(self._report_refresh_error)
+
+    @staticmethod
+    def _report_refresh_error(task: asyncio.Task) -> None:
+        if not task.cancelled() and task.exception():
+            print(f"Agent catalog refresh failed: {task.exception()}")
+
+    async def list_cards(self) -> list[AgentCard]:
+        await self._ensure_fresh()
+        return list(self._cards.values())
+
+    async def get_card(self, name: str) -> AgentCard | None:
+        """
+        Returns the AgentCard registered under `name` (case-insensitive)
+        """
+        await self._ensure_fresh()
+        return self._cards.get(name.lower())
+
+    async def get_connector(self, name: str) -> AgentConnector | None:
+        """
+        Returns a cached AgentConnector for `name`, or None if unknown
+        """
+        card = await self.get_card(name)
+        if card is None:
+            return None
+
+        key = card.name.lower()
+        if key not in self._connectors:
+            self._connectors[key] = AgentConnector(agent_card=card)
+        return self._connectors[key]
+
+    async def aclose(self) -> None:
+        """
+        Stops any background refresh and closes all cached and retired connectors
+        """
+        if self._refresh_task is not None and not self._refresh_task.done():
+            self._refresh_task.cancel()
+        for connector in self._connectors.values():
+            await connector.aclose()
+        self._connectors.clear()
+        # Shutting down: don't wait for retired connectors to go idle
+        for connector, task in list(self._retired.items()):
+            task.cancel()
+            await connector.aclose()
+        self._retired.clear()
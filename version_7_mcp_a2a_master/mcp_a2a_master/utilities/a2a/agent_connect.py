@@ -1,10 +1,19 @@
-from typing import Any
+import asyncio
+from typing import Any, Callable
 from uuid import uuid4
 from a2a.types import (
-    AgentCard, 
+    AgentCard,
+    Artifact,
     Task,
-    SendMessageRequest,
-    MessageSendParams
+    Message,
+    CancelTaskRequest,
+    JSONRPCErrorResponse,
+    MessageSendParams,
+    SendStreamingMessageRequest,
+    TaskArtifactUpdateEvent,
+    TaskIdParams,
+    TaskStatusUpdateEvent,
+    TextPart
 )
 import httpx
 from a2a.client import A2AClient
@@ -12,29 +21,49 @@ from a2a.client import A2AClient
 class AgentConnector:
     """
     Connects to a remote A2A agent and provides a uniform method to delegate tasks
+
+    Tasks are sent with message/stream, so the child's task id is known from
+    the first event. If the caller is cancelled while waiting (e.g. the host
+    agent's own task got a tasks/cancel), the child's task is canceled too.
+
+    The connector keeps one pooled httpx client, so repeated delegations
+    reuse connections; call aclose() when done with it.
     """
 
-    def __init__(self, agent_card: AgentCard):
+    def __init__(self, agent_card: AgentCard, cancel_timeout: float = 5.0):
         self.agent_card = agent_card
+        self.cancel_timeout = cancel_timeout
+        self._httpx_client = httpx.AsyncClient(timeout=300.0)
+        self._a2a_client = A2AClient(
+            httpx_client=self._httpx_client,
+            agent_card=self.agent_card,
+        )
+        # send_task calls in progress; set while there are none (see aclose_when_idle)
+        self._in_flight = 0
+        self._idle = asyncio.Event()
+        self._idle.set()
 
-    async def send_task(self, message: str, session_id: str) -> str:
+    async def send_task(
+        self, message: str, session_id: str, on_chunk: Callable[[Artifact, str], None] | None = None
+    ) -> str:
         """
-        Send a task to the agent and return the Task object
-        
+        Send a task to the agent and return its final response text
+
         Args:
             message (str): The message to send to the agent
             session_id (str): The session ID for tracking the task
+            on_chunk (Callable[[Artifact, str], None] | None): Called with the
+                artifact and the text of each chunk the agent streams, as it
+                arrives (one artifact per model turn, so the last one holds
+                the final answer)
 
         Returns:
-            Task: The Task object containing the response from the agent
+            str: The text of the agent's final status message
         """
 
-        async with httpx.AsyncClient(timeout = 300.0) as httpx_client:
-            a2a_client = A2AClient(
-                httpx_client=httpx_client,
-                agent_card=self.agent_card,
-            )
-
+        self._in_flight += 1
+        self._idle.clear()
+        try:
             send_message_payload: dict[str, Any] = {
                 'message': {
                     'role': 'user',
@@ -48,22 +77,74 @@ class AgentConnector:
                 }
             }
 
-            request = SendMessageRequest(
+            request = SendStreamingMessageRequest(
                 id = str(uuid4()),
                 params=MessageSendParams(
                     **send_message_payload
                 )
             )
 
-            response = await a2a_client.send_message(
-                request=request
-            )
-
-            response_data = response.model_dump(mode='json', exclude_none=True)
-
+            task_id = None
+            agent_response = "No response from agent"
             try:
-                agent_response = response_data['result']['status']['message']['parts'][0]['text']
-            except (KeyError, IndexError):
-                agent_response = "No response from agent"
+                async for response in self._a2a_client.send_message_streaming(request=request):
+                    if isinstance(response.root, JSONRPCErrorResponse):
+                        break
+
+                    event = response.root.result
+                    if isinstance(event, Task):
+                        task_id = event.id
+                    elif isinstance(event, TaskStatusUpdateEvent):
+                        task_id = event.taskId
+                        if event.status.message:
+                            agent_response = _text(event.status.message, agent_response)
+                    elif isinstance(event, Message):
+                        agent_response = _text(event, agent_response)
+                    elif isinstance(event, TaskArtifactUpdateEvent) and on_chunk is not None:
+                        chunk = "".join(p.root.text for p in event.artifact.parts if isinstance(p.root, TextPart))
+                        if chunk:
+                            on_chunk(event.artifact, chunk)
+            except asyncio.CancelledError:
+                if task_id is not None:
+                    await self._cancel_child(task_id)
+                raise
 
             return agent_response
+        finally:
+            self._in_flight -= 1
+            if self._in_flight == 0:
+                self._idle.set()
+
+    async def _cancel_child(self, task_id: str) -> None:
+        """
+        Best-effort tasks/cancel for a delegated task (never raises)
+        """
+        request = CancelTaskRequest(id=str(uuid4()), params=TaskIdParams(id=task_id))
+        try:
+            await asyncio.wait_for(self._a2a_client.cancel_task(request=request), self.cancel_timeout)
+        except Exception as e:
+            print(f"Failed to cancel task {task_id} on {self.agent_card.name}: {e}")
+
+    async def aclose(self) -> None:
+        """
+        Close the pooled HTTP client
+        """
+        await self._httpx_client.aclose()
+
+    async def aclose_when_idle(self) -> None:
+        """
+        Close the connector once no send_task call is in progress, so a
+        connector dropped while delegations are running lets them finish
+        """
+        await self._idle.wait()
+        await self.aclose()
+
+
+def _text(message: Message, default: str) -> str:
+    """
+    First text part of a message, or `default`
+    """
+    try:
+        return message.parts[0].root.text
+    except (IndexError, AttributeError):
+        return default
@@ -1,12 +1,36 @@
+import asyncio
 import json
 import os
+import time
 from a2a.types import (
     AgentCard
 )
 
-from a2a.client import A2ACardResolver, A2AClient
+from a2a.utils.constants import AGENT_CARD_WELL_KNOWN_PATH
 
 import httpx
+from pydantic import BaseModel
+
+
+class DiscoveryResult(BaseModel):
+    """
+    Outcome of resolving a single registry URL
+
+    Attributes:
+        url (str): Base URL from the registry.
+        card (AgentCard | None): The agent card, if it was retrieved.
+        error (str | None): Why the lookup failed, if it did.
+        elapsed (float): Seconds spent on this URL.
+    """
+    url: str
+    card: AgentCard | None = None
+    error: str | None = None
+    elapsed: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.card is not None
+
 
 class AgentDiscovery:
     """
@@ -14,19 +38,36 @@ class AgentDiscovery:
     querying each one's /.well-known/agent.json endpoint to retrieve
     an AgentCard
 
+    Agents are resolved concurrently, bounded by max_concurrency, and each
+    one gets its own deadline so a dead agent cannot stall the others.
+
     Attributes:
         registry_file (str): Path to the agent registry file.
         base_urls (List[str]): List of base URLs for A2A Agents.
+        timeout (float): Deadline in seconds for each agent card lookup.
+        max_concurrency (int): Maximum number of lookups in flight.
     """
 
-    def __init__(self, registry_file: str = None):
+    def __init__(
+        self,
+        registry_file: str = None,
+        timeout: float = 10.0,
+        max_concurrency: int = 10
+    ):
         """
         Initialise the AgentDiscovery
 
         Args:
             registry_file (str): Path to the agent registry file.
                 Defaults to 'utilities/a2a/agent_registry.json'.
+            timeout (float): Per-URL deadline in seconds.
+            max_concurrency (int): How many agents to query in parallel.
         """
+        self.timeout = timeout
+        self.max_concurrency = max_concurrency
+        # card url -> (ETag, Last-Modified, AgentCard) from the last full fetch,
+        # so later sweeps can send conditional requests
+        self._validators: dict[str, tuple[str | None, str | None, AgentCard]] = {}
 
         if registry_file:
             self.registry_file = registry_file
@@ -57,28 +98,89 @@ class AgentDiscovery:
             print(f"Error parsing registry file: {e}")
             return []
     
-    async def list_agent_cards(self) -> list[AgentCard]:
+    async def _resolve_card(
+        self,
+        httpx_client: httpx.AsyncClient,
+        semaphore: asyncio.Semaphore,
+        base_url: str
+    ) -> DiscoveryResult:
         """
-        Asynchronously fetches AgentCards from each 
-        base URL in the registry.
+        Resolve one AgentCard, reporting failures in the result instead of raising.
+        Repeat lookups are conditional (If-None-Match / If-Modified-Since) and
+        reuse the cached card on 304 Not Modified.
+        """
+        card_url = base_url.rstrip('/') + AGENT_CARD_WELL_KNOWN_PATH
+        headers = {}
+        cached = self._validators.get(card_url)
+        if cached:
+            if cached[0]:
+                headers['If-None-Match'] = cached[0]
+            if cached[1]:
+                headers['If-Modified-Since'] = cached[1]
 
-        Returns:
-            list[AgentCard]: List of AgentCards retrieved from the agents.
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                response = await asyncio.wait_for(
+                    httpx_client.get(card_url, headers=headers),
+                    timeout=self.timeout
+                )
+                if response.status_code == 304 and cached:
+                    card = cached[2]
+                else:
+                    response.raise_for_status()
+                    card = AgentCard.model_validate(response.json())
+                    etag = response.headers.get('ETag')
+                    last_modified = response.headers.get('Last-Modified')
+                    if etag or last_modified:
+                        self._validators[card_url] = (etag, last_modified, card)
+                    else:
+                        self._validators.pop(card_url, None)
 
+                return DiscoveryResult(
+                    url=base_url,
+                    card=card,
+                    elapsed=time.perf_counter() - started
+                )
+            except asyncio.TimeoutError:
+                error = f"timed out after {self.timeout}s"
+            except Exception as e:
+                error = str(e) or type(e).__name__
+
+            print(f"Failed to discover agent at {base_url}: {error}")
+            return DiscoveryResult(
+                url=base_url,
+                error=error,
+                elapsed=time.perf_counter() - started
+            )
 
+    async def discover(self) -> list[DiscoveryResult]:
         """
-        cards: list[AgentCard] = []
+        Concurrently resolves the AgentCard of every base URL in the registry.
 
-        async with httpx.AsyncClient(timeout=300.0) as httpx_client:
+        Returns:
+            list[DiscoveryResult]: One result per registry URL, in registry order.
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        limits = httpx.Limits(max_connections=self.max_concurrency)
 
-            for base_url in self.base_urls:
-                resolver = A2ACardResolver(
-                    base_url=base_url.rstrip('/'),
-                    httpx_client=httpx_client
-                )
+        async with httpx.AsyncClient(timeout=self.timeout, limits=limits) as httpx_client:
+            results = await asyncio.gather(*(
+                self._resolve_card(httpx_client, semaphore, base_url)
+                for base_url in self.base_urls
+            ))
 
-                card = await resolver.get_agent_card()
+        return list(results)
 
-                cards.append(card)
-        
-        return cards
\ No newline at end of file
+    async def list_agent_cards(self) -> list[AgentCard]:
+        """
+        Asynchronously fetches AgentCards from each 
+        base URL in the registry.
+
+        Agents that fail or time out are skipped; use discover()
+        to see the per-agent status.
+
+        Returns:
+            list[AgentCard]: List of AgentCards retrieved from the agents.
+        """
+        return [result.card for result in await self.discover() if result.ok]
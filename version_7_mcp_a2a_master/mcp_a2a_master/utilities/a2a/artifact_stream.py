@@ -0,0 +1,54 @@
+from uuid import uuid4
+
+from a2a.server.tasks import TaskUpdater
+from a2a.types import Part, TextPart
+
+
+class ArtifactStreams:
+    """
+    Publishes streamed text as artifact chunks, one artifact per stretch of text
+
+    Each source (the agent's own model turn, or a child agent whose answer
+    is passed on) streams into its own open artifact. close() ends all open
+    artifacts; executors call it on every non-text update, i.e. at the end
+    of each model turn, so text written before a tool call never ends up in
+    the artifact that carries the final answer.
+
+    Attributes:
+        updater (TaskUpdater): Publishes the artifact updates for the task
+    """
+
+    def __init__(self, updater: TaskUpdater):
+        self.updater = updater
+        # source -> (artifact id, artifact name) of its open artifact
+        self._open: dict[str, tuple[str, str]] = {}
+
+    async def add(self, text: str, source: str = "", name: str = "response") -> None:
+        """
+        Append `text` to the open artifact of `source`, starting one if needed
+        """
+        append = source in self._open
+        if not append:
+            self._open[source] = (str(uuid4()), name)
+        artifact_id, name = self._open[source]
+        await self.updater.add_artifact(
+            [Part(root=TextPart(text=text))],
+            artifact_id=artifact_id,
+            name=name,
+            append=append,
+            last_chunk=False,
+        )
+
+    async def close(self) -> None:
+        """
+        End every open artifact with an empty last chunk
+        """
+        for artifact_id, name in self._open.values():
+            await self.updater.add_artifact(
+                [Part(root=TextPart(text=''))],
+                artifact_id=artifact_id,
+                name=name,
+                append=True,
+                last_chunk=True,
+            )
+        self._open.clear()
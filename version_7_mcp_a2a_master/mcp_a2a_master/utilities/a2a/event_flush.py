@@ -0,0 +1,27 @@
+import asyncio
+
+from a2a.server.events import EventQueue
+
+
+async def flush_events(event_queue: EventQueue, timeout: float = 5.0) -> bool:
+    """
+    Wait until every event enqueued so far has been consumed
+
+    The request handler's consumer calls task_done() for each event it takes
+    off the queue, so joining the queue is an explicit ack: it returns as
+    soon as the final status update has been picked up, instead of after a
+    fixed sleep.
+
+    Args:
+        event_queue (EventQueue): The queue the executor publishes to
+        timeout (float): Upper bound in case nobody consumes (e.g. the client went away)
+
+    Returns:
+        bool: True if the queue was drained, False on timeout
+    """
+    try:
+        await asyncio.wait_for(event_queue.queue.join(), timeout)
+        return True
+    except asyncio.TimeoutError:
+        print(f"Events were not consumed within {timeout}s")
+        return False
@@ -0,0 +1,70 @@
+from a2a.server.agent_execution import RequestContext
+from a2a.server.events import EventQueue
+from a2a.server.tasks import TaskUpdater
+from a2a.types import TaskNotCancelableError, TaskState
+from a2a.utils import new_agent_text_message
+from a2a.utils.errors import ServerError
+
+# Tasks in these states are finished and can't be canceled any more
+TERMINAL_STATES = {TaskState.completed, TaskState.canceled, TaskState.failed, TaskState.rejected}
+
+
+class CancelTracker:
+    """
+    Which of an executor's running tasks were stopped by cancel_task()
+
+    execute() calls start() / finish() around its run, so a task is only
+    tracked while it runs: a cancel of a task that isn't running (e.g.
+    input-required) leaves nothing behind, and a later run of the same
+    task id starts clean.
+    """
+
+    def __init__(self):
+        self._running: set[str] = set()
+        self._canceled: set[str] = set()
+
+    def start(self, task_id: str) -> None:
+        self._running.add(task_id)
+
+    def finish(self, task_id: str) -> None:
+        self._running.discard(task_id)
+        self._canceled.discard(task_id)
+
+    def mark_canceled(self, task_id: str) -> None:
+        if task_id in self._running:
+            self._canceled.add(task_id)
+
+    def stopped_by_cancel(self, task_id: str) -> bool:
+        """
+        True if cancel_task() already published "canceled" for this run
+
+        For execute()'s CancelledError handler: the run then just returns, so
+        the request handler can close the task's stream (it awaits the run, and
+        a CancelledError escaping from it fails the request). Any other
+        cancellation, e.g. at shutdown, should be re-raised.
+        """
+        return task_id in self._canceled
+
+
+async def cancel_task(
+    request: RequestContext, event_queue: EventQueue, tracker: CancelTracker
+) -> None:
+    """
+    Shared AgentExecutor.cancel(): publishes the final "canceled" status
+
+    The request handler then cancels the asyncio task running execute():
+    the CancelledError stops the agent run and any in-flight AgentConnector
+    call, which cancels the child agent's task as well.
+
+    Raises:
+        ServerError: TaskNotCancelableError if the task already finished
+    """
+    task = request.current_task
+    if task.status.state in TERMINAL_STATES:
+        raise ServerError(error=TaskNotCancelableError())
+
+    updater = TaskUpdater(event_queue, task.id, task.contextId)
+    await updater.cancel(
+        new_agent_text_message("Task canceled", task.contextId, task.id)
+    )
+    tracker.mark_canceled(task.id)
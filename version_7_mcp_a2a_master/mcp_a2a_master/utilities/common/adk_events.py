@@ -0,0 +1,16 @@
+from typing import Any
+
+
+def event_text(event: Any) -> str:
+    """
+    Text of an ADK event's parts, without the model's thoughts
+
+    Args:
+        event: An event yielded by the ADK Runner (partial or not)
+
+    Returns:
+        str: The joined text parts, or "" if the event has none
+    """
+    if not event.content or not event.content.parts:
+        return ""
+    return "".join(part.text for part in event.content.parts if part.text and not part.thought)